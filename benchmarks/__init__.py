@@ -0,0 +1,3 @@
+# SPDX-FileCopyrightText: 2025-present
+#
+# SPDX-License-Identifier: MIT
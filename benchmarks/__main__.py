@@ -0,0 +1,94 @@
+"""
+Runs the benchmark suite of every public `et` helper.
+
+Run:
+    python -m benchmarks                            # print results
+    python -m benchmarks --json baseline.json       # save results
+    python -m benchmarks --compare baseline.json    # fail on regressions
+    python -m benchmarks --filter nget --repeat 3   # run some cases only
+"""
+
+import argparse
+import json
+import platform
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from benchmarks._timing import per_call_ns, report
+from benchmarks.suite import CASES
+
+DEFAULT_THRESHOLD = 0.2
+
+
+def run(pattern: str, repeat: int) -> Dict[str, float]:
+    """Measures the cost of every case matching `pattern` in nanoseconds per call."""
+    return {
+        name: per_call_ns(case, repeat=repeat)
+        for name, case in CASES.items()
+        if pattern in name
+    }
+
+
+def compare(
+    results: Dict[str, float], baseline: Dict[str, float], threshold: float
+) -> List[str]:
+    """Prints results relative to the baseline. Returns names of regressed cases."""
+    regressions = []
+    print("comparison with the baseline")  # noqa: T201
+    for name, ns in results.items():
+        base_ns = baseline.get(name)
+        if base_ns is None:
+            print(f"  {name:<45} {ns:>12.1f} ns/call  (new)")  # noqa: T201
+            continue
+
+        ratio = ns / base_ns
+        regressed = ratio > 1 + threshold
+        if regressed:
+            regressions.append(name)
+        mark = "  REGRESSION" if regressed else ""
+        print(f"  {name:<45} {ns:>12.1f} ns/call  x{ratio:.2f}{mark}")  # noqa: T201
+
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("--filter", default="", help="run cases containing this text")
+    parser.add_argument("--repeat", type=int, default=5, help="best of N runs per case")
+    parser.add_argument("--json", type=Path, help="save results to a JSON file")
+    parser.add_argument("--compare", type=Path, help="compare with a saved JSON file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"allowed slowdown vs the baseline, default {DEFAULT_THRESHOLD} (20%%)",
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.filter, args.repeat)
+    report("et benchmarks", results.items())
+
+    if args.json:
+        document: Dict[str, Any] = {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "unit": "ns/call",
+            "results": results,
+        }
+        args.json.write_text(json.dumps(document, indent=2) + "\n")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            msg = f"{len(regressions)} regression(s): {', '.join(regressions)}"
+            print(msg)  # noqa: T201
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,17 @@
+import timeit
+from typing import Callable, Iterable, Tuple
+
+
+def per_call_ns(func: Callable[[], object], repeat: int = 5) -> float:
+    """Returns the best-of-`repeat` cost of a single `func()` call in nanoseconds."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return best / number * 1e9
+
+
+def report(title: str, rows: Iterable[Tuple[str, float]], unit: str = "ns/call") -> None:
+    """Prints benchmark results as a simple table."""
+    print(title)  # noqa: T201
+    for name, value in rows:
+        print(f"  {name:<45} {value:>12.1f} {unit}")  # noqa: T201
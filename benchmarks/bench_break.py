@@ -0,0 +1,58 @@
+"""
+Raise/catch throughput of `Break` with DEBUG logging disabled:
+the previous `catch_a_break` vs the current one with `Break(reason)` and `Break.of`.
+
+Run: python -m benchmarks.bench_break
+"""
+
+import logging
+from functools import wraps
+from typing import Any, Callable
+
+from benchmarks._timing import per_call_ns, report
+from et import Break, catch_a_break
+
+log = logging.getLogger("et.service")
+
+
+def previous_catch_a_break(func: Callable[..., Any]) -> Callable[..., Any]:
+    """`catch_a_break` before lazy logging: formats the reason eagerly."""
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return func(*args, **kwargs)
+        except Break as e:
+            reason = str(e) or "Reason not provided"
+            log.debug("Break svc operation. Reason: '%s'", reason)
+            return None
+
+    return wrapper
+
+
+def raise_new() -> None:
+    msg = "No user"
+    raise Break(msg)
+
+
+def raise_of() -> None:
+    msg = "No user"
+    raise Break.of(msg)
+
+
+def main() -> None:
+    report(
+        "raise and catch a Break, DEBUG disabled",
+        [
+            (
+                "previous catch_a_break, Break(reason)",
+                per_call_ns(previous_catch_a_break(raise_new)),
+            ),
+            ("catch_a_break, Break(reason)", per_call_ns(catch_a_break(raise_new))),
+            ("catch_a_break, Break.of(reason)", per_call_ns(catch_a_break(raise_of))),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
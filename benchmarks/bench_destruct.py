@@ -0,0 +1,76 @@
+"""
+Cost of `destruct` with inferred keys: cold (first call from a line) vs warm calls,
+and of compiled extractors (`destruct.compile`) vs explicit keys.
+
+Run: python -m benchmarks.bench_destruct
+"""
+
+from typing import Any, Tuple
+
+from benchmarks._timing import per_call_ns, report
+from et import destruct
+
+PERSON = {"name": "John", "age": 30, "city": "New York"}
+
+
+def inferred() -> Tuple[Any, ...]:
+    name, age, city = destruct(PERSON)
+    return name, age, city
+
+
+def inferred_cold() -> Tuple[Any, ...]:
+    destruct.clear_cache()
+    name, age, city = destruct(PERSON)
+    return name, age, city
+
+
+def explicit_keys() -> Tuple[Any, ...]:
+    name, age, city = destruct(PERSON, keys=["name", "age", "city"])
+    return name, age, city
+
+
+KEYS = ["name", "age", "city"]
+PEOPLE = [{"name": f"user-{i}", "age": i, "city": "Kyiv"} for i in range(1000)]
+
+
+def main() -> None:
+    person = destruct.compile(KEYS)
+    person_with_default = destruct.compile([*KEYS, "country"], default="N/A")
+
+    report(
+        "destruct",
+        [
+            ("inferred keys, cold call site", per_call_ns(inferred_cold)),
+            ("inferred keys, warm call site", per_call_ns(inferred)),
+            ("explicit keys", per_call_ns(explicit_keys)),
+            ("compiled", per_call_ns(lambda: person(PERSON))),
+        ],
+    )
+    report(
+        f"destruct over {len(PEOPLE)} dicts",
+        [
+            (
+                "destruct, explicit keys",
+                per_call_ns(lambda: [destruct(p, keys=KEYS) for p in PEOPLE]),
+            ),
+            ("compiled, per dict", per_call_ns(lambda: [person(p) for p in PEOPLE])),
+            ("compiled, many", per_call_ns(lambda: person.many(PEOPLE))),
+            (
+                "destruct, explicit keys and default",
+                per_call_ns(
+                    lambda: [
+                        destruct(p, keys=[*KEYS, "country"], default="N/A")
+                        for p in PEOPLE
+                    ]
+                ),
+            ),
+            (
+                "compiled with default, many",
+                per_call_ns(lambda: person_with_default.many(PEOPLE)),
+            ),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
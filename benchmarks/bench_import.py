@@ -0,0 +1,72 @@
+"""
+Import time of the `et` package, measured with `python -X importtime` in new interpreters.
+
+Every module a statement imports counts, including standard library dependencies
+that `-X importtime` lists as separate top-level entries, e.g. `re` or `typing`
+imported by `et.nget`. The cost of starting an interpreter (`python -c pass`)
+is subtracted.
+
+Run: python -m benchmarks.bench_import
+"""
+
+import re
+import subprocess
+import sys
+from typing import List, Tuple
+
+from benchmarks._timing import report
+
+REPEAT = 5
+STATEMENTS = (
+    "import et",
+    "from et import nget",
+    "from et import destruct",
+    "from et import service",
+    "from et import utc_now",
+    "from et import *",
+)
+
+# import time: self [us] | cumulative | imported package
+_IMPORTTIME_RE = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \| (\S+)$")
+
+
+def import_us(statement: str) -> float:
+    """Returns the best-of-`REPEAT` import time of `statement` in microseconds."""
+    return _best_total_us(statement) - _best_total_us("pass")
+
+
+def _best_total_us(statement: str) -> int:
+    """Returns the best-of-`REPEAT` time of all imports of an interpreter running it."""
+    best = sys.maxsize
+    for _ in range(REPEAT):
+        stderr = subprocess.run(  # noqa: S603
+            [sys.executable, "-X", "importtime", "-c", statement],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stderr
+        best = min(best, _total_us(stderr))
+
+    return best
+
+
+def _total_us(importtime: str) -> int:
+    """Sums cumulative times of top-level imports, nested ones are included in them."""
+    total = 0
+    for line in importtime.splitlines():
+        match = _IMPORTTIME_RE.match(line)  # indented names don't match
+        if match:
+            total += int(match.group(1))
+
+    return total
+
+
+def main() -> None:
+    rows: List[Tuple[str, float]] = [
+        (statement, import_us(statement)) for statement in STATEMENTS
+    ]
+    report("import time, cumulative", rows, unit="us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Per-call cost of reading a few fields of a large encoded response:
+`json.loads` of the whole response compared to `LazyJSON`.
+
+Run: python -m benchmarks.bench_lazy_json
+"""
+
+import json
+
+from benchmarks._timing import per_call_ns, report
+from benchmarks.payloads import DEEP_PATH, LARGE_RESPONSE_JSON, LARGE_RESPONSE_LAST_PATH
+from et import LazyJSON, nget, nget_many
+
+FIELDS = [DEEP_PATH, "data.viewer.login", "extensions.cost.remaining"]
+
+
+def main() -> None:
+    doc = LazyJSON(LARGE_RESPONSE_JSON)
+    size = f"{len(LARGE_RESPONSE_JSON) // 1024} KiB"
+    report(
+        f"{len(FIELDS)} fields before the bulk of a {size} response",
+        [
+            (
+                "nget_many(json.loads(data), paths)",
+                per_call_ns(lambda: nget_many(json.loads(LARGE_RESPONSE_JSON), FIELDS)),
+            ),
+            (
+                "nget_many(LazyJSON(data), paths)",
+                per_call_ns(lambda: nget_many(LazyJSON(LARGE_RESPONSE_JSON), FIELDS)),
+            ),
+            (
+                "nget_many(doc, paths), repeated",
+                per_call_ns(lambda: nget_many(doc, FIELDS)),
+            ),
+        ],
+    )
+    report(
+        f"{LARGE_RESPONSE_LAST_PATH} (after the bulk)",
+        [
+            (
+                "nget(json.loads(data), path)",
+                per_call_ns(
+                    lambda: nget(
+                        json.loads(LARGE_RESPONSE_JSON), LARGE_RESPONSE_LAST_PATH
+                    )
+                ),
+            ),
+            (
+                "nget(LazyJSON(data), path)",
+                per_call_ns(
+                    lambda: nget(LazyJSON(LARGE_RESPONSE_JSON), LARGE_RESPONSE_LAST_PATH)
+                ),
+            ),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
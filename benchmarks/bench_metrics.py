@@ -0,0 +1,41 @@
+"""
+Overhead of `et.metrics` instrumentation on service construction and method calls.
+
+Run: python -m benchmarks.bench_metrics
+"""
+
+from benchmarks._timing import per_call_ns, report
+from et import metrics, service
+
+
+@service
+class PlanSvc:
+    plan_id: int
+
+    def run(self) -> int:
+        return self.plan_id
+
+
+def construct_and_run() -> int:
+    return PlanSvc(plan_id=1).run()
+
+
+def main() -> None:
+    disabled = per_call_ns(construct_and_run)
+    metrics.enable()
+    try:
+        enabled = per_call_ns(construct_and_run)
+    finally:
+        metrics.disable()
+
+    report(
+        "construct a service and call run()",
+        [
+            ("metrics disabled", disabled),
+            ("metrics enabled, Registry sink", enabled),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Per-call cost of `nget` before and after path caching.
+
+Run: python -m benchmarks.bench_nget
+"""
+
+from typing import Any, List
+
+from benchmarks._timing import per_call_ns, report
+from et import nget, nget_many
+
+DATA = {"result": {"users": [{"address": {"street": "Main St"}}]}}
+PATH = "result.users.0.address.street"
+
+RECORD = {
+    "result": {
+        "users": [
+            {
+                "id": 1,
+                "name": "Ivan",
+                "email": "ivan@example.com",
+                "address": {"street": "Main St", "city": "Kyiv", "zip": "01001"},
+                "company": {"name": "Ether", "address": {"city": "Lviv"}},
+            }
+        ],
+        "meta": {"page": 1, "total": 1},
+    }
+}
+FIELDS = {
+    "id": "result.users.0.id",
+    "name": "result.users.0.name",
+    "email": "result.users.0.email",
+    "street": "result.users.0.address.street",
+    "city": "result.users.0.address.city",
+    "zip": "result.users.0.address.zip",
+    "country": "result.users.0.address.country",
+    "company": "result.users.0.company.name",
+    "company_city": "result.users.0.company.address.city",
+    "page": "result.meta.page",
+    "total": "result.meta.total",
+}
+
+
+def nget_uncached(dct: Any, *items: Any, default: Any = None) -> Any:
+    """`nget` as it was before compiled paths: parses every dotted path on each call."""
+    keys: List[Any] = []
+    for item in items:
+        if isinstance(item, str) and "." in item:
+            keys.extend(int(part) if part.isdigit() else part for part in item.split("."))
+        else:
+            keys.append(item)
+
+    try:
+        for key in keys:
+            dct = dct[key]
+    except (KeyError, IndexError, TypeError):
+        return default
+
+    return dct
+
+
+def main() -> None:
+    compiled = nget.compile(PATH)
+    many = nget_many.compile(FIELDS)
+    report(
+        "nget",
+        [
+            (
+                "before: dotted path, parsed per call",
+                per_call_ns(lambda: nget_uncached(DATA, PATH)),
+            ),
+            (
+                "before: separate keys",
+                per_call_ns(
+                    lambda: nget_uncached(DATA, "result", "users", 0, "address", "street")
+                ),
+            ),
+            ("after: dotted path, cached parse", per_call_ns(lambda: nget(DATA, PATH))),
+            (
+                "after: separate keys",
+                per_call_ns(
+                    lambda: nget(DATA, "result", "users", 0, "address", "street")
+                ),
+            ),
+            ("after: nget(data, compiled)", per_call_ns(lambda: nget(DATA, compiled))),
+            ("after: compiled.get(data)", per_call_ns(lambda: compiled.get(DATA))),
+        ],
+    )
+    report(
+        f"nget_many, {len(FIELDS)} fields",
+        [
+            (
+                "nget per field",
+                per_call_ns(lambda: {k: nget(RECORD, p) for k, p in FIELDS.items()}),
+            ),
+            ("nget_many", per_call_ns(lambda: nget_many(RECORD, FIELDS))),
+            ("nget_many, compiled", per_call_ns(lambda: nget_many(RECORD, many))),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Extracting one column from a collection of records: `nget` in a loop vs `nget_column`.
+
+Run: python -m benchmarks.bench_nget_column
+"""
+
+from benchmarks._timing import per_call_ns, report
+from et import nget, nget_column
+
+SIZE = 100_000
+PATH = "result.user.address.zip"
+
+RECORDS = [
+    {"result": {"user": {"id": i, "address": {"zip": i % 1000, "city": "Kyiv"}}}}
+    for i in range(SIZE)
+]
+# every 100th record misses the field
+SPARSE_RECORDS = [
+    record if i % 100 else {"result": {"user": None}} for i, record in enumerate(RECORDS)
+]
+
+
+def main() -> None:
+    for title, records in (("all found", RECORDS), ("1% missing", SPARSE_RECORDS)):
+        report(
+            f"nget_column, {SIZE} records, {title}, cost per record",
+            [
+                (
+                    "nget per record",
+                    per_call_ns(lambda r=records: [nget(record, PATH) for record in r])
+                    / SIZE,
+                ),
+                (
+                    "nget_column",
+                    per_call_ns(lambda r=records: nget_column(r, PATH)) / SIZE,
+                ),
+                (
+                    "nget_column, array('q')",
+                    per_call_ns(
+                        lambda r=records: nget_column(r, PATH, default=0, dtype="q")
+                    )
+                    / SIZE,
+                ),
+            ],
+        )
+
+    try:
+        import numpy  # noqa: F401, PLC0415, ICN001
+    except ImportError:
+        return
+
+    report(
+        f"nget_column, {SIZE} records, masked NumPy array, cost per record",
+        [
+            (
+                "nget_column, masked",
+                per_call_ns(
+                    lambda: nget_column(SPARSE_RECORDS, PATH, dtype="int64", masked=True)
+                )
+                / SIZE,
+            ),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Peak memory and time of `nget_stream` vs `json.load` + `nget` over a large JSON file.
+
+Run: python -m benchmarks.bench_nget_stream
+"""
+
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+from et import nget, nget_stream
+
+SIZE = 200_000
+
+
+def write_export(path: Path) -> None:
+    with path.open("w") as file:
+        file.write('{"meta": {"total": %d}, "result": {"users": [' % SIZE)  # noqa: UP031
+        for i in range(SIZE):
+            if i:
+                file.write(",")
+            user = {"id": i, "name": f"user-{i}", "address": {"city": "Kyiv", "zip": i}}
+            file.write(json.dumps(user))
+        file.write("]}}")
+
+
+def measure(func: Callable[[], int]) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(  # noqa: T201
+        f"  {func.__name__:<30} {result} values, "
+        f"{elapsed:.2f} s, peak memory {peak / 2**20:.1f} MiB"
+    )
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "export.json"
+        write_export(path)
+        print(f"nget_stream, {path.stat().st_size / 2**20:.1f} MiB file")  # noqa: T201
+
+        def json_load() -> int:
+            with path.open() as file:
+                data = json.load(file)
+            return sum(
+                1 for user in nget(data, "result.users") if nget(user, "address.zip")
+            )
+
+        def stream() -> int:
+            return sum(
+                1
+                for zip_code in nget_stream(path, "result.users.*.address.zip")
+                if zip_code
+            )
+
+        measure(json_load)
+        measure(stream)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Cost of updating one and several leaves of a large document with `nset`/`nupdate`
+compared to `copy.deepcopy` followed by in-place assignment.
+
+Run: python -m benchmarks.bench_nset
+"""
+
+from copy import deepcopy
+from typing import Any, Dict
+
+from benchmarks._timing import per_call_ns, report
+from benchmarks.payloads import DEEP_PATH, api_response
+from et import nset, nupdate
+
+# an event with a large payload next to the enriched field
+EVENT: Dict[str, Any] = {
+    "response": api_response(1),
+    "history": [api_response(i) for i in range(50)],
+}
+PATH = f"response.{DEEP_PATH}"
+UPDATES = {
+    PATH: 0.0,
+    "response.data.viewer.login": "user",
+    "response.extensions.cost": {},
+}
+
+
+def deepcopy_set() -> Dict[str, Any]:
+    event = deepcopy(EVENT)
+    event["response"]["data"]["viewer"]["profile"]["address"]["geo"]["lat"] = 0.0
+    return event
+
+
+def deepcopy_update() -> Dict[str, Any]:
+    event = deepcopy(EVENT)
+    event["response"]["data"]["viewer"]["profile"]["address"]["geo"]["lat"] = 0.0
+    event["response"]["data"]["viewer"]["login"] = "user"
+    event["response"]["extensions"]["cost"] = {}
+    return event
+
+
+def main() -> None:
+    report(
+        "set one leaf",
+        [
+            ("deepcopy + assignment", per_call_ns(deepcopy_set)),
+            ("nset", per_call_ns(lambda: nset(EVENT, PATH, 0.0))),
+        ],
+    )
+    report(
+        f"set {len(UPDATES)} leaves",
+        [
+            ("deepcopy + assignments", per_call_ns(deepcopy_update)),
+            ("nset per path", per_call_ns(lambda: _nset_each(EVENT))),
+            ("nupdate", per_call_ns(lambda: nupdate(EVENT, UPDATES))),
+        ],
+    )
+
+
+def _nset_each(event: Dict[str, Any]) -> Dict[str, Any]:
+    for path, value in UPDATES.items():
+        event = nset(event, path, value)
+    return event
+
+
+if __name__ == "__main__":
+    main()
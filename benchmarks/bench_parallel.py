@@ -0,0 +1,37 @@
+"""
+Throughput of `extract` over NDJSON lines with 1, 2, 4, ... worker processes,
+up to the number of cores. Lines are decoded in the workers.
+
+Run: python -m benchmarks.bench_parallel
+"""
+
+import json
+import os
+import time
+from typing import List
+
+from benchmarks.payloads import DEEP_FIELDS, api_response
+from et.parallel import extract
+
+SIZE = 200_000
+
+
+def main() -> None:
+    lines: List[bytes] = [json.dumps(api_response(i)).encode() for i in range(SIZE)]
+    cores = os.cpu_count() or 1
+    counts = sorted({1, *(2**power for power in range(cores.bit_length())), cores})
+    title = f"extract, {len(DEEP_FIELDS)} fields from {SIZE} lines, {cores} cores"
+    print(title)  # noqa: T201
+    for workers in counts:
+        start = time.perf_counter()
+        results = extract(lines, DEEP_FIELDS, workers=workers, loads=json.loads)
+        for _ in results:
+            pass
+        elapsed = time.perf_counter() - start
+        print(  # noqa: T201
+            f"  workers={workers:<3} {elapsed:6.2f} s, {SIZE / elapsed:>10.0f} records/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Per-call cost of schema accessors compared to `nget` with a compiled path.
+
+Run: python -m benchmarks.bench_schema
+"""
+
+from benchmarks._timing import per_call_ns, report
+from benchmarks.payloads import DEEP, DEEP_MISSING_PATH, DEEP_PATH
+from et import Schema, nget
+
+SCHEMA = Schema.from_sample(DEEP)
+
+
+def main() -> None:
+    compiled = nget.compile(DEEP_PATH)
+    compiled_missing = nget.compile(DEEP_MISSING_PATH)
+    accessor = SCHEMA.accessor(DEEP_PATH)
+    accessor_missing = SCHEMA.accessor(DEEP_MISSING_PATH)
+    report(
+        f"{DEEP_PATH}",
+        [
+            ("nget(data, path)", per_call_ns(lambda: nget(DEEP, DEEP_PATH))),
+            ("compiled.get(data)", per_call_ns(lambda: compiled.get(DEEP))),
+            ("schema accessor(data)", per_call_ns(lambda: accessor(DEEP))),
+        ],
+    )
+    report(
+        f"{DEEP_MISSING_PATH} (missing)",
+        [
+            ("nget(data, path)", per_call_ns(lambda: nget(DEEP, DEEP_MISSING_PATH))),
+            ("compiled.get(data)", per_call_ns(lambda: compiled_missing.get(DEEP))),
+            ("schema accessor(data)", per_call_ns(lambda: accessor_missing(DEEP))),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
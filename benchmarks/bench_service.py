@@ -0,0 +1,199 @@
+"""
+Memory and construction cost of `@service` instances: default vs `slots=True`,
+construction with DEBUG logging disabled vs a plain dataclass,
+DEBUG logging vs `et.trace` of large init arguments,
+a lookup service with and without `cache`, and construction vs `pool` reuse.
+
+Run: python -m benchmarks.bench_service
+"""
+
+import io
+import logging
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, List
+
+from benchmarks._timing import per_call_ns, report
+from benchmarks.payloads import api_response
+from et import ServiceCache, service, trace
+
+INSTANCES = 10_000
+
+
+@service
+class PlanSvc:
+    plan_id: int
+    user_id: int
+    dry_run: bool = False
+
+
+@dataclass
+class PlanDataclass:
+    plan_id: int
+    user_id: int
+    dry_run: bool = False
+
+
+@service(slots=True)
+class SlottedPlanSvc:
+    plan_id: int
+    user_id: int
+    dry_run: bool = False
+
+
+@service(slots=True, frozen=True)
+class FrozenPlanSvc:
+    plan_id: int
+    user_id: int
+    dry_run: bool = False
+
+
+@service(pool=4)
+class PooledPlanSvc:
+    plan_id: int
+    user_id: int
+    dry_run: bool = False
+
+
+def acquire_pooled(plan_id: int, user_id: int) -> PooledPlanSvc:
+    """Handles a message with a pooled instance, returns the instance used."""
+    with PooledPlanSvc.acquire(plan_id, user_id) as svc:
+        return svc
+
+
+def lookup(plan_id: int) -> List[int]:
+    """A pure lookup worth caching."""
+    return sorted((plan_id * i) % 97 for i in range(100))
+
+
+@service
+class LookupSvc:
+    plan_id: int
+
+    def run(self) -> List[int]:
+        return lookup(self.plan_id)
+
+
+@service(cache=ServiceCache(maxsize=100, ttl=60))
+class CachedLookupSvc:
+    plan_id: int
+
+    def run(self) -> List[int]:
+        return lookup(self.plan_id)
+
+
+def bytes_per_instance(factory: Callable[..., Any]) -> float:
+    """Returns memory allocated per instance, measured with tracemalloc."""
+    instances: List[Any] = []
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        instances.extend(factory(i, i) for i in range(INSTANCES))
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    return (after - before) / INSTANCES
+
+
+def main() -> None:
+    classes = (
+        ("default", PlanSvc),
+        ("slots=True", SlottedPlanSvc),
+        ("slots=True, frozen=True", FrozenPlanSvc),
+    )
+    report(
+        "@service, memory per instance",
+        [(title, bytes_per_instance(cls)) for title, cls in classes],
+        unit="bytes",
+    )
+    report(
+        "@service, construction",
+        [(title, per_call_ns(lambda c=cls: c(1, 2))) for title, cls in classes],
+    )
+
+    logger = logging.getLogger("et.service")
+    level = logger.level
+    try:
+        logger.setLevel(logging.DEBUG)
+        debug_on = per_call_ns(lambda: PlanSvc(1, 2))
+    finally:
+        logger.setLevel(level)
+    report(
+        "@service, init logging",
+        [
+            ("plain dataclass", per_call_ns(lambda: PlanDataclass(1, 2))),
+            ("@service, DEBUG disabled", per_call_ns(lambda: PlanSvc(1, 2))),
+            ("@service, DEBUG enabled", debug_on),
+        ],
+    )
+
+    # a handler that formats records, as in production, but writes nowhere
+    response = api_response(1)
+    handler = logging.StreamHandler(io.StringIO())
+    try:
+        logger.addHandler(handler)
+        logger.setLevel(logging.DEBUG)
+        logged = per_call_ns(lambda: PlanSvc(response, 2))
+    finally:
+        logger.setLevel(level)
+        logger.removeHandler(handler)
+    buffer = trace.enable(size=10_000)
+    try:
+        traced = per_call_ns(lambda: PlanSvc(response, 2))
+        dumped = per_call_ns(lambda: buffer.dump(trace.ERROR_DUMP_ENTRIES), repeat=1)
+    finally:
+        trace.disable()
+    report(
+        "@service, construction with an API response argument",
+        [
+            ("no logging", per_call_ns(lambda: PlanSvc(response, 2))),
+            ("DEBUG logging to a handler", logged),
+            ("trace.enable(size=10_000)", traced),
+        ],
+    )
+    report(
+        f"trace, dump of the latest {trace.ERROR_DUMP_ENTRIES} entries (on errors)",
+        [("buffer.dump(limit)", dumped)],
+    )
+
+    def run_many(cls: Any) -> None:
+        for plan_id in range(1000):
+            cls(plan_id % 100).run()
+
+    report(
+        "@service, 1000 lookups of 100 plans",
+        [
+            ("no cache", per_call_ns(lambda: run_many(LookupSvc))),
+            (
+                "cache=ServiceCache(ttl=60)",
+                per_call_ns(lambda: run_many(CachedLookupSvc)),
+            ),
+        ],
+    )
+    info = CachedLookupSvc.run.cache_info()
+    print(f"  {info}")  # noqa: T201
+
+    # instances are kept alive, so each allocation is counted once
+    report(
+        "@service, memory allocated per message",
+        [
+            ("PlanSvc(...)", bytes_per_instance(PlanSvc)),
+            ("PooledPlanSvc.acquire(...)", bytes_per_instance(acquire_pooled)),
+        ],
+        unit="bytes",
+    )
+    report(
+        "@service, per message",
+        [
+            ("PlanSvc(...)", per_call_ns(lambda: PlanSvc(1, 2))),
+            (
+                "with PooledPlanSvc.acquire(...)",
+                per_call_ns(lambda: acquire_pooled(1, 2)),
+            ),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
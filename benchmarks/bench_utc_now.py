@@ -0,0 +1,49 @@
+"""
+Cost of `utc_now()`: reading the system clock on every call vs the coarse clock,
+and of epoch/ISO timestamps: converting `utc_now()` vs the `utc_now_ns` family.
+
+Run: python -m benchmarks.bench_utc_now
+"""
+
+from datetime import datetime, timezone
+
+from benchmarks._timing import per_call_ns, report
+from et import utc_now, utc_now_iso, utc_now_ns, utc_stamps
+
+BATCH = 100
+
+
+def main() -> None:
+    rows = [
+        ("datetime.now(timezone.utc)", per_call_ns(lambda: datetime.now(timezone.utc))),
+        ("utc_now()", per_call_ns(utc_now)),
+    ]
+    try:
+        for title, seconds in (("1 ms", 0.001), ("10 ms", 0.01)):
+            utc_now.set_resolution(seconds)
+            rows.append((f"utc_now(), coarse clock, {title}", per_call_ns(utc_now)))
+    finally:
+        utc_now.set_resolution(0)
+
+    report("utc_now", rows)
+    report(
+        "timestamps",
+        [
+            (
+                "utc_now().timestamp() in ns",
+                per_call_ns(lambda: int(utc_now().timestamp() * 1e9)),
+            ),
+            ("utc_now_ns()", per_call_ns(utc_now_ns)),
+            ("utc_now().isoformat()", per_call_ns(lambda: utc_now().isoformat())),
+            ("utc_now_iso()", per_call_ns(utc_now_iso)),
+            (
+                f"{BATCH} x utc_now_ns()",
+                per_call_ns(lambda: [utc_now_ns() for _ in range(BATCH)]),
+            ),
+            (f"utc_stamps({BATCH})", per_call_ns(lambda: list(utc_stamps(BATCH)))),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
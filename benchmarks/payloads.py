@@ -0,0 +1,64 @@
+"""Realistic payloads shared by the benchmark suite."""
+
+import json
+from typing import Any, Dict, List
+
+
+def api_response(user_id: int) -> Dict[str, Any]:
+    """A deep JSON API response, as returned by a typical REST/GraphQL backend."""
+    return {
+        "data": {
+            "viewer": {
+                "id": user_id,
+                "login": f"user-{user_id}",
+                "profile": {
+                    "name": "Ivan Petrenko",
+                    "contacts": {"email": f"user-{user_id}@example.com", "phone": None},
+                    "address": {
+                        "street": "Main St",
+                        "city": "Kyiv",
+                        "zip": "01001",
+                        "geo": {"lat": 50.45, "lng": 30.52},
+                    },
+                },
+                "repositories": {
+                    "totalCount": 3,
+                    "nodes": [
+                        {"name": f"repo-{i}", "stars": i * 10, "topics": ["python"]}
+                        for i in range(3)
+                    ],
+                },
+            }
+        },
+        "extensions": {"cost": {"requested": 12, "remaining": 4988}},
+    }
+
+
+DEEP = api_response(1)
+DEEP_PATH = "data.viewer.profile.address.geo.lat"
+DEEP_MISSING_PATH = "data.viewer.profile.company.address.geo.lat"
+DEEP_FIELDS = {
+    "id": "data.viewer.id",
+    "login": "data.viewer.login",
+    "name": "data.viewer.profile.name",
+    "email": "data.viewer.profile.contacts.email",
+    "phone": "data.viewer.profile.contacts.phone",
+    "city": "data.viewer.profile.address.city",
+    "lat": "data.viewer.profile.address.geo.lat",
+    "lng": "data.viewer.profile.address.geo.lng",
+    "repositories": "data.viewer.repositories.totalCount",
+    "remaining": "extensions.cost.remaining",
+}
+STARS_PATTERN = "data.viewer.repositories.nodes.*.stars"
+
+# a wide flat record, e.g. a row of a denormalized table or an analytics event
+WIDE = {f"field_{i}": i for i in range(200)}
+WIDE_KEYS = [f"field_{i}" for i in range(0, 200, 20)]
+
+RECORDS: List[Dict[str, Any]] = [api_response(i) for i in range(1_000)]
+RECORDS_NDJSON = "\n".join(json.dumps(record) for record in RECORDS).encode()
+
+# a large encoded response of which only a few fields are read, the bulk of it
+# comes after the primary data, as in JSON:API responses with included resources
+LARGE_RESPONSE_JSON = json.dumps({**DEEP, "included": RECORDS[:200]}).encode()
+LARGE_RESPONSE_LAST_PATH = "included.199.data.viewer.id"
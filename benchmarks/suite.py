@@ -0,0 +1,184 @@
+"""
+Benchmark cases of every public `et` helper, run by `python -m benchmarks`.
+
+Each case is a zero-argument callable, its cost is measured per call.
+"""
+
+import asyncio
+import io
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.payloads import (
+    DEEP,
+    DEEP_FIELDS,
+    DEEP_MISSING_PATH,
+    DEEP_PATH,
+    LARGE_RESPONSE_JSON,
+    RECORDS,
+    RECORDS_NDJSON,
+    STARS_PATTERN,
+    WIDE,
+    WIDE_KEYS,
+)
+from et import (
+    Break,
+    LazyJSON,
+    Schema,
+    ServiceCache,
+    catch_a_break,
+    destruct,
+    nget,
+    nget_column,
+    nget_iter,
+    nget_many,
+    nget_stream,
+    nset,
+    nupdate,
+    run_services,
+    service,
+    utc_now,
+    utc_now_iso,
+    utc_now_ns,
+    utc_stamps,
+)
+from et.parallel import extract
+from et.trace import TraceBuffer
+
+# service logging must not be measured
+logging.getLogger("et.service").setLevel(logging.INFO)
+
+
+@service
+class UserSvc:
+    user_id: int
+    dry_run: bool = False
+
+    @catch_a_break
+    def run(self) -> Optional[int]:
+        if self.user_id % 2:
+            msg = f"User {self.user_id} is inactive."
+            raise Break(msg)
+        return self.user_id
+
+    @catch_a_break
+    def run_break_of(self) -> Optional[int]:
+        if self.user_id % 2:
+            msg = "No user"
+            raise Break.of(msg)
+        return self.user_id
+
+
+@service(cache=ServiceCache(ttl=60))
+class CachedUserSvc:
+    user_id: int
+
+    def run(self) -> int:
+        return self.user_id
+
+
+@service(slots=True)
+class SlottedUserSvc:
+    user_id: int
+    dry_run: bool = False
+
+
+@service(pool=4)
+class PooledUserSvc:
+    user_id: int
+    dry_run: bool = False
+
+
+@service
+class FetchUserSvc:
+    user_id: int
+
+    async def run(self) -> int:
+        await asyncio.sleep(0)
+        if self.user_id % 10 == 0:
+            msg = "No user"
+            raise Break.of(msg)
+        return self.user_id
+
+
+COMPILED_PATH = nget.compile(DEEP_PATH)
+COMPILED_FIELDS = nget_many.compile(DEEP_FIELDS)
+DEEP_SCHEMA = Schema.from_sample(DEEP)
+SCHEMA_ACCESSOR = DEEP_SCHEMA.accessor(DEEP_PATH)
+SCHEMA_ACCESSOR_MISS = DEEP_SCHEMA.accessor(DEEP_MISSING_PATH)
+WIDE_EXTRACTOR = destruct.compile(WIDE_KEYS)
+NUPDATE_FIELDS = dict.fromkeys(DEEP_FIELDS.values(), 0)
+SERVICES = [UserSvc(user_id) for user_id in range(100)]
+TRACE_BUFFER = TraceBuffer(1024)
+TRACE_ARGS = (DEEP, 1)
+
+
+def destruct_inferred() -> Any:
+    field_0, field_20, field_40 = destruct(WIDE)
+    return field_0, field_20, field_40
+
+
+def break_heavy_loop() -> List[Optional[int]]:
+    return [svc.run() for svc in SERVICES]
+
+
+def break_heavy_loop_break_of() -> List[Optional[int]]:
+    return [svc.run_break_of() for svc in SERVICES]
+
+
+def construct_services() -> List[UserSvc]:
+    return [UserSvc(user_id) for user_id in range(100)]
+
+
+def construct_slotted_services() -> List[SlottedUserSvc]:
+    return [SlottedUserSvc(user_id) for user_id in range(100)]
+
+
+def acquire_pooled_services() -> None:
+    for user_id in range(100):
+        with PooledUserSvc.acquire(user_id):
+            pass
+
+
+def run_async_services() -> List[Any]:
+    return asyncio.run(run_services(FetchUserSvc(i) for i in range(100)))
+
+
+CASES: Dict[str, Callable[[], object]] = {
+    "nget.deep": lambda: nget(DEEP, DEEP_PATH),
+    "nget.deep_miss": lambda: nget(DEEP, DEEP_MISSING_PATH, default=0),
+    "nget.compiled": lambda: COMPILED_PATH(DEEP),
+    "schema.accessor": lambda: SCHEMA_ACCESSOR(DEEP),
+    "schema.accessor_miss": lambda: SCHEMA_ACCESSOR_MISS(DEEP, 0),
+    "nget_many.deep_10_fields": lambda: nget_many(DEEP, DEEP_FIELDS),
+    "nget_many.compiled_10_fields": lambda: COMPILED_FIELDS.get(DEEP),
+    "nget_iter.wildcard": lambda: list(nget_iter(DEEP, STARS_PATTERN)),
+    "nget_column.1000_records": lambda: nget_column(RECORDS, DEEP_PATH),
+    "parallel.extract_1000_in_process": lambda: list(
+        extract(RECORDS, DEEP_FIELDS, workers=1)
+    ),
+    "nget_stream.1000_ndjson_lines": lambda: list(
+        nget_stream(io.BytesIO(RECORDS_NDJSON), "*." + DEEP_PATH)
+    ),
+    "lazy_json.deep_large_response": lambda: nget(
+        LazyJSON(LARGE_RESPONSE_JSON), DEEP_PATH
+    ),
+    "nset.deep": lambda: nset(DEEP, DEEP_PATH, 0.0),
+    "nupdate.deep_10_fields": lambda: nupdate(DEEP, NUPDATE_FIELDS),
+    "destruct.keys_wide": lambda: destruct(WIDE, keys=WIDE_KEYS),
+    "destruct.inferred_wide": destruct_inferred,
+    "destruct.compiled_wide": lambda: WIDE_EXTRACTOR(WIDE),
+    "destruct.compiled_many_1000": lambda: WIDE_EXTRACTOR.many([WIDE] * 1000),
+    "service.construct_100": construct_services,
+    "service.construct_100_slots": construct_slotted_services,
+    "service.acquire_100_pooled": acquire_pooled_services,
+    "trace.record": lambda: TRACE_BUFFER.record("UserSvc", TRACE_ARGS, {}),
+    "service.cached_run_hit": lambda: CachedUserSvc(1).run(),
+    "service.run_services_100_async": run_async_services,
+    "catch_a_break.loop_100_half_break": break_heavy_loop,
+    "catch_a_break.loop_100_half_break_of": break_heavy_loop_break_of,
+    "utc_now": utc_now,
+    "utc_now_ns": utc_now_ns,
+    "utc_now_iso": utc_now_iso,
+    "utc_stamps.100": lambda: utc_stamps(100),
+}
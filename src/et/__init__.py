@@ -2,17 +2,103 @@
 #
 # SPDX-License-Identifier: MIT
 
-from .destruct import DestructError, destruct
-from .nget import nget
-from .service import Break, catch_a_break, service
-from .utc_now import utc_now
+# Public names are imported lazily on first access (PEP 562), so `import et` doesn't
+# import the submodules and `from et import nget` imports only `et.nget`.
+
+import sys
+from importlib import import_module
+from types import ModuleType
+
+# not imported from `typing`, which takes longer to import than the rest of `et`
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .cache import ServiceCache
+    from .destruct import DestructError, Extractor, destruct
+    from .lazy_json import LazyJSON
+    from .nget import nget, nget_column, nget_iter, nget_many
+    from .nget_stream import nget_stream
+    from .nset import nset, nupdate
+    from .schema import Schema
+    from .service import Break, catch_a_break, run_services, service
+    from .utc_now import utc_now, utc_now_iso, utc_now_ns, utc_stamps
+
+# public name -> submodule it is defined in
+_LAZY_NAMES = {
+    "Break": "service",
+    "DestructError": "destruct",
+    "Extractor": "destruct",
+    "LazyJSON": "lazy_json",
+    "Schema": "schema",
+    "ServiceCache": "cache",
+    "catch_a_break": "service",
+    "destruct": "destruct",
+    "nget": "nget",
+    "nget_column": "nget",
+    "nget_iter": "nget",
+    "nget_many": "nget",
+    "nget_stream": "nget_stream",
+    "nset": "nset",
+    "nupdate": "nset",
+    "run_services": "service",
+    "service": "service",
+    "utc_now": "utc_now",
+    "utc_now_iso": "utc_now",
+    "utc_now_ns": "utc_now",
+    "utc_stamps": "utc_now",
+}
 
 __all__ = [
     "Break",
     "DestructError",
+    "Extractor",
+    "LazyJSON",
+    "Schema",
+    "ServiceCache",
     "catch_a_break",
     "destruct",
     "nget",
+    "nget_column",
+    "nget_iter",
+    "nget_many",
+    "nget_stream",
+    "nset",
+    "nupdate",
+    "run_services",
     "service",
     "utc_now",
+    "utc_now_iso",
+    "utc_now_ns",
+    "utc_stamps",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """Imports a public name from its submodule on first access."""
+    module = _LAZY_NAMES.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
+
+class _Package(ModuleType):
+    """
+    Keeps functions named as their submodules (`et.nget`, `et.nset`, `et.destruct`,
+    `et.service`, `et.utc_now`) bound to the functions when the import system binds
+    the submodules.
+    """
+
+    def __setattr__(self, name: str, value: object) -> None:
+        if isinstance(value, ModuleType) and _LAZY_NAMES.get(name) == name:
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
@@ -0,0 +1,167 @@
+import inspect
+import threading
+from collections import OrderedDict
+from dataclasses import fields
+from datetime import datetime, timedelta
+from functools import wraps
+from typing import Any, Callable, Hashable, NamedTuple, Optional, Tuple
+
+from .utc_now import utc_now
+
+_MISSING = object()
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a `ServiceCache`, the same as of `functools.lru_cache`."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class ServiceCache:
+    """
+    LRU cache of results of a service method, keyed by the service's field values
+    and the method's arguments. Created by `@service(cache=...)`.
+
+    Entries expire `ttl` seconds after they are stored, measured with `utc_now()`,
+    so `mocked_now` and `virtual_clock` drive expiry in tests. Thread-safe.
+
+    Only exceptions are not cached: a result of `None` from a `Break` caught by
+    `catch_a_break` is cached as any other result. Calls with unhashable field
+    values or arguments are not cached.
+
+    Args:
+        maxsize: The maximum number of cached results, the least recently used
+            result is evicted first
+        ttl: The lifetime of cached results in seconds, None - until evicted
+        method: The name of the service method to cache
+
+    Raises:
+        ValueError: If `maxsize` is less than 1 or `ttl` is not positive
+
+    Example:
+        @service(cache=ServiceCache(maxsize=10_000, ttl=60))
+        class UserLookupSvc:
+            user_id: int
+
+            def run(self):
+                return db.fetch_user(self.user_id)
+
+        UserLookupSvc.run.cache_info()
+        CacheInfo(hits=9120, misses=880, maxsize=10000, currsize=880)
+    """
+
+    def __init__(
+        self, maxsize: int = 1024, ttl: Optional[float] = None, method: str = "run"
+    ) -> None:
+        if maxsize < 1:
+            msg = f"Max size must be at least 1, got {maxsize}."
+            raise ValueError(msg)
+        if ttl is not None and ttl <= 0:
+            msg = f"TTL must be positive, got {ttl}."
+            raise ValueError(msg)
+
+        self.maxsize = maxsize
+        self.ttl = None if ttl is None else timedelta(seconds=ttl)
+        self.method = method
+        self.hits = 0
+        self.misses = 0
+        # key -> (expiration time or None, result), the least recently used first
+        self._entries: OrderedDict[Hashable, Tuple[Optional[datetime], Any]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def _get(self, key: Hashable) -> Any:
+        """Returns a cached result, or `_MISSING`. Raises TypeError if unhashable."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, result = entry
+                if expires is None or utc_now() < expires:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return result
+                del self._entries[key]
+
+            self.misses += 1
+            return _MISSING
+
+    def _put(self, key: Hashable, result: Any) -> None:
+        """Caches a result, evicting the least recently used one if the cache is full."""
+        expires = None if self.ttl is None else utc_now() + self.ttl
+        with self._lock:
+            self._entries[key] = (expires, result)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def cache_info(self) -> CacheInfo:
+        """Returns hit and miss counts and the size of the cache."""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def cache_clear(self) -> None:
+        """Drops all cached results and resets the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def wrap(self, cls: type, method: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Wraps a method of a service dataclass to cache its results.
+        The wrapper has `cache_info()` and `cache_clear()`, as `functools.lru_cache`.
+        """
+        names = tuple(field.name for field in fields(cls))
+        cache_get, cache_put = self._get, self._put
+
+        def make_key(svc: Any, args: Tuple[Any, ...], kwargs: Any) -> Hashable:
+            # the method itself tells apart services sharing a cache
+            values = tuple(getattr(svc, name) for name in names)
+            if kwargs:
+                return (method, values, args, tuple(sorted(kwargs.items())))
+            return (method, values, args)
+
+        if inspect.iscoroutinefunction(method):
+
+            @wraps(method)
+            async def cached_coroutine(svc: Any, *args: Any, **kwargs: Any) -> Any:
+                key = make_key(svc, args, kwargs)
+                try:
+                    result = cache_get(key)
+                except TypeError:  # unhashable
+                    return await method(svc, *args, **kwargs)
+                if result is _MISSING:
+                    result = await method(svc, *args, **kwargs)
+                    cache_put(key, result)
+                return result
+
+            wrapper: Callable[..., Any] = cached_coroutine
+        else:
+
+            @wraps(method)
+            def cached(svc: Any, *args: Any, **kwargs: Any) -> Any:
+                key = make_key(svc, args, kwargs)
+                try:
+                    result = cache_get(key)
+                except TypeError:  # unhashable
+                    return method(svc, *args, **kwargs)
+                if result is _MISSING:
+                    result = method(svc, *args, **kwargs)
+                    cache_put(key, result)
+                return result
+
+            wrapper = cached
+
+        wrapper.cache_info = self.cache_info  # type: ignore[attr-defined]
+        wrapper.cache_clear = self.cache_clear  # type: ignore[attr-defined]
+        return wrapper
+
+    def __repr__(self) -> str:
+        ttl = None if self.ttl is None else self.ttl.total_seconds()
+        return (
+            f"{type(self).__name__}(maxsize={self.maxsize}, ttl={ttl}, "
+            f"method={self.method!r})"
+        )
@@ -1,8 +1,21 @@
-import inspect
-import re
-from collections.abc import Sequence
-from types import FrameType
-from typing import Any, Dict, List, Optional, Tuple, Union
+from collections.abc import Iterable, Sequence
+from itertools import chain
+from operator import itemgetter
+from types import CodeType, FrameType
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
+
+# `dis`, `inspect` and `re` are imported only when keys are inferred from the caller
+if TYPE_CHECKING:
+    import dis
+
+CALL_SITE_CACHE_SIZE = 1024
+
+# Variable names inferred per call site: (code object, bytecode offset) -> names
+_call_site_cache: Dict[Tuple[CodeType, int], Tuple[str, ...]] = {}
+
+_STORE_NAME_OPS = frozenset(
+    {"STORE_FAST", "STORE_NAME", "STORE_GLOBAL", "STORE_DEREF", "STORE_ATTR"}
+)
 
 
 class DestructError(Exception):
@@ -14,6 +27,8 @@ def _extract_variable_names(call_line: str) -> List[str]:
     Extracts variable names from the caller's assignment statement:
     `name, age, city = destruct(person_dict)` -> ['name', 'age', 'city']
     """
+    import re  # noqa: PLC0415
+
     assignment_split = call_line.split("=")[0]  # take only the part before '='
 
     pattern = r"\b([a-zA-Z_]\w*)\b"
@@ -27,8 +42,89 @@ def _extract_variable_names(call_line: str) -> List[str]:
     return re.findall(pattern, assignment_split)
 
 
+def _store_names(instruction: "dis.Instruction") -> Optional[Tuple[str, ...]]:
+    """Returns names stored by an instruction, or None if it is not a store."""
+    if instruction.opname in _STORE_NAME_OPS:
+        return (instruction.argval,)
+    if instruction.opname == "STORE_FAST_STORE_FAST":  # Python 3.13+
+        return tuple(instruction.argval)
+    if instruction.opname == "STORE_FAST_LOAD_FAST":  # Python 3.13+
+        return (instruction.argval[0],)
+
+    return None
+
+
+def _unpacked_count(instruction: "dis.Instruction") -> Optional[int]:
+    """Returns the number of targets unpacked by an instruction, or None."""
+    arg = instruction.arg or 0
+    if instruction.opname == "UNPACK_SEQUENCE":
+        return arg
+    if instruction.opname == "UNPACK_EX":  # starred target: `a, *b = ...`
+        return (arg & 0xFF) + 1 + (arg >> 8)
+
+    return None
+
+
+def _bytecode_var_names(code: CodeType, lasti: int) -> Optional[Tuple[str, ...]]:
+    """
+    Extracts assignment targets from the instructions following the call:
+    `name, age = destruct(person_dict)` -> `CALL; UNPACK_SEQUENCE 2; STORE_FAST name;
+    STORE_FAST age` -> ('name', 'age')
+
+    Works without source files (zipapps, .pyc-only and frozen builds).
+    Returns None if the targets can't be recognized.
+    """
+    if not isinstance(code, CodeType):
+        return None
+
+    import dis  # noqa: PLC0415
+
+    # skip to the first instruction after the call; on Python 3.11 and 3.12
+    # `f_lasti` points at the last inline cache entry of the call instruction
+    instructions = dis.get_instructions(code)
+    for instruction in instructions:
+        if instruction.offset > lasti:
+            break
+    else:
+        return None
+
+    count = _unpacked_count(instruction)
+    if count is None:  # a single target
+        count = 1
+        instructions = chain((instruction,), instructions)
+
+    names: List[str] = []
+    for instruction in instructions:
+        if instruction.opname.startswith("LOAD_"):
+            continue  # loads an object for an attribute target: `self.name = ...`
+
+        stored = _store_names(instruction)
+        if stored is None:  # subscripts, nested unpacking, no assignment, etc.
+            return None
+
+        names.extend(stored)
+        if len(names) >= count:
+            return tuple(names[:count])
+
+    return None
+
+
+def clear_cache() -> None:
+    """
+    Clears variable names cached per call site.
+    Also available as `destruct.clear_cache`.
+    """
+    _call_site_cache.clear()
+
+
 def _get_var_names(frame: Optional[FrameType]) -> Sequence[str]:
-    """Get variables' names from a given frame."""
+    """
+    Get variables' names from a given frame.
+
+    Names are inferred from the caller's bytecode, falling back to its source line.
+    They are cached per call site, so only the first call from a given line
+    inspects the caller.
+    """
     if not frame:
         msg = "Failed to access a frame."
         raise DestructError(msg)
@@ -38,6 +134,24 @@ def _get_var_names(frame: Optional[FrameType]) -> Sequence[str]:
         msg = "Failed to access caller's frame."
         raise DestructError(msg)
 
+    call_site = (caller_frame.f_code, caller_frame.f_lasti)
+    names = _call_site_cache.get(call_site)
+    if names is None:
+        names = _bytecode_var_names(caller_frame.f_code, caller_frame.f_lasti)
+        if names is None:
+            names = tuple(_inspect_var_names(caller_frame))
+        if len(_call_site_cache) >= CALL_SITE_CACHE_SIZE:
+            # evict the oldest call site
+            _call_site_cache.pop(next(iter(_call_site_cache)), None)
+        _call_site_cache[call_site] = names
+
+    return names
+
+
+def _inspect_var_names(caller_frame: FrameType) -> List[str]:
+    """Get variables' names from the source line of the caller's frame."""
+    import inspect  # noqa: PLC0415
+
     # get the context from the caller's frame
     code_context = inspect.getframeinfo(caller_frame).code_context
     if not code_context:
@@ -87,6 +201,12 @@ def destruct(
         in interactive environments like the Python shell or Jupyter notebooks.
         Use `keys` argument if you need to work in the shell.
 
+    Variable names are inferred from the caller's bytecode, so source files are not
+    required. The caller's source line is used only for assignments that can't be
+    recognized from the bytecode. Inferred names are cached per call site (caller's
+    code object and bytecode offset), so only the first call from a given line
+    inspects the caller.
+
     Example:
         person_dict = {"name": "John", "age": 30, "city": "New York"}
 
@@ -100,6 +220,8 @@ def destruct(
         name, country = destruct(person_dict, keys=["name", "country"], default="N/A")
     """
     if not keys:
+        import inspect  # noqa: PLC0415
+
         frame = inspect.currentframe()
         keys = _get_var_names(frame)
 
@@ -110,12 +232,114 @@ def destruct(
 
         return tuple(dct.get(key, default) for key in keys)
 
-    missing = [k for k in keys if k not in dct]
-    if missing:
-        msg = f"Key(s) {missing} not found in dictionary."
+    msg = _missing_keys_message(dct, keys)
+    if msg:
         raise KeyError(msg)
 
     if len(keys) == 1:
         return dct[keys[0]]
 
     return tuple(dct[key] for key in keys)
+
+
+def _missing_keys_message(dct: Dict[str, Any], keys: Sequence[str]) -> Optional[str]:
+    """Returns an error message listing the keys not found in the dictionary, if any."""
+    missing = [k for k in keys if k not in dct]
+    if missing:
+        return f"Key(s) {missing} not found in dictionary."
+
+    return None
+
+
+class Extractor:
+    """
+    Compiled `destruct` for a fixed set of keys.
+
+    Created by `destruct.compile(...)`. Returns the same values and raises
+    the same errors as `destruct` with explicit `keys`, without re-checking
+    the keys on every call.
+    """
+
+    __slots__ = ("_get", "default", "keys")
+
+    def __init__(self, keys: Sequence[str], default: Any = ...) -> None:
+        if not keys:
+            msg = "No keys provided."
+            raise DestructError(msg)
+
+        self.keys = tuple(keys)
+        self.default = default
+
+        self._get: Callable[[Dict[str, Any]], Any]
+        if default is ...:
+            # returns a single value for one key and a tuple for many keys
+            self._get = itemgetter(*self.keys)
+        elif len(self.keys) == 1:
+            (key,) = self.keys
+            self._get = lambda dct: dct.get(key, default)
+        else:
+            keys, defaults = self.keys, (default,) * len(self.keys)
+            self._get = lambda dct: tuple(map(dct.get, keys, defaults))
+
+    def __call__(self, dct: Dict[str, Any]) -> Union[Any, Tuple[Any, ...]]:
+        """Extracts the values from a dictionary, see `destruct`."""
+        try:
+            return self._get(dct)
+        except KeyError:
+            msg = _missing_keys_message(dct, self.keys)
+            if msg is None:
+                raise
+            raise KeyError(msg) from None
+
+    def many(self, dcts: Iterable[Dict[str, Any]]) -> List[Union[Any, Tuple[Any, ...]]]:
+        """Extracts the values from every dictionary of an iterable."""
+        get = self._get
+        results = []
+        append = results.append
+
+        dct = None
+        try:
+            for dct in dcts:
+                append(get(dct))
+        except KeyError:
+            msg = _missing_keys_message(dct, self.keys)  # type: ignore[arg-type]
+            if msg is None:
+                raise
+            raise KeyError(msg) from None
+
+        return results
+
+    def __repr__(self) -> str:
+        default = "" if self.default is ... else f", default={self.default!r}"
+        return f"{type(self).__name__}({list(self.keys)!r}{default})"
+
+
+def compile_extractor(keys: Sequence[str], default: Any = ...) -> Extractor:
+    """
+    Compiles `destruct` for a fixed set of keys, for hot loops.
+
+    Also available as `destruct.compile`.
+
+    Args:
+        keys: Sequence of keys to extract.
+        default: Default value to use when a key is not found in the dictionary.
+            If not provided, KeyError will be raised for missing keys.
+
+    Returns:
+        Extractor: A callable that extracts the values from a dictionary,
+            `.many(dicts)` extracts them from every dictionary of an iterable.
+
+    Raises:
+        DestructError: If no keys are provided.
+
+    Example:
+        person = destruct.compile(["name", "age", "city"], default="N/A")
+
+        name, age, city = person(person_dict)
+        rows = person.many(person_dicts)
+    """
+    return Extractor(keys, default)
+
+
+destruct.clear_cache = clear_cache  # type: ignore[attr-defined]
+destruct.compile = compile_extractor  # type: ignore[attr-defined]
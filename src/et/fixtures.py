@@ -1,4 +1,7 @@
-from datetime import datetime, timezone
+import selectors
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Sequence, Tuple
 from unittest.mock import Mock
 
 from pytest import MonkeyPatch, fixture
@@ -7,6 +10,113 @@ from et.utc_now import DateTimeProvider
 
 DEFAULT_NOW = datetime(2025, 6, 6, 12, 0, 0, tzinfo=timezone.utc)
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+_NS_PER_SECOND = 1_000_000_000
+# monotonic clock of a virtual clock starts at an arbitrary point, as the real one
+_MONOTONIC_START_NS = 1_000 * _NS_PER_SECOND
+
+
+def _to_ns(dt: datetime) -> int:
+    """Converts a datetime to nanoseconds since the Unix epoch."""
+    return (dt - _EPOCH) // _MICROSECOND * 1000
+
+
+class VirtualClock:
+    """
+    Virtual time for tests, see the `virtual_clock` fixture.
+
+    Time moves only when `advance()` or `time.sleep()` is called, when an idle
+    asyncio event loop waits for its next timer, or by `tick` seconds
+    after every read of the clock.
+    """
+
+    def __init__(self, start: datetime = DEFAULT_NOW, tick: float = 0) -> None:
+        self.start = start
+        self.tick = tick
+        self._start_ns = _to_ns(start)
+        self._elapsed_ns = 0
+
+    def _read(self) -> int:
+        """Returns nanoseconds elapsed since the start, then auto-ticks."""
+        elapsed_ns = self._elapsed_ns
+        if self.tick:
+            self._elapsed_ns += round(self.tick * _NS_PER_SECOND)
+        return elapsed_ns
+
+    def advance(self, seconds: float) -> None:
+        """
+        Moves the clock forward.
+
+        Raises:
+            ValueError: If `seconds` is negative, time doesn't go back.
+        """
+        if seconds < 0:
+            msg = f"Can't advance the clock by a negative number of seconds: {seconds}."
+            raise ValueError(msg)
+
+        self._elapsed_ns += round(seconds * _NS_PER_SECOND)
+
+    def now(self) -> datetime:
+        """The current time, replaces `utc_now()`."""
+        return self.start + timedelta(microseconds=self._read() // 1000)
+
+    def time_ns(self) -> int:
+        """Replaces `time.time_ns()` and `utc_now_ns()`."""
+        return self._start_ns + self._read()
+
+    def time(self) -> float:
+        """Replaces `time.time()`."""
+        return self.time_ns() / _NS_PER_SECOND
+
+    def monotonic_ns(self) -> int:
+        """Replaces `time.monotonic_ns()`."""
+        return _MONOTONIC_START_NS + self._read()
+
+    def monotonic(self) -> float:
+        """Replaces `time.monotonic()`, followed by the asyncio event loop's time."""
+        return self.monotonic_ns() / _NS_PER_SECOND
+
+    def utc_now_iso(self) -> str:
+        """Replaces `utc_now_iso()`."""
+        return self.now().isoformat(timespec="microseconds")
+
+    def utc_stamps(self, n: int) -> Sequence[int]:
+        """Replaces `utc_stamps()`."""
+        now_ns = self.time_ns()
+        return range(now_ns, now_ns + n)
+
+    def sleep(self, seconds: float) -> None:
+        """Replaces `time.sleep()`, advances the clock without waiting."""
+        self.advance(seconds)
+
+    def install(self, monkeypatch: MonkeyPatch) -> None:
+        """Patches `DateTimeProvider`, the `time` module and event loop selectors."""
+        select = selectors.DefaultSelector.select
+
+        def virtual_select(
+            selector: selectors.BaseSelector, timeout: Optional[float] = None
+        ) -> List[Tuple[selectors.SelectorKey, int]]:
+            # an event loop waits for I/O until its next timer, jump to the timer instead
+            if timeout is None or timeout <= 0:
+                return select(selector, timeout)
+
+            events = select(selector, 0)
+            if not events:
+                self.advance(timeout)
+            return events
+
+        monkeypatch.setattr(DateTimeProvider, "utc_now", self.now)
+        monkeypatch.setattr(DateTimeProvider, "utc_now_ns", self.time_ns)
+        monkeypatch.setattr(DateTimeProvider, "utc_now_iso", self.utc_now_iso)
+        monkeypatch.setattr(DateTimeProvider, "utc_stamps", self.utc_stamps)
+        monkeypatch.setattr(time, "time", self.time)
+        monkeypatch.setattr(time, "time_ns", self.time_ns)
+        monkeypatch.setattr(time, "monotonic", self.monotonic)
+        monkeypatch.setattr(time, "monotonic_ns", self.monotonic_ns)
+        monkeypatch.setattr(time, "sleep", self.sleep)
+        monkeypatch.setattr(selectors.DefaultSelector, "select", virtual_select)
+
 
 @fixture
 def mocked_now(monkeypatch: MonkeyPatch) -> Mock:
@@ -15,6 +125,8 @@ def mocked_now(monkeypatch: MonkeyPatch) -> Mock:
 
     Replaces the `utc_now()` method with a mock that returns
     a predefined datetime (`DEFAULT_NOW`).
+    `utc_now_ns()`, `utc_now_iso()` and `utc_stamps()` return the same time
+    as the mock's `return_value`.
 
     Usage:
     - To modify the returned datetime, update the `return_value` attribute of the mock.
@@ -26,4 +138,51 @@ def mocked_now(monkeypatch: MonkeyPatch) -> Mock:
     fake_utc_now = Mock(return_value=DEFAULT_NOW)
     monkeypatch.setattr(DateTimeProvider, "utc_now", fake_utc_now)
 
+    def utc_now_ns() -> int:
+        return _to_ns(fake_utc_now.return_value)
+
+    def utc_now_iso() -> str:
+        now = fake_utc_now.return_value.astimezone(timezone.utc)
+        return now.isoformat(timespec="microseconds")
+
+    def utc_stamps(n: int) -> Sequence[int]:
+        now_ns = utc_now_ns()
+        return range(now_ns, now_ns + n)
+
+    monkeypatch.setattr(DateTimeProvider, "utc_now_ns", utc_now_ns)
+    monkeypatch.setattr(DateTimeProvider, "utc_now_iso", utc_now_iso)
+    monkeypatch.setattr(DateTimeProvider, "utc_stamps", utc_stamps)
+
     return fake_utc_now
+
+
+@fixture
+def virtual_clock(monkeypatch: MonkeyPatch) -> VirtualClock:
+    """
+    Fixture for running time-dependent code on virtual time.
+
+    Replaces `utc_now()` and the other `DateTimeProvider` methods, `time.time()`,
+    `time.time_ns()`, `time.monotonic()`, `time.monotonic_ns()` and `time.sleep()`
+    with a `VirtualClock` that starts at `DEFAULT_NOW`. `time.sleep()` advances
+    the clock without waiting.
+    The asyncio event loop's time follows the clock, and an idle event loop jumps
+    the clock to its next timer instead of waiting, so `asyncio.sleep()`, timeouts
+    and retries run instantly.
+
+    Functions imported directly (`from time import monotonic`) are not patched.
+    An event loop waiting for I/O while it has timers (e.g. for a thread
+    of `run_in_executor`) jumps to the next timer too.
+
+    Usage:
+    - To move time forward, call `advance`.
+    >>> virtual_clock.advance(60)
+    - To move time forward by some seconds on every read of the clock, set `tick`.
+    >>> virtual_clock.tick = 0.001
+
+    Returns:
+        VirtualClock: The clock used instead of the real one.
+    """
+    clock = VirtualClock()
+    clock.install(monkeypatch)
+
+    return clock
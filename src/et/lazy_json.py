@@ -0,0 +1,347 @@
+import json
+import re
+from functools import cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+_WHITESPACE = re.compile(rb"[ \t\n\r]*")
+_STRING = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+_STRING_PATTERN = re.compile(_STRING, re.DOTALL)
+# strings are matched whole, so brackets inside them are skipped
+_CONTAINER_TOKEN = re.compile(_STRING + rb"|[\[\]{}]", re.DOTALL)
+_SCALAR = re.compile(rb"[^,\]}\s]+")
+# a key of an object with the colon, and the delimiter after a value
+_KEY = re.compile(
+    rb'[ \t\n\r]*"([^"\\]*(?:\\.[^"\\]*)*)"[ \t\n\r]*:[ \t\n\r]*', re.DOTALL
+)
+_DELIMITER = re.compile(rb"[ \t\n\r]*([,\]}])")
+
+# Containers nested up to this depth are skipped by a single regex match,
+# deeper ones token by token
+SKIP_DEPTH = 16
+
+_QUOTE, _COLON, _COMMA = ord('"'), ord(":"), ord(",")
+_OPENING = frozenset(b"{[")
+_CLOSING = {ord("{"): ord("}"), ord("["): ord("]")}
+
+
+def _error(msg: str, buffer: Buffer, pos: int) -> json.JSONDecodeError:
+    return json.JSONDecodeError(msg, bytes(buffer).decode(errors="replace"), pos)
+
+
+def _skip_whitespace(buffer: Buffer, pos: int) -> int:
+    return _WHITESPACE.match(buffer, pos).end()  # type: ignore[union-attr]
+
+
+@cache
+def _container_pattern() -> "re.Pattern[bytes]":
+    """
+    Compiles the regex matching a container nested up to `SKIP_DEPTH` levels,
+    on first use, so importing the module stays cheap.
+
+    Strings and runs of other bytes alternate without overlapping, so a failed match
+    doesn't backtrack exponentially. Brackets are not paired by kind,
+    mismatched ones are reported when the container is decoded.
+    """
+    other = rb'[^"\[\]{}]*'
+    inner = other + rb"(?:" + _STRING + other + rb")*"
+    for _ in range(SKIP_DEPTH - 1):
+        item = rb"(?:" + _STRING + rb"|[\[{]" + inner + rb"[\]}])"
+        inner = other + rb"(?:" + item + other + rb")*"
+    return re.compile(rb"[\[{]" + inner + rb"[\]}]", re.DOTALL)
+
+
+def _skip_value(buffer: Buffer, pos: int) -> int:
+    """
+    Returns the end of the JSON value starting at `pos` without decoding it.
+    Only the boundaries of values are checked, `LazyJSON.decode` validates them.
+    """
+    if pos >= len(buffer):
+        msg = "Expecting value"
+        raise _error(msg, buffer, pos)
+
+    char = buffer[pos]
+    if char == _QUOTE:
+        match = _STRING_PATTERN.match(buffer, pos)
+        if match is None:
+            msg = "Unterminated string"
+            raise _error(msg, buffer, pos)
+        return match.end()
+
+    if char in _OPENING:
+        match = _container_pattern().match(buffer, pos)
+        if match is not None:
+            return match.end()
+
+        # nested deeper than `SKIP_DEPTH`, or unterminated
+        depth = 0
+        for match in _CONTAINER_TOKEN.finditer(buffer, pos):
+            token = buffer[match.start()]
+            if token == _QUOTE:
+                continue
+            depth += 1 if token in _OPENING else -1
+            if not depth:
+                return match.end()
+        msg = "Unterminated container"
+        raise _error(msg, buffer, pos)
+
+    match = _SCALAR.match(buffer, pos)
+    if match is None:
+        msg = "Expecting value"
+        raise _error(msg, buffer, pos)
+    return match.end()
+
+
+def _decode(buffer: Buffer, start: int, end: Optional[int]) -> Any:
+    return json.loads(bytes(buffer[start:end]))
+
+
+class LazyJSON:
+    """
+    Lazy view of a JSON object or array encoded as bytes.
+
+    Values are decoded only when they are looked up: `doc['a']['b']` scans
+    the containers along the path, skips other values without decoding them,
+    and decodes only the value at the end. Nested objects and arrays are returned
+    as `LazyJSON` views of the same buffer. Works with `nget` and `nget_many`.
+
+    Offsets of scanned members and looked up values are cached, so repeated
+    lookups in the same document don't scan it again.
+
+    Only the boundaries of skipped values are checked, invalid JSON may be
+    reported only when a value is decoded. If an object has duplicate keys,
+    the first one is found (`json.loads` keeps the last one).
+
+    Args:
+        data: A JSON document as `bytes`, `bytearray` or `memoryview`,
+            its top-level value must be an object or an array.
+
+    Raises:
+        ValueError: If the top-level value is not an object or an array.
+
+    Example:
+        >>> doc = LazyJSON(request.body)
+        >>> nget(doc, 'result.users.0.address.city')
+        'Kyiv'
+        >>> doc['result']['users'][0].decode()
+        {'name': 'Ivan', 'address': {'city': 'Kyiv'}}
+    """
+
+    __slots__ = (
+        "_buffer",
+        "_cache",
+        "_done",
+        "_end",
+        "_members",
+        "_next",
+        "_open",
+        "_start",
+        "is_array",
+    )
+
+    def __init__(self, data: Buffer) -> None:
+        start = _skip_whitespace(data, 0)
+        if start >= len(data) or data[start] not in _OPENING:
+            msg = "Expected a JSON object or array."
+            raise ValueError(msg)
+
+        self._init(data, start, None)
+
+    @classmethod
+    def _view(cls, buffer: Buffer, start: int, end: Optional[int]) -> "LazyJSON":
+        """Returns a view of a nested container, without checking the buffer again."""
+        view = cls.__new__(cls)
+        view._init(buffer, start, end)  # noqa: SLF001
+        return view
+
+    def _init(self, buffer: Buffer, start: int, end: Optional[int]) -> None:
+        self._buffer = buffer
+        self._start = start
+        self._end = end  # None until found
+        self.is_array = buffer[start] == ord("[")
+        # scanned members: keys or indices -> (start, end) of values
+        self._members: Union[
+            Dict[str, Tuple[int, Optional[int]]], List[Tuple[int, Optional[int]]]
+        ] = [] if self.is_array else {}
+        self._cache: Dict[Any, Any] = {}  # decoded values and views
+        self._next = start + 1  # where scanning continues
+        # the last scanned member if it is a container: (key or index, start),
+        # its end is found only when scanning continues past it
+        self._open: Optional[Tuple[Any, int]] = None
+        self._done = False
+
+    def _scan(self) -> bool:
+        """Scans the next member. Returns False if there are no more members."""
+        if self._done:
+            return False
+
+        if self._open is not None and not self._close_open():
+            return False
+
+        buffer = self._buffer
+        pos = _skip_whitespace(buffer, self._next)
+        closing = _CLOSING[buffer[self._start]]
+        if pos < len(buffer) and buffer[pos] == closing and self._next == self._start + 1:
+            self._end = pos + 1
+            self._done = True
+            return False
+
+        if self.is_array:
+            key, start = len(self._members), pos
+        else:
+            key, start = self._scan_key(pos)
+            if key in self._members:  # a duplicate key, the first one is kept
+                self._delimiter(_skip_value(buffer, start))
+                return True
+
+        if start < len(buffer) and buffer[start] in _OPENING:
+            end = None
+            self._open = (key, start)
+        else:
+            end = _skip_value(buffer, start)
+            self._delimiter(end)
+
+        if self.is_array:
+            self._members.append((start, end))  # type: ignore[union-attr]
+        else:
+            self._members[key] = (start, end)  # type: ignore[index]
+        return True
+
+    def _close_open(self) -> bool:
+        """
+        Finds the end of the last scanned member, a container.
+        Returns False if it is the last member. A view of the container scanned
+        to the end knows where it ends, so the container isn't scanned twice.
+        """
+        key, start = self._open  # type: ignore[misc]
+        self._open = None
+        view = self._cache.get(key)
+        if view is not None and view._done:  # noqa: SLF001
+            end = view._end  # noqa: SLF001
+        else:
+            end = _skip_value(self._buffer, start)
+        self._members[key] = (start, end)  # type: ignore[index]
+        return self._delimiter(end)
+
+    def _scan_key(self, pos: int) -> Tuple[str, int]:
+        """Scans a key of an object. Returns the key and where its value starts."""
+        buffer = self._buffer
+        match = _KEY.match(buffer, pos)
+        if match is None:
+            pos = _skip_whitespace(buffer, pos)
+            string = _STRING_PATTERN.match(buffer, pos)
+            if string is None:
+                msg = "Expecting property name enclosed in double quotes"
+            else:
+                msg = "Expecting ':' delimiter"
+                pos = _skip_whitespace(buffer, string.end())
+            raise _error(msg, buffer, pos)
+
+        raw = match.group(1)
+        key = raw.decode() if b"\\" not in raw else json.loads(b'"' + raw + b'"')
+        return key, match.end()
+
+    def _delimiter(self, end: int) -> bool:
+        """Checks the delimiter after a member. Returns False if it is the last one."""
+        buffer = self._buffer
+        match = _DELIMITER.match(buffer, end)
+        closing = _CLOSING[buffer[self._start]]
+        if match is not None:
+            if buffer[match.start(1)] == _COMMA:
+                self._next = match.end()
+                return True
+            if buffer[match.start(1)] == closing:
+                self._end = match.end()
+                self._done = True
+                return False
+
+        msg = f"Expecting ',' or '{chr(closing)}' delimiter"
+        raise _error(msg, buffer, _skip_whitespace(buffer, end))
+
+    def _value(self, key: Any, start: int, end: Optional[int]) -> Any:
+        """Decodes a member, or returns a view of a nested container. Cached."""
+        value = self._cache.get(key, self)
+        if value is self:
+            if self._buffer[start] in _OPENING:
+                value = LazyJSON._view(self._buffer, start, end)
+            else:
+                value = _decode(self._buffer, start, end)
+            self._cache[key] = value
+
+        return value
+
+    def __getitem__(self, key: Union[str, int]) -> Any:
+        """
+        Returns a member of an object or an element of an array.
+
+        Raises:
+            KeyError: If an object has no such key.
+            IndexError: If an index is out of range of an array.
+            TypeError: If a key is not a string for an object, or not an int for an array.
+        """
+        members = self._members
+        if self.is_array:
+            if not isinstance(key, int):
+                msg = f"Array indices must be integers, not {type(key).__name__}"
+                raise TypeError(msg)
+            if key < 0:
+                while self._scan():
+                    pass
+                key += len(members)
+            while key >= len(members) and self._scan():
+                pass
+            if not 0 <= key < len(members):
+                msg = "Array index out of range"
+                raise IndexError(msg)
+            return self._value(key, *members[key])  # type: ignore[index]
+
+        if not isinstance(key, str):
+            raise KeyError(key)  # JSON keys are strings, as in a decoded dict
+        while key not in members and self._scan():
+            pass
+        if key not in members:
+            raise KeyError(key)
+        return self._value(key, *members[key])  # type: ignore[call-overload]
+
+    def get(self, key: Union[str, int], default: Any = None) -> Any:
+        """Returns a member, or `default` if there is no such key or index."""
+        try:
+            return self[key]
+        except (KeyError, IndexError, TypeError):
+            return default
+
+    def __contains__(self, key: object) -> bool:
+        if self.is_array:
+            return any(value == key for value in self)
+        return self.get(key, self) is not self  # type: ignore[arg-type]
+
+    def __len__(self) -> int:
+        while self._scan():
+            pass
+        return len(self._members)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterates keys of an object or elements of an array, as `dict` and `list`."""
+        if self.is_array:
+            index = 0
+            while index < len(self._members) or self._scan():
+                yield self[index]
+                index += 1
+            return
+
+        while self._scan():
+            pass
+        yield from self._members
+
+    def decode(self) -> Any:
+        """Decodes the whole object or array into dicts and lists."""
+        end = self._end
+        if end is None:
+            end = _skip_value(self._buffer, self._start)
+        return _decode(self._buffer, self._start, end)
+
+    def __repr__(self) -> str:
+        kind = "array" if self.is_array else "object"
+        end = "?" if self._end is None else self._end
+        return f"{type(self).__name__}(<{kind} at {self._start}:{end}>)"
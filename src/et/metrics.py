@@ -0,0 +1,212 @@
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Any, DefaultDict, Dict, List, Optional, Protocol, Sequence, Tuple
+
+# Upper bounds of latency histogram buckets: 1us, 10us, ..., 1s and +Inf
+DEFAULT_BUCKETS_NS: Tuple[int, ...] = tuple(10**power for power in range(3, 10))
+
+_sink: Optional["Sink"] = None
+
+
+class Sink(Protocol):
+    """Receives measurements of `@service` classes, see `enable`."""
+
+    def record_init(self, service: str) -> None:
+        """Records construction of a service instance."""
+
+    def record_call(self, service: str, method: str, ns: int) -> None:
+        """Records a call of a public service method that took `ns` nanoseconds."""
+
+    def record_break(self, service: str, reason: str) -> None:
+        """Records a `Break` caught by `catch_a_break` or `run_services`."""
+
+
+class _Histogram:
+    """Latency histogram: counts per bucket and the total time."""
+
+    __slots__ = ("counts", "sum_ns")
+
+    def __init__(self, size: int) -> None:
+        self.counts = [0] * size
+        self.sum_ns = 0
+
+
+class Registry:
+    """
+    In-process sink that aggregates measurements per service class.
+
+    Read them with `snapshot()` or `to_openmetrics()`. Thread-safe.
+    """
+
+    def __init__(self, buckets_ns: Sequence[int] = DEFAULT_BUCKETS_NS) -> None:
+        self.buckets_ns = tuple(sorted(buckets_ns))
+        self._lock = threading.Lock()
+        self._inits: DefaultDict[str, int] = defaultdict(int)
+        self._calls: Dict[Tuple[str, str], _Histogram] = {}
+        self._breaks: DefaultDict[Tuple[str, str], int] = defaultdict(int)
+
+    def record_init(self, service: str) -> None:
+        with self._lock:
+            self._inits[service] += 1
+
+    def record_call(self, service: str, method: str, ns: int) -> None:
+        bucket = bisect_left(self.buckets_ns, ns)
+        with self._lock:
+            histogram = self._calls.get((service, method))
+            if histogram is None:
+                histogram = self._calls[service, method] = _Histogram(
+                    len(self.buckets_ns) + 1
+                )
+            histogram.counts[bucket] += 1
+            histogram.sum_ns += ns
+
+    def record_break(self, service: str, reason: str) -> None:
+        with self._lock:
+            self._breaks[service, reason] += 1
+
+    def reset(self) -> None:
+        """Drops all measurements."""
+        with self._lock:
+            self._inits.clear()
+            self._calls.clear()
+            self._breaks.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns a copy of the measurements per service class.
+
+        Returns:
+            A dict of service names to dicts with:
+            - `inits` - the number of constructed instances;
+            - `calls` - method names to `count`, `sum_ns` and cumulative `buckets`,
+              a dict of bucket upper bounds in nanoseconds (the last is `inf`) to counts;
+            - `breaks` - Break reasons to counts.
+
+        Example:
+            >>> registry.snapshot()
+            {'UserService': {'inits': 2, 'calls': {'run': {'count': 2, 'sum_ns': 5400,
+            'buckets': {1000: 0, 10000: 2, ..., inf: 2}}}, 'breaks': {'No user': 1}}}
+        """
+        result: Dict[str, Dict[str, Any]] = {}
+
+        def entry(service: str) -> Dict[str, Any]:
+            if service not in result:
+                result[service] = {"inits": 0, "calls": {}, "breaks": {}}
+            return result[service]
+
+        bounds = (*self.buckets_ns, float("inf"))
+        with self._lock:
+            for service, count in self._inits.items():
+                entry(service)["inits"] = count
+            for (service, method), histogram in self._calls.items():
+                cumulative, buckets = 0, {}
+                for bound, count in zip(bounds, histogram.counts):
+                    cumulative += count
+                    buckets[bound] = cumulative
+                entry(service)["calls"][method] = {
+                    "count": cumulative,
+                    "sum_ns": histogram.sum_ns,
+                    "buckets": buckets,
+                }
+            for (service, reason), count in self._breaks.items():
+                entry(service)["breaks"][reason] = count
+
+        return result
+
+    def to_openmetrics(self) -> str:
+        """
+        Returns the measurements in the OpenMetrics text format.
+
+        Example:
+            >>> print(registry.to_openmetrics())
+            # TYPE et_service_inits counter
+            et_service_inits_total{service="UserSvc"} 2
+            # TYPE et_service_call_seconds histogram
+            et_service_call_seconds_bucket{service="UserSvc",method="run",le="1e-06"} 0
+            ...
+            # EOF
+        """
+        lines: List[str] = ["# TYPE et_service_inits counter"]
+        snapshot = self.snapshot()
+        for service, metrics in snapshot.items():
+            labels = _labels(service=service)
+            lines.append(f"et_service_inits_total{{{labels}}} {metrics['inits']}")
+
+        lines.append("# TYPE et_service_call_seconds histogram")
+        for service, metrics in snapshot.items():
+            for method, call in metrics["calls"].items():
+                labels = _labels(service=service, method=method)
+                for bound, count in call["buckets"].items():
+                    le = "+Inf" if bound == float("inf") else f"{bound / 1e9:g}"
+                    lines.append(
+                        f'et_service_call_seconds_bucket{{{labels},le="{le}"}} {count}'
+                    )
+                lines.append(f"et_service_call_seconds_count{{{labels}}} {call['count']}")
+                lines.append(
+                    f"et_service_call_seconds_sum{{{labels}}} {call['sum_ns'] / 1e9:g}"
+                )
+
+        lines.append("# TYPE et_service_breaks counter")
+        for service, metrics in snapshot.items():
+            for reason, count in metrics["breaks"].items():
+                labels = _labels(service=service, reason=reason)
+                lines.append(f"et_service_breaks_total{{{labels}}} {count}")
+
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(**labels: str) -> str:
+    """Formats OpenMetrics labels, escaping their values."""
+    return ",".join(
+        '{}="{}"'.format(
+            name,
+            value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"),
+        )
+        for name, value in labels.items()
+    )
+
+
+def get_sink() -> Optional[Sink]:
+    """Returns the enabled sink, or None if instrumentation is disabled."""
+    return _sink
+
+
+def enable(sink: Optional[Sink] = None) -> Sink:
+    """
+    Enables instrumentation of all `@service` classes.
+
+    Records construction counts, latency of public methods and `Break` reasons
+    per service class. Instrumenting wrappers are installed only while a sink
+    is enabled, so disabled instrumentation has no overhead.
+
+    Args:
+        sink: The sink to record measurements to, a new `Registry` by default
+
+    Returns:
+        The enabled sink
+
+    Example:
+        registry = metrics.enable()
+        UserService(user_id="42").run()
+        registry.snapshot()
+        metrics.disable()
+    """
+    global _sink  # noqa: PLW0603
+
+    from .service import refresh  # noqa: PLC0415 - et.service imports this module
+
+    _sink = Registry() if sink is None else sink
+    refresh()
+    return _sink
+
+
+def disable() -> None:
+    """Disables instrumentation and removes instrumenting wrappers."""
+    global _sink  # noqa: PLW0603
+
+    from .service import refresh  # noqa: PLC0415 - et.service imports this module
+
+    _sink = None
+    refresh()
@@ -1,26 +1,130 @@
-from collections.abc import Mapping, Sequence
-from typing import Any, TypeVar, Union, overload
+from array import array, typecodes
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from functools import cache, lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+)
+
+if TYPE_CHECKING:
+    import re
 
 T = TypeVar("T")
 KeyType = Union[str, int]
 NestedDict = Union[Mapping[Any, Any], Sequence[Any]]
 
+PATH_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=PATH_CACHE_SIZE)
+def _split_path(path: str) -> Tuple[KeyType, ...]:
+    """
+    Splits a dotted path into keys, converting numeric parts to list indices:
+    'result.users.0.address' -> ('result', 'users', 0, 'address')
+
+    Parsed paths are kept in a bounded LRU cache, so hot paths are parsed only once.
+    """
+    return tuple(int(part) if part.isdigit() else part for part in path.split("."))
+
+
+class NgetPath(NamedTuple):
+    """
+    Immutable pre-parsed path for `nget`.
+
+    Created by `nget.compile(...)`. Can be reused for any number of lookups
+    and passed to `nget` in place of the original keys.
+    """
+
+    keys: Tuple[KeyType, ...]
+
+    def get(self, dct: NestedDict, default: Any = None) -> Any:
+        """Retrieves the item at this path, or `default` if any step fails."""
+        try:
+            for key in self.keys:
+                dct = dct[key]
+        except (KeyError, IndexError, TypeError):
+            return default
+
+        return dct
+
+    __call__ = get
+
+
+ItemType = Union[KeyType, NgetPath]
+
+
+def _parse_keys(items: Tuple[ItemType, ...]) -> Tuple[KeyType, ...]:
+    """Converts `nget` items (keys, dotted or compiled paths) into a flat key tuple."""
+    if len(items) == 1:
+        item = items[0]
+        if isinstance(item, str):
+            return _split_path(item) if "." in item else (item,)
+        if isinstance(item, NgetPath):
+            return item.keys
+        return items  # type: ignore[return-value]
+
+    keys: List[KeyType] = []
+    for item in items:
+        if isinstance(item, str) and "." in item:
+            keys.extend(_split_path(item))
+        elif isinstance(item, NgetPath):
+            keys.extend(item.keys)
+        else:
+            keys.append(item)
+
+    return tuple(keys)
+
+
+def compile_path(*items: ItemType) -> NgetPath:
+    """
+    Parses `nget` keys once and returns a reusable, immutable path object.
+
+    Also available as `nget.compile`.
+
+    Args:
+        items: A sequence of keys, indices or dotted paths, the same as for `nget`.
+
+    Returns:
+        NgetPath: The compiled path.
+
+    Example:
+        >>> street = nget.compile('result.users.0.address.street')
+        >>> street.get(data)
+        'Main St'
+        >>> nget(data, street)
+        'Main St'
+    """
+    return NgetPath(_parse_keys(items))
+
 
 @overload
-def nget(dct: NestedDict, *items: KeyType, default: T) -> T: ...  # pragma: no cover
+def nget(dct: NestedDict, *items: ItemType, default: T) -> T: ...  # pragma: no cover
 
 
 @overload
-def nget(dct: NestedDict, *items: KeyType) -> object: ...  # pragma: no cover
+def nget(dct: NestedDict, *items: ItemType) -> object: ...  # pragma: no cover
 
 
-def nget(dct: NestedDict, *items: KeyType, default: T = None) -> Union[T, None]:
+def nget(dct: NestedDict, *items: ItemType, default: T = None) -> Union[T, None]:
     """
     Nested get.
     Retrieves a nested item from a dictionary, safely handling exceptions
     and returning None if any step fails.
     Useful for accessing data from a JSON.
 
+    Dotted paths are parsed once and cached, use `nget.compile` to parse a path
+    explicitly and reuse it.
+
     Args:
         dct: The dictionary to traverse.
         items: A sequence of keys or indices to follow in the dictionary.
@@ -41,24 +145,461 @@ def nget(dct: NestedDict, *items: KeyType, default: T = None) -> Union[T, None]:
         >>> nget(data, 'result', 'users', 0, 'address', 'zipcode', default='NY')
         'NY'
     """
-    keys: list[KeyType] = []
+    try:
+        for item in items:  # walks keys directly, the common separate keys aren't copied
+            if isinstance(item, str):
+                if "." in item:
+                    for key in _split_path(item):
+                        dct = dct[key]
+                    continue
+            elif isinstance(item, NgetPath):
+                for key in item.keys:
+                    dct = dct[key]
+                continue
+            dct = dct[item]
+    except (KeyError, IndexError, TypeError):
+        return default
+
+    return dct
+
+
+# Prefix trie node: (leaf edges, inner edges, result slots of paths ending here).
+# Leaf edges are `(key, slot)` pairs of paths ending one key below the node.
+# Chains of single-child nodes are merged into one inner edge with several keys.
+_TrieNode = Tuple[
+    Tuple[Tuple[KeyType, Hashable], ...],
+    Tuple[Tuple[Tuple[KeyType, ...], Any], ...],
+    Tuple[Hashable, ...],
+]
+
+
+def _walk(node: _TrieNode, value: Any, results: Any, default: Any) -> None:
+    """Walks a prefix trie over `value`, storing found values into `results` slots."""
+    leaves, edges, _ = node
+    if leaves:
+        if value.__class__ is dict:
+            get = value.get
+            for key, slot in leaves:
+                results[slot] = get(key, default)
+        else:
+            for key, slot in leaves:
+                try:  # noqa: SIM105 - faster than `contextlib.suppress`
+                    results[slot] = value[key]
+                except (KeyError, IndexError, TypeError):  # noqa: PERF203
+                    pass
+
+    for keys, child in edges:
+        item = value
+        try:
+            for key in keys:
+                item = item[key]
+        except (KeyError, IndexError, TypeError):
+            continue  # slots of the whole subtree keep the default value
+
+        for slot in child[2]:
+            results[slot] = item
+        _walk(child, item, results, default)
+
+
+class NgetMany(NamedTuple):
+    """
+    Pre-built prefix trie for extracting many paths in one pass.
+
+    Created by `nget_many`, shared prefixes of the paths are walked only once.
+    """
+
+    names: Union[Tuple[Hashable, ...], None]
+    trie: _TrieNode
+    size: int
+
+    def get(
+        self, dct: NestedDict, default: Any = None
+    ) -> Union[Dict[Hashable, Any], Tuple[Any, ...]]:
+        """Retrieves all paths, using `default` for the ones not found."""
+        names, trie, size = self
+        results: Any = (
+            [default] * size if names is None else dict.fromkeys(names, default)
+        )
+
+        for slot in trie[2]:
+            results[slot] = dct
+        _walk(trie, dct, results, default)
+
+        return results if names is not None else tuple(results)
+
+
+@lru_cache(maxsize=PATH_CACHE_SIZE)
+def _build_many(
+    paths: Tuple[ItemType, ...], names: Union[Tuple[Hashable, ...], None]
+) -> NgetMany:
+    slots = names if names is not None else range(len(paths))
+    trie: Tuple[Dict[KeyType, Any], List[Hashable]] = ({}, [])
+    for slot, path in zip(slots, paths):
+        node = trie
+        for key in _parse_keys((path,)):
+            node = node[0].setdefault(key, ({}, []))
+        node[1].append(slot)
+
+    return NgetMany(names, _freeze_trie(trie), len(paths))
+
+
+def compile_many(
+    paths: Union[Mapping[Hashable, ItemType], Sequence[ItemType]],
+) -> NgetMany:
+    """
+    Merges paths into a reusable prefix trie for `nget_many`.
+
+    Also available as `nget_many.compile`.
 
+    Args:
+        paths: A mapping of names to paths or a sequence of paths, the same as
+            for `nget_many`.
+
+    Returns:
+        NgetMany: The compiled paths.
+
+    Example:
+        >>> user = nget_many.compile({'name': 'user.name', 'city': 'user.address.city'})
+        >>> user.get(data)
+        {'name': 'Ivan', 'city': 'Kyiv'}
+    """
+    if isinstance(paths, Mapping):
+        return _build_many(tuple(paths.values()), tuple(paths))
+
+    return _build_many(tuple(paths), None)
+
+
+def _freeze_trie(node: Tuple[Dict[KeyType, Any], List[Hashable]]) -> _TrieNode:
+    """Converts a dict-based trie into tuples, merging chains of single-child nodes."""
+    children, slots = node
+    leaves = []
+    edges = []
+    for key, child in children.items():
+        if not child[0] and len(child[1]) == 1:
+            leaves.append((key, child[1][0]))
+            continue
+
+        keys = [key]
+        while len(child[0]) == 1 and not child[1]:
+            ((next_key, next_child),) = child[0].items()
+            keys.append(next_key)
+            child = next_child  # noqa: PLW2901
+        edges.append((tuple(keys), _freeze_trie(child)))
+
+    return tuple(leaves), tuple(edges), tuple(slots)
+
+
+def nget_many(
+    dct: NestedDict,
+    paths: Union[Mapping[Hashable, ItemType], Sequence[ItemType], NgetMany],
+    default: Any = None,
+) -> Union[Dict[Hashable, Any], Tuple[Any, ...]]:
+    """
+    Nested get of many paths at once.
+    Merges the paths into a prefix trie, so shared prefixes are walked only once.
+    Tries are cached, so the same set of paths is merged only once as well.
+
+    Args:
+        dct: The dictionary to traverse.
+        paths: A mapping of names to paths or a sequence of paths.
+            A path is a key, an index, a dotted path or a compiled path.
+            Paths compiled with `nget_many.compile` are accepted as well.
+        default: The default value for paths that are not found.
+
+    Returns:
+        A dict with the same names as `paths` if it is a mapping,
+        a tuple of values in the order of `paths` otherwise.
+
+    Example:
+        >>> data = {'result': {'users': [{'name': 'Ivan', 'city': 'Kyiv'}]}}
+        >>> nget_many(data, {'name': 'result.users.0.name', 'zip': 'result.users.0.zip'})
+        {'name': 'Ivan', 'zip': None}
+        >>> nget_many(data, ['result.users.0.name', 'result.users.0.city'])
+        ('Ivan', 'Kyiv')
+    """
+    if not isinstance(paths, NgetMany):
+        paths = compile_many(paths)
+
+    return paths.get(dct, default)
+
+
+_MISSING = object()
+
+
+@cache
+def _column_getter(depth: int) -> Callable[..., List[Any]]:
+    """
+    Generates a column getter for paths of the given depth:
+    `[record[k0][k1]...[kN] for record in records]` with a default on misses.
+
+    Subscripts are chained directly in the loop body, which is several times faster
+    than walking a key list per record. The source depends only on the depth,
+    keys are passed as arguments.
+    """
+    args = "".join(f", k{i}" for i in range(depth))
+    chain = "".join(f"[k{i}]" for i in range(depth))
+    source = (
+        f"def getter(records, default{args}):\n"
+        "    values = []\n"
+        "    append = values.append\n"
+        "    for record in records:\n"
+        "        try:\n"
+        f"            append(record{chain})\n"
+        "        except (KeyError, IndexError, TypeError):\n"
+        "            append(default)\n"
+        "    return values\n"
+    )
+    namespace: Dict[str, Any] = {}
+    exec(source, namespace)  # noqa: S102
+    return namespace["getter"]
+
+
+def nget_column(
+    records: Iterable[NestedDict],
+    *items: ItemType,
+    default: Any = None,
+    dtype: Any = None,
+    masked: bool = False,
+) -> Any:
+    """
+    Columnar nested get.
+    Retrieves the same nested item from every record of a collection,
+    with the same keys and defaults as `nget`.
+
+    The path is parsed once and followed by a loop specialized for its depth,
+    instead of calling `nget` per record.
+
+    Args:
+        records: The dictionaries to traverse.
+        items: A sequence of keys or indices to follow in every record.
+        default: The value to use for records where any key/index is not found.
+        dtype: An `array` typecode to return a typed `array.array`,
+            or a NumPy dtype if `masked` is set.
+        masked: Return a NumPy masked array where missing values are masked.
+            Requires NumPy to be installed.
+
+    Returns:
+        A list of values, an `array.array` if `dtype` is a typecode,
+        or a `numpy.ma.MaskedArray` if `masked` is set.
+
+    Raises:
+        ImportError: If `masked` is set and NumPy is not installed.
+        ValueError: If `dtype` is not a valid `array` typecode.
+
+    Example:
+        >>> records = [{'user': {'age': 30}}, {'user': {}}, {'user': {'age': 7}}]
+        >>> nget_column(records, 'user.age')
+        [30, None, 7]
+        >>> nget_column(records, 'user.age', default=0, dtype='q')
+        array('q', [30, 0, 7])
+        >>> nget_column(records, 'user.age', dtype='int64', masked=True).mask
+        array([False,  True, False])
+    """
+    keys = _parse_keys(items)
+    getter = _column_getter(len(keys))
+
+    if masked:
+        return _masked_column(getter(records, _MISSING, *keys), default, dtype)
+
+    values = getter(records, default, *keys)
+    if dtype is None:
+        return values
+
+    if not (isinstance(dtype, str) and len(dtype) == 1 and dtype in typecodes):
+        msg = f"Invalid array typecode: {dtype!r}."
+        raise ValueError(msg)
+
+    return array(dtype, values)
+
+
+def _masked_column(values: List[Any], default: Any, dtype: Any) -> Any:
+    """Builds a NumPy masked array, masking values that were not found."""
+    try:
+        import numpy as np  # noqa: PLC0415
+    except ImportError as e:
+        msg = "NumPy is required for masked columns."
+        raise ImportError(msg) from e
+
+    mask = np.fromiter(
+        (value is _MISSING for value in values), dtype=bool, count=len(values)
+    )
+    if mask.any():
+        data = np.zeros(len(values), dtype=dtype if dtype is not None else object)
+        found = ~mask
+        data[found] = [value for value in values if value is not _MISSING]
+    else:
+        data = np.array(values, dtype=dtype)
+
+    return np.ma.masked_array(data, mask=mask, fill_value=default)
+
+
+WILDCARD = "*"
+
+
+@cache
+def _slice_re() -> "re.Pattern[str]":
+    """Compiles the `start:stop:step` regex, only patterns with slices import `re`."""
+    import re  # noqa: PLC0415
+
+    return re.compile(r"-?\d*:-?\d*(:-?\d*)?")
+
+
+class PatternSlice(NamedTuple):
+    """A `start:stop:step` part of a pattern, the part is kept as a key of mappings."""
+
+    part: str
+    slice: slice
+
+
+PatternKey = Union[KeyType, slice, PatternSlice]
+
+
+def _pattern_key(part: str, dotted: bool) -> PatternKey:
+    """Converts a part of a pattern into a key, an index, a wildcard or a slice."""
+    if dotted and part.isdigit():
+        return int(part)
+    if ":" in part and _slice_re().fullmatch(part):
+        bounds = [int(bound) if bound else None for bound in part.split(":")]
+        if bounds[2:] == [0]:
+            msg = f"Slice step cannot be zero, got '{part}'."
+            raise ValueError(msg)
+        return PatternSlice(part, slice(*bounds))
+    return part
+
+
+@lru_cache(maxsize=PATH_CACHE_SIZE)
+def _split_pattern(pattern: str) -> Tuple[PatternKey, ...]:
+    """
+    Splits a pattern into keys, converting `start:stop:step` parts to slices:
+    'result.users.*.tags.0:2' -> ('result', 'users', '*', 'tags', <slice 0:2>)
+
+    Numeric parts are converted to indices only in dotted patterns, as in `nget`.
+    """
+    if "." not in pattern:
+        return (_pattern_key(pattern, dotted=False),)
+
+    return tuple(_pattern_key(part, dotted=True) for part in pattern.split("."))
+
+
+class NgetPattern(NamedTuple):
+    """
+    Immutable pre-parsed pattern for `nget_iter`.
+
+    Created by `nget_iter.compile(...)`. Can be reused for any number of lookups.
+    """
+
+    keys: Tuple[PatternKey, ...]
+
+    def iter(self, dct: NestedDict, default: Any = None) -> Iterator[Any]:
+        """Lazily yields the items matching this pattern, see `nget_iter`."""
+        return _expand(dct, self.keys, default)
+
+    __call__ = iter
+
+
+def compile_pattern(*items: Union[ItemType, NgetPattern]) -> NgetPattern:
+    """
+    Parses `nget_iter` keys once and returns a reusable, immutable pattern object.
+
+    Also available as `nget_iter.compile`.
+
+    Example:
+        >>> streets = nget_iter.compile('result.users.*.address.street')
+        >>> list(streets.iter(data))
+        ['Main St', 'Baker St']
+    """
+    keys: List[PatternKey] = []
     for item in items:
-        if isinstance(item, str) and "." in item:
-            parts = item.split(".")
-            for part in parts:
-                # Convert numeric strings to integers for list indexing
-                if part.isdigit():
-                    keys.append(int(part))
-                else:
-                    keys.append(part)
+        if isinstance(item, str):
+            keys.extend(_split_pattern(item))
+        elif isinstance(item, (NgetPath, NgetPattern)):
+            keys.extend(item.keys)
         else:
             keys.append(item)
 
-    try:
-        for key in keys:
-            dct = dct[key]
-    except (KeyError, IndexError, TypeError):
-        return default
+    return NgetPattern(tuple(keys))
 
-    return dct
+
+def _children(
+    value: Any, key: Union[str, slice, PatternSlice]
+) -> Optional[Iterator[Any]]:
+    """Lazily iterates the children selected by a wildcard or a slice."""
+    if isinstance(value, Mapping):
+        if key == WILDCARD:
+            return iter(value.values())
+        if isinstance(key, PatternSlice) and key.part in value:  # a key like '10:30'
+            return iter((value[key.part],))
+        return None
+    if not isinstance(value, Sequence) or isinstance(value, (str, bytes)):
+        return None
+    if key == WILDCARD:
+        return iter(value)
+    if isinstance(key, PatternSlice):
+        key = key.slice
+
+    return map(value.__getitem__, range(*key.indices(len(value))))  # type: ignore[union-attr]
+
+
+def _expand(value: Any, keys: Tuple[PatternKey, ...], default: Any) -> Iterator[Any]:
+    for index, key in enumerate(keys):
+        if key == WILDCARD or isinstance(key, (slice, PatternSlice)):
+            children = _children(value, key)
+            if children is None:
+                yield default
+                return
+
+            rest = keys[index + 1 :]
+            for child in children:
+                yield from _expand(child, rest, default)
+            return
+
+        try:
+            value = value[key]
+        except (KeyError, IndexError, TypeError):
+            yield default
+            return
+
+    yield value
+
+
+def nget_iter(
+    dct: NestedDict, *items: Union[ItemType, NgetPattern], default: Any = None
+) -> Iterator[Any]:
+    """
+    Nested get with wildcards and slices.
+    Lazily yields every item matching the pattern, without copying the containers,
+    so consumers can stop early.
+
+    Patterns are the same as for `nget` with two additions:
+    - `*` matches every item of a list or every value of a dictionary;
+    - `start:stop:step` matches a slice of a list, e.g. `0:100` or `-10:`,
+      and is looked up as a plain key in dictionaries.
+    Branches where any key/index is not found yield the default value.
+    Parsed patterns are cached the same way as `nget` paths.
+
+    Args:
+        dct: The dictionary to traverse.
+        items: A sequence of keys, indices, wildcards or slices to follow.
+        default: The value to yield for branches that are not found.
+
+    Returns:
+        An iterator over the matching items.
+
+    Example:
+        >>> data = {'users': [{'name': 'Ivan', 'tags': ['a', 'b']}, {'name': 'Juan'}]}
+        >>> list(nget_iter(data, 'users.*.name'))
+        ['Ivan', 'Juan']
+        >>> list(nget_iter(data, 'users.0:1.name'))
+        ['Ivan']
+        >>> list(nget_iter(data, 'users.*.tags.0', default='-'))
+        ['a', '-']
+    """
+    if len(items) == 1 and isinstance(items[0], NgetPattern):
+        return _expand(dct, items[0].keys, default)
+
+    return _expand(dct, compile_pattern(*items).keys, default)
+
+
+nget.compile = compile_path  # type: ignore[attr-defined]
+nget_many.compile = compile_many  # type: ignore[attr-defined]
+nget_iter.compile = compile_pattern  # type: ignore[attr-defined]
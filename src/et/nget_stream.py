@@ -0,0 +1,320 @@
+import codecs
+import json
+import re
+from collections.abc import Iterator, Mapping, Sequence
+from os import PathLike
+from pathlib import Path
+from typing import IO, Any, Callable, Hashable, List, Optional, Tuple, Union
+
+from .nget import WILDCARD, ItemType, KeyType, NgetPath, _parse_keys, compile_many
+
+CHUNK_SIZE = 64 * 1024
+
+Source = Union[str, "PathLike[str]", IO[str], IO[bytes]]
+Paths = Union[ItemType, Mapping[Hashable, ItemType], Sequence[ItemType]]
+
+NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+# skips strings and other values up to the next bracket, a string cut by the end
+# of the buffer or the end
+_SKIP_TO_BRACKET = re.compile(
+    r'[^"\[\]{}]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"\[\]{}]*)*([\[\]{}]|"|\Z)', re.DOTALL
+)
+# a value cut at the end of the buffer fails this close to the end, e.g. `fals`, `1.5e`
+# or a partial `\uXXXX` escape, other errors are reported without reading further
+_CUT_VALUE_CHARS = 16
+_NUMBER_TAIL = re.compile(r"[0-9.eE+-]*\Z")
+
+
+class _Reader:
+    """Incremental JSON reader decoding one value at a time from a file object."""
+
+    def __init__(self, file: Union[IO[str], IO[bytes]], chunk_size: int) -> None:
+        self._read = file.read
+        self._chunk_size = chunk_size
+        self._bytes_decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Reads the next chunk into the buffer. Returns False at the end of the file."""
+        if self.eof:
+            return False
+
+        # read at least as much as is buffered, so long values are not re-decoded often
+        chunk = self._read(max(self._chunk_size, len(self.buffer) - self.pos))
+        if isinstance(chunk, bytes):
+            chunk = self._bytes_decoder.decode(chunk, final=not chunk)
+        if not chunk:
+            self.eof = True
+            return False
+
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Skips whitespace and returns the next character, or '' at the end."""
+        while True:
+            buffer = self.buffer
+            pos = self.pos
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self.pos = pos
+
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        """Consumes the next character, which must be `char`."""
+        if self.peek() != char:
+            msg = f"Expecting '{char}'"
+            raise json.JSONDecodeError(msg, self.buffer, self.pos)
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decodes the next JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as e:
+                cut = e.pos >= len(self.buffer) - _CUT_VALUE_CHARS or e.msg.startswith(
+                    "Unterminated string"
+                )
+                if cut and self.fill():
+                    continue
+                raise
+
+            # a number at the end of the buffer may continue in the next chunk,
+            # e.g. `-25` of `-2500.0` or `-2500` of a buffer ending with `-2500.`
+            if _NUMBER_TAIL.match(self.buffer, end) and self.fill():
+                continue
+
+            self.pos = end
+            return value
+
+    def skip(self) -> None:
+        """
+        Skips the next JSON value without decoding it, reading only as much
+        as is needed to find its end, so skipped containers are not kept in memory.
+        """
+        if self.peek() not in ("{", "["):
+            self.value()  # a scalar
+            return
+
+        depth = 0
+        while True:
+            for match in _SKIP_TO_BRACKET.finditer(self.buffer, self.pos):
+                bracket = match.group(1)
+                if bracket in ('"', ""):  # need more of the file
+                    self.pos = match.start(1)
+                    break
+                self.pos = match.end()
+                depth += 1 if bracket in "{[" else -1
+                if not depth:
+                    return
+
+            if not self.fill():
+                msg = "Unterminated value"
+                raise json.JSONDecodeError(msg, self.buffer, self.pos)
+
+    def separator(self, end: str) -> bool:
+        """Consumes ',' or the `end` of a container. Returns False for the end."""
+        char = self.peek()
+        self.pos += 1
+        if char == ",":
+            return True
+        if char == end:
+            return False
+
+        msg = f"Expecting ',' or '{end}'"
+        raise json.JSONDecodeError(msg, self.buffer, self.pos - 1)
+
+    def members(self) -> Iterator[KeyType]:
+        """
+        Iterates the keys of the next object or the indices of the next array.
+        After each key the reader is positioned at its value, which must be consumed
+        before the next iteration.
+        """
+        opening = self.peek()
+        if opening not in ("{", "["):  # '' at the end of the file
+            return
+
+        self.pos += 1
+        closing = "}" if opening == "{" else "]"
+        if self.peek() == closing:
+            self.pos += 1
+            return
+
+        index = 0
+        while True:
+            if opening == "{":
+                key = self.value()
+                self.expect(":")
+                yield key
+            else:
+                yield index
+                index += 1
+
+            if not self.separator(closing):
+                return
+
+
+def _find(reader: _Reader, key: KeyType) -> bool:
+    """Moves the reader to the value of `key` in the next container."""
+    for item_key in reader.members():
+        if item_key == key:
+            return True
+        reader.skip()  # a sibling
+
+    return False
+
+
+def _elements(
+    reader: _Reader, prefix: Tuple[KeyType, ...], ndjson: bool
+) -> Iterator[Any]:
+    """Yields elements of the container at `prefix`, decoding one element at a time."""
+    if ndjson:
+        while reader.peek():
+            yield reader.value()
+        return
+
+    for key in prefix:
+        if not _find(reader, key):
+            return
+
+    if reader.peek() not in ("", "{", "["):
+        reader.skip()  # a scalar has no elements
+    for _ in reader.members():
+        yield reader.value()
+
+    if not prefix and reader.peek():
+        msg = "Extra data after the top-level value, pass ndjson=True for NDJSON"
+        raise json.JSONDecodeError(msg, reader.buffer, reader.pos)
+
+
+def _split_paths(
+    keys: List[Tuple[KeyType, ...]], ndjson: bool
+) -> Tuple[Tuple[KeyType, ...], List[NgetPath]]:
+    """Splits paths into the common prefix up to the wildcard and per-element paths."""
+    prefixes = set()
+    rest = []
+    for path in keys:
+        if WILDCARD not in path:
+            msg = f"Path {path} has no '{WILDCARD}' wildcard to stream over."
+            raise ValueError(msg)
+
+        index = path.index(WILDCARD)
+        prefixes.add(path[:index])
+        rest.append(NgetPath(path[index + 1 :]))
+
+    if len(prefixes) > 1:
+        msg = (
+            f"Paths must stream over the same container, got prefixes {sorted(prefixes)}."
+        )
+        raise ValueError(msg)
+
+    (prefix,) = prefixes
+    if ndjson and prefix:
+        msg = f"NDJSON lines are streamed over with a leading '{WILDCARD}', got {prefix}."
+        raise ValueError(msg)
+
+    return prefix, rest
+
+
+def nget_stream(
+    source: Source,
+    paths: Paths,
+    default: Any = None,
+    chunk_size: int = CHUNK_SIZE,
+    ndjson: Optional[bool] = None,
+) -> Iterator[Any]:
+    """
+    Streaming nested get.
+    Reads a JSON or NDJSON file incrementally and yields only the requested values.
+
+    Paths are the same as for `nget` with a single `*` wildcard that marks the array
+    to stream over:
+    - `*.user.name` - elements of a top-level array or lines of an NDJSON file;
+    - `result.users.*.name` - elements of an array nested in the document.
+    Elements are decoded one at a time, only the part of the path after `*`
+    is looked up in every element. Like in `nget_iter`, `*` over an object
+    iterates its values. Values before the array are skipped without being decoded,
+    so peak memory is bounded by the largest element or string, not by the file size.
+
+    A file is read as a single JSON document, unless `ndjson=True` is passed
+    or it is a path ending with `.ndjson` or `.jsonl`.
+
+    Args:
+        source: A file path or a file object opened in text or binary mode.
+        paths: A single path, a mapping of names to paths or a sequence of paths.
+            All paths must have the same prefix up to the `*` wildcard.
+        default: The default value for paths that are not found in an element.
+        chunk_size: The number of characters or bytes to read at once.
+        ndjson: True to read lines of an NDJSON file as elements, False to read
+            a single JSON document, None to decide by the file name.
+
+    Returns:
+        An iterator over the values of every element for a single path,
+        over dicts for a mapping of paths, or over tuples for a sequence of paths.
+
+    Raises:
+        ValueError: If a path has no `*` wildcard, paths stream over different arrays,
+            or the file is NDJSON and `*` is not the first key.
+        json.JSONDecodeError: If the file is not a valid JSON or NDJSON.
+
+    Example:
+        >>> # users.ndjson: {"name": "Ivan", "age": 30}\\n{"name": "Juan"}
+        >>> list(nget_stream('users.ndjson', '*.name'))
+        ['Ivan', 'Juan']
+        >>> # export.json: {"result": {"users": [{"id": 1, "age": 30}, {"id": 2}]}}
+        >>> list(nget_stream('export.json', ['result.users.*.id', 'result.users.*.age']))
+        [(1, 30), (2, None)]
+    """
+    if ndjson is None:
+        ndjson = isinstance(source, (str, PathLike)) and str(source).endswith(
+            NDJSON_SUFFIXES
+        )
+
+    if isinstance(paths, (str, int, NgetPath)):
+        prefix, (path,) = _split_paths([_parse_keys((paths,))], ndjson)
+        return _stream(
+            source, prefix, chunk_size, ndjson, lambda element: path.get(element, default)
+        )
+
+    if isinstance(paths, Mapping):
+        prefix, rest = _split_paths(
+            [_parse_keys((path,)) for path in paths.values()], ndjson
+        )
+        many = compile_many(dict(zip(paths, rest)))
+    else:
+        prefix, rest = _split_paths([_parse_keys((path,)) for path in paths], ndjson)
+        many = compile_many(rest)
+
+    return _stream(
+        source, prefix, chunk_size, ndjson, lambda element: many.get(element, default)
+    )
+
+
+def _stream(
+    source: Source,
+    prefix: Tuple[KeyType, ...],
+    chunk_size: int,
+    ndjson: bool,
+    extract: Callable[[Any], Any],
+) -> Iterator[Any]:
+    """Opens the source if needed and yields extracted values of every element."""
+    if isinstance(source, (str, PathLike)):
+        with Path(source).open("rb") as file:
+            yield from _stream(file, prefix, chunk_size, ndjson, extract)
+        return
+
+    reader = _Reader(source, chunk_size)
+    for element in _elements(reader, prefix, ndjson):
+        yield extract(element)
@@ -0,0 +1,216 @@
+from collections.abc import Mapping, Sequence
+from copy import copy
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, TypeVar
+
+from .nget import PATH_CACHE_SIZE, ItemType, KeyType, _parse_keys
+
+T = TypeVar("T")
+
+# Update trie node: edges of `(key, subtrie, None, path)` for paths going deeper
+# and `(key, None, slot, path)` for paths ending one key below the node,
+# where `slot` is the index of the new value and `path` are the keys up to the child.
+_TrieNode = Tuple[Tuple[KeyType, Any, Optional[int], Tuple[KeyType, ...]], ...]
+
+
+def _location(keys: Tuple[KeyType, ...], depth: int) -> str:
+    """Formats the path to a container for error messages."""
+    return f"at {'.'.join(map(str, keys[:depth]))!r}" if depth else "at the root"
+
+
+def _is_sequence(container: Any) -> bool:
+    return isinstance(container, Sequence) and not isinstance(container, (str, bytes))
+
+
+def _index(container: Any, keys: Tuple[KeyType, ...], depth: int) -> int:
+    """Checks that a key of the path is a valid index of a sequence."""
+    key = keys[depth]
+    if not isinstance(key, int):
+        raise _not_container(container, keys, depth)
+    if not -len(container) <= key < len(container):
+        msg = f"Index {key!r} out of range {_location(keys, depth)}."
+        raise IndexError(msg)
+
+    return key
+
+
+def _child(container: Any, keys: Tuple[KeyType, ...], depth: int) -> Any:
+    """
+    Returns the item of a container on the path to a new value.
+    A missing key of a mapping gets a new dict, so the path is created.
+    """
+    if type(container) is dict or isinstance(container, Mapping):
+        return container.get(keys[depth], {})
+    if type(container) is list or _is_sequence(container):
+        return container[_index(container, keys, depth)]
+
+    raise _not_container(container, keys, depth)
+
+
+def _not_container(container: Any, keys: Tuple[KeyType, ...], depth: int) -> TypeError:
+    """Returns the error for a key that can't be set in a container."""
+    name = type(container).__name__
+    msg = f"Cannot set {keys[depth]!r} in {name} {_location(keys, depth)}."
+    return TypeError(msg)
+
+
+def _replace(container: Any, items: Dict[KeyType, Any], keys: Tuple[KeyType, ...]) -> Any:
+    """
+    Returns a shallow copy of a container with items replaced.
+    `keys` is the path to the container, used for error messages.
+    """
+    depth = len(keys)
+    if type(container) is dict:
+        copied = container.copy()
+        copied.update(items)
+        return copied
+
+    if isinstance(container, Mapping):
+        copied = copy(container)
+        copied.update(items)
+        return copied
+
+    if not _is_sequence(container):
+        raise _not_container(container, (*keys, next(iter(items))), depth)
+
+    copied = list(container) if isinstance(container, tuple) else copy(container)
+    for key, value in items.items():
+        copied[_index(container, (*keys, key), depth)] = value
+
+    return tuple(copied) if isinstance(container, tuple) else copied
+
+
+def nset(dct: T, path: ItemType, value: Any) -> T:
+    """
+    Nested set.
+    Returns a new document with the item at a path set to a value,
+    leaving the original document intact.
+
+    Only the containers along the path are copied (path copying), the rest
+    of the document is shared with the original, so updates of large documents
+    are cheap compared to `copy.deepcopy`. Missing keys of dicts are created.
+
+    Args:
+        dct: The document to update.
+        path: A key, an index, a dotted path or a compiled path, the same as for `nget`.
+        value: The value to set.
+
+    Returns:
+        The updated copy of the document.
+
+    Raises:
+        IndexError: If an index is out of range of a list.
+        TypeError: If a value on the path is not a dict or a list.
+
+    Example:
+        >>> data = {'result': {'users': [{'name': 'Ivan'}]}, 'meta': {'page': 1}}
+        >>> updated = nset(data, 'result.users.0.address.city', 'Kyiv')
+        >>> updated['result']['users'][0]
+        {'name': 'Ivan', 'address': {'city': 'Kyiv'}}
+        >>> data['result']['users'][0]
+        {'name': 'Ivan'}
+        >>> updated['meta'] is data['meta']
+        True
+    """
+    keys = _parse_keys((path,))
+
+    # walk down to the container of the new value, then copy the path bottom up
+    containers = [dct]
+    for depth in range(len(keys) - 1):
+        containers.append(_child(containers[-1], keys, depth))
+
+    for depth in range(len(keys) - 1, -1, -1):
+        container, key = containers[depth], keys[depth]
+        if type(container) is dict:  # the common case
+            copied = container.copy()
+            copied[key] = value
+            value = copied
+        else:
+            value = _replace(container, {key: value}, keys[:depth])
+
+    return value
+
+
+@lru_cache(maxsize=PATH_CACHE_SIZE)
+def _build_trie(paths: Tuple[ItemType, ...]) -> _TrieNode:
+    """
+    Merges update paths into a trie, so shared containers are copied only once.
+    Tries are cached, so the same set of paths is merged only once.
+    """
+    trie: Dict[KeyType, Any] = {}
+    for slot, path in enumerate(paths):
+        keys = _parse_keys((path,))
+        node = trie
+        for depth, key in enumerate(keys):
+            last = depth == len(keys) - 1
+            if key in node and (last or isinstance(node[key], int)):
+                conflict = ".".join(map(str, keys[: depth + 1]))
+                msg = f"Conflicting paths: {conflict!r} is updated twice."
+                raise ValueError(msg)
+
+            if last:
+                node[key] = slot
+            else:
+                node = node.setdefault(key, {})
+
+    return _freeze_trie(trie, ())
+
+
+def _freeze_trie(node: Dict[KeyType, Any], keys: Tuple[KeyType, ...]) -> _TrieNode:
+    """Converts a dict-based trie into tuples with the path to every child."""
+    return tuple(
+        (
+            (key, None, child, (*keys, key))
+            if isinstance(child, int)
+            else (key, _freeze_trie(child, (*keys, key)), None, (*keys, key))
+        )
+        for key, child in node.items()
+    )
+
+
+def _apply(
+    container: Any, trie: _TrieNode, values: Tuple[Any, ...], keys: Tuple[KeyType, ...]
+) -> Any:
+    """Returns a copy of a container with the updates of a trie applied."""
+    items = {}
+    for key, subtrie, slot, path in trie:
+        if subtrie is None:
+            items[key] = values[slot]
+        else:
+            child = _child(container, path, len(keys))
+            items[key] = _apply(child, subtrie, values, path)
+
+    return _replace(container, items, keys)
+
+
+def nupdate(dct: T, updates: Mapping[ItemType, Any]) -> T:
+    """
+    Nested update of many paths at once.
+    Returns a new document with the items at the paths set to values,
+    leaving the original document intact.
+
+    Same as calling `nset` for every path, but every container along the paths
+    is copied only once, the rest of the document is shared with the original.
+
+    Args:
+        dct: The document to update.
+        updates: A mapping of paths to values. A path is a key, an index,
+            a dotted path or a compiled path, the same as for `nget`.
+
+    Returns:
+        The updated copy of the document.
+
+    Raises:
+        ValueError: If a path is updated twice or is a prefix of another path.
+        IndexError: If an index is out of range of a list.
+        TypeError: If a value on a path is not a dict or a list.
+
+    Example:
+        >>> data = {'user': {'name': 'Ivan', 'tags': ['a']}, 'meta': {'page': 1}}
+        >>> nupdate(data, {'user.name': 'Juan', 'user.tags.0': 'b', 'user.age': 30})
+        {'user': {'name': 'Juan', 'tags': ['b'], 'age': 30}, 'meta': {'page': 1}}
+    """
+    if not updates:
+        return dct
+
+    return _apply(dct, _build_trie(tuple(updates)), tuple(updates.values()), ())
@@ -0,0 +1,180 @@
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from .destruct import compile_extractor
+from .nget import ItemType, NestedDict, NgetMany, compile_many
+
+Paths = Union[Mapping[Hashable, ItemType], Sequence[ItemType], NgetMany]
+ChunkExtractor = Callable[[List[Any]], List[Any]]
+
+# Chunks submitted to the pool per worker before waiting for the oldest one,
+# enough to keep workers busy while results are consumed
+CHUNKS_PER_WORKER = 2
+
+# Set in worker processes by `_init_worker`
+_extract_chunk: Optional[ChunkExtractor] = None
+
+
+class _Job(NamedTuple):
+    """What to extract, sent to every worker process once."""
+
+    paths: Optional[Paths]
+    keys: Optional[Sequence[str]]
+    default: Any
+    loads: Optional[Callable[[Any], NestedDict]]
+
+    def compile(self) -> ChunkExtractor:
+        """Compiles the extraction of a chunk of records."""
+        extract_many = (
+            compile_extractor(self.keys, self.default).many
+            if self.keys is not None
+            else _paths_extractor(self.paths, self.default)  # type: ignore[arg-type]
+        )
+        loads = self.loads
+        if loads is None:
+            return extract_many
+        return lambda chunk: extract_many(list(map(loads, chunk)))
+
+
+def _paths_extractor(paths: Paths, default: Any) -> ChunkExtractor:
+    """Compiles `nget_many` of a chunk of records."""
+    get = (paths if isinstance(paths, NgetMany) else compile_many(paths)).get
+    default = None if default is ... else default
+    return lambda chunk: [get(record, default) for record in chunk]
+
+
+def _init_worker(job: _Job) -> None:
+    """Compiles the extraction once per worker process."""
+    global _extract_chunk  # noqa: PLW0603
+
+    _extract_chunk = job.compile()
+
+
+def _run_chunk(chunk: List[Any]) -> List[Any]:
+    """Extracts values from a chunk of records in a worker process."""
+    return _extract_chunk(chunk)  # type: ignore[misc]
+
+
+def _chunks(records: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Reads records lazily in lists of `size`."""
+    iterator = iter(records)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def extract(  # noqa: PLR0913
+    records: Iterable[Any],
+    paths: Optional[Paths] = None,
+    *,
+    keys: Optional[Sequence[str]] = None,
+    default: Any = ...,
+    workers: Optional[int] = None,
+    chunksize: int = 1000,
+    loads: Optional[Callable[[Any], NestedDict]] = None,
+) -> Iterator[Any]:
+    """
+    Extracts values from every record of a large dataset in a pool of processes.
+
+    Records are read lazily and sent to worker processes in chunks. At most
+    `CHUNKS_PER_WORKER * workers` chunks are in flight, so memory stays bounded
+    however many records there are. Results are yielded in the order of records.
+
+    Args:
+        records: An iterable of records, or of encoded records with `loads`.
+        paths: Paths to extract with `nget_many`: a mapping of names to paths
+            or a sequence of paths.
+        keys: Keys to extract with `destruct` instead of `paths`.
+        default: The default value for missing paths or keys. Missing paths are None
+            by default, missing keys raise KeyError by default.
+        workers: The number of worker processes, `os.cpu_count()` by default.
+            With one worker, records are extracted in the current process.
+        chunksize: The number of records sent to a worker at once. Bigger chunks
+            cost less to dispatch and more memory.
+        loads: A function that decodes records in worker processes, e.g. `json.loads`
+            for lines of an NDJSON file. Raw lines are cheaper to send to workers
+            than decoded records, and decoding is usually the slowest part.
+
+    Returns:
+        An iterator of results per record: what `nget_many` returns for `paths`,
+        what `destruct` returns for `keys`.
+
+    Raises:
+        ValueError: If neither or both of `paths` and `keys` are given,
+            or if `workers` or `chunksize` is less than 1.
+        KeyError: If a key is missing and no default is given.
+
+    Example:
+        >>> records = (json.loads(line) for line in open('users.ndjson'))
+        >>> for name, city in extract(records, ['user.name', 'user.address.city']):
+        ...     print(name, city)
+        >>> with open('users.ndjson', 'rb') as lines:
+        ...     ids = list(extract(lines, keys=['id'], default=None, loads=json.loads))
+    """
+    if (paths is None) == (keys is None):
+        msg = "Either paths or keys must be given."
+        raise ValueError(msg)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        msg = f"Workers must be at least 1, got {workers}."
+        raise ValueError(msg)
+    if chunksize < 1:
+        msg = f"Chunk size must be at least 1, got {chunksize}."
+        raise ValueError(msg)
+
+    # compile in the current process as well, so invalid paths or keys fail early
+    job = _Job(paths, keys, default, loads)
+    extract_chunk = job.compile()
+    if workers == 1:
+        return (
+            result
+            for chunk in _chunks(records, chunksize)
+            for result in extract_chunk(chunk)
+        )
+
+    return _extract_in_pool(records, job, workers, chunksize)
+
+
+def _extract_in_pool(
+    records: Iterable[Any],
+    job: _Job,
+    workers: int,
+    chunksize: int,
+) -> Iterator[Any]:
+    """Extracts chunks in worker processes, see `extract`."""
+    with ProcessPoolExecutor(
+        workers, initializer=_init_worker, initargs=(job,)
+    ) as executor:
+        pending: Deque[Future[List[Any]]] = deque()
+        try:
+            for chunk in _chunks(records, chunksize):
+                if len(pending) >= CHUNKS_PER_WORKER * workers:
+                    yield from pending.popleft().result()
+                pending.append(executor.submit(_run_chunk, chunk))
+
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            # the consumer stopped early or a chunk failed
+            for future in pending:
+                future.cancel()
@@ -0,0 +1,151 @@
+import threading
+from dataclasses import fields
+from typing import Any, Dict, Optional, Type
+
+
+class ServicePool:
+    """
+    Per-thread free lists of instances of a service class, for services created
+    and discarded at a high rate, e.g. one per message. Created by `@service(pool=...)`.
+
+    `Svc.acquire(...)` takes a free instance of the current thread and initializes
+    its fields in place, or constructs a new one if there is none. The instance
+    is a context manager, leaving the outermost `with` block of the instance returns
+    it to the free list, unless the list already has `size` instances.
+
+    An instance is not reused if the `with` block exits with an exception,
+    so tracebacks and exception handlers never see it reinitialized.
+    A `Break` caught by `catch_a_break` is not an exception here, the instance
+    is reused. Attributes other than fields are dropped when an instance is
+    returned, field values are kept until the instance is reused. Nested `with`
+    blocks of an instance return it once, when the outermost one exits, so it is
+    not acquired again while a `with` block still uses it.
+
+    Pooling reduces allocations, not CPU time. In CPython, allocating a small
+    instance is cheaper than forwarding the arguments of `acquire` to `__init__`
+    and the `with` calls, a pooled message costs several times a construction,
+    and short-lived instances freed by reference counting don't trigger garbage
+    collections either way. Use it where allocations themselves are the problem,
+    e.g. memory fragmentation, use `slots=True` to make construction cheaper.
+    Don't keep references to an instance after its `with` block.
+
+    Args:
+        cls: The service class
+        size: The maximum number of free instances kept per thread
+
+    Raises:
+        ValueError: If `size` is less than 1
+    """
+
+    def __init__(self, cls: type, size: int) -> None:
+        if size < 1:
+            msg = f"Pool size must be at least 1, got {size}."
+            raise ValueError(msg)
+
+        self.cls = cls
+        self.size = size
+        self._fields = frozenset(field.name for field in fields(cls))
+        self._has_dict = cls.__dictoffset__ != 0  # not slotted
+        self._local = threading.local()
+
+    def _free(self) -> Dict[int, Any]:
+        """Returns the free instances of the current thread by their ids."""
+        try:
+            return self._local.free  # type: ignore[no-any-return]
+        except AttributeError:
+            free: Dict[int, Any] = {}
+            self._local.free = free
+            return free
+
+    def _entered(self) -> Dict[int, int]:
+        """Returns the depth of `with` blocks of the current thread by instance ids."""
+        try:
+            return self._local.entered  # type: ignore[no-any-return]
+        except AttributeError:
+            entered: Dict[int, int] = {}
+            self._local.entered = entered
+            return entered
+
+    def methods(self) -> Dict[str, Any]:  # noqa: C901
+        """Returns `acquire`, `__enter__` and `__exit__` to add to the service class."""
+        # the closures run once per message, so they only read locals
+        pooled, size, local = self.cls, self.size, self._local
+        free_list, entered_list = self._free, self._entered
+        field_names, has_dict = self._fields, self._has_dict
+        n_fields = len(field_names)
+
+        def acquire(cls: Type[Any], *args: Any, **kwargs: Any) -> Any:
+            """
+            Returns an instance initialized with the arguments, reused if possible.
+            Use it as a context manager, the instance is returned to the pool on exit.
+            """
+            if cls is pooled:
+                try:
+                    free = local.free
+                except AttributeError:
+                    free = free_list()
+                if free:
+                    svc = free.popitem()[1]
+                    cls.__init__(svc, *args, **kwargs)
+                    return svc
+
+            return cls(*args, **kwargs)
+
+        def enter(svc: Any) -> Any:
+            if type(svc) is pooled:
+                try:
+                    entered = local.entered
+                except AttributeError:
+                    entered = entered_list()
+                key = id(svc)
+                entered[key] = entered.get(key, 0) + 1
+            return svc
+
+        def exit_(svc: Any, exc_type: Optional[type], *_: Any) -> None:
+            if type(svc) is not pooled:  # or a subclass
+                return
+
+            try:
+                entered = local.entered
+            except AttributeError:
+                entered = entered_list()
+            key = id(svc)
+            depth = entered.pop(key, 0)
+            if depth > 1:  # an outer `with` block still uses it
+                entered[key] = depth - 1
+                return
+            if not depth or exc_type is not None:
+                return
+
+            try:
+                free = local.free
+            except AttributeError:
+                free = free_list()
+            # entered again after it was returned, e.g. through a kept reference
+            if len(free) >= size or key in free:
+                return
+
+            if has_dict:
+                attrs = svc.__dict__
+                if len(attrs) != n_fields:  # set by methods, drop them
+                    for name in [name for name in attrs if name not in field_names]:
+                        del attrs[name]
+            free[key] = svc
+
+        acquire.pool = self  # type: ignore[attr-defined]
+        return {
+            "acquire": classmethod(acquire),
+            "__enter__": enter,
+            "__exit__": exit_,
+        }
+
+    def clear(self) -> None:
+        """Drops free instances of the current thread."""
+        self._free().clear()
+
+    def __len__(self) -> int:
+        """Returns the number of free instances of the current thread."""
+        return len(self._free())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.cls.__name__}, size={self.size})"
@@ -0,0 +1,285 @@
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+from .nget import PATH_CACHE_SIZE, ItemType, KeyType, NestedDict, NgetPath, _parse_keys
+
+Accessor = Callable[..., Any]
+
+# Accessor steps: look a key up by indexing or with `.get` (for keys that may be
+# missing), optionally followed by a check for None (for values that may be null)
+_INDEX = "index"
+_GET = "get"
+_MISSING = object()
+
+
+class _Shape:
+    """
+    Shape of a value: keys of a dict with their shapes and keys present in every dict,
+    the shape of list elements, and whether the value may be None.
+    """
+
+    __slots__ = ("fields", "items", "nullable", "required")
+
+    def __init__(
+        self,
+        fields: Optional[Dict[Hashable, "_Shape"]] = None,
+        required: FrozenSet[Hashable] = frozenset(),
+        items: Optional["_Shape"] = None,
+        *,
+        nullable: bool = False,
+    ) -> None:
+        self.fields = fields
+        self.required = required
+        self.items = items
+        self.nullable = nullable
+
+    def merge(self, other: "_Shape") -> "_Shape":
+        """Merges shapes of values found at the same place of different documents."""
+        fields, required = self.fields, self.required
+        if fields is None:
+            fields, required = other.fields, other.required
+        elif other.fields is not None:
+            fields = dict(fields)
+            for key, shape in other.fields.items():
+                fields[key] = fields[key].merge(shape) if key in fields else shape
+            required = required & other.required
+
+        items = self.items
+        if items is None:
+            items = other.items
+        elif other.items is not None:
+            items = items.merge(other.items)
+
+        return _Shape(fields, required, items, nullable=self.nullable or other.nullable)
+
+
+def _sample_shape(value: Any) -> _Shape:
+    """Infers the shape of a sample value, shapes of list elements are merged."""
+    if value is None:
+        return _Shape(nullable=True)
+    if isinstance(value, dict):
+        fields = {key: _sample_shape(item) for key, item in value.items()}
+        return _Shape(fields, frozenset(fields))
+    if isinstance(value, list):
+        items = _Shape()
+        for i, item in enumerate(value):
+            items = _sample_shape(item) if i == 0 else items.merge(_sample_shape(item))
+        return _Shape(items=items)
+
+    return _Shape()
+
+
+def _type_shape(tp: Any) -> _Shape:
+    """Infers the shape of values of a type annotation."""
+    if tp is None or tp is type(None):
+        return _Shape(nullable=True)
+    if _is_typeddict(tp):
+        fields = {key: _type_shape(hint) for key, hint in get_type_hints(tp).items()}
+        return _Shape(fields, frozenset(tp.__required_keys__))
+
+    origin = get_origin(tp) or tp
+    if origin is Union or type(tp).__name__ == "UnionType":  # `Optional[X]`, `X | None`
+        shapes = [_type_shape(arg) for arg in get_args(tp)]
+        shape = shapes[0]
+        for other in shapes[1:]:
+            shape = shape.merge(other)
+        return shape
+    if origin in (list, Sequence):
+        args = get_args(tp)
+        return _Shape(items=_type_shape(args[0]) if args else _Shape())
+    if origin in (dict, Mapping):
+        return _Shape(fields={})  # keys are unknown, so any of them may be missing
+
+    return _Shape()
+
+
+def _is_typeddict(tp: Any) -> bool:
+    return isinstance(tp, type) and issubclass(tp, dict) and hasattr(tp, "__total__")
+
+
+@lru_cache(maxsize=PATH_CACHE_SIZE)
+def _accessor_factory(steps: Tuple[Tuple[str, bool], ...]) -> Callable[..., Accessor]:
+    """
+    Generates a factory of straight-line accessors for a sequence of steps.
+
+    Keys that are always present are looked up by indexing, keys that may be missing
+    with `.get` and values that may be None are checked, so expected misses return
+    the default without raising. Any other miss is caught once for the whole path,
+    for containers without `.get` the accessor falls back to `nget`.
+
+    The source depends only on the steps, keys are passed to the factory.
+    """
+    args = "".join(f", k{i}" for i in range(len(steps)))
+    lines = [
+        f"def factory(fallback{args}):",
+        "    def accessor(doc, default=None):",
+        "        try:",
+        "            value = doc",
+    ]
+    last = len(steps) - 1
+    for i, (step, null_check) in enumerate(steps):
+        if step == _INDEX:
+            lines.append(f"            value = value[k{i}]")
+        elif i == last:
+            lines.append(f"            value = value.get(k{i}, default)")
+        else:
+            lines.append(f"            value = value.get(k{i}, _MISSING)")
+            lines.append("            if value is _MISSING:")
+            lines.append("                return default")
+        if null_check and i != last:
+            lines.append("            if value is None:")
+            lines.append("                return default")
+    lines += [
+        "            return value",
+        "        except (KeyError, IndexError, TypeError):",
+        "            return default",
+        "        except AttributeError:",
+        "            return fallback(doc, default)",
+        "    return accessor",
+    ]
+
+    namespace: Dict[str, Any] = {"_MISSING": _MISSING}
+    exec("\n".join(lines), namespace)  # noqa: S102
+    return namespace["factory"]
+
+
+class Schema:
+    """
+    Shape of documents (e.g. API responses): which keys they always have,
+    which keys may be missing, and which values may be null.
+
+    Created from a sample document with `Schema.from_sample` or from a TypedDict with
+    `Schema.from_typeddict`. Generates accessors - functions specialized for a path
+    that return the same values as `nget`, without a loop over the keys.
+    """
+
+    __slots__ = ("_shape",)
+
+    def __init__(self, shape: _Shape) -> None:
+        self._shape = shape
+
+    @classmethod
+    def from_sample(cls, sample: NestedDict) -> "Schema":
+        """
+        Infers the schema from a sample document.
+
+        Keys of the sample are expected in every document, other keys may be missing,
+        null values may be null. Shapes of list elements are merged: a key is expected
+        only if every element of the sample has it.
+        """
+        return cls(_sample_shape(sample))
+
+    @classmethod
+    def from_typeddict(cls, typeddict: type) -> "Schema":
+        """
+        Infers the schema from a TypedDict.
+
+        Required keys are expected in every document, `Optional` values may be null.
+        Nested TypedDicts, lists, sequences, dicts and mappings are supported.
+
+        Raises:
+            TypeError: If the type is not a TypedDict.
+        """
+        if not _is_typeddict(typeddict):
+            msg = f"Expected a TypedDict, got {typeddict!r}."
+            raise TypeError(msg)
+
+        return cls(_type_shape(typeddict))
+
+    def _steps(self, keys: Tuple[KeyType, ...]) -> Tuple[Tuple[str, bool], ...]:
+        """Returns how to look up every key of the path, see `_accessor_factory`."""
+        steps = []
+        shape: Optional[_Shape] = self._shape
+        for key in keys:
+            child: Optional[_Shape] = None
+            if shape is not None and shape.fields is not None and key in shape.fields:
+                child = shape.fields[key]
+                step = _INDEX if key in shape.required else _GET
+            elif shape is not None and shape.items is not None and isinstance(key, int):
+                child = shape.items
+                step = _INDEX
+            else:  # not in the schema: an index may be out of range, a key missing
+                step = _INDEX if isinstance(key, int) else _GET
+            steps.append((step, child is None or child.nullable))
+            shape = child
+
+        return tuple(steps)
+
+    def accessor(self, *items: ItemType) -> Accessor:
+        """
+        Generates an accessor for a path.
+
+        Args:
+            items: A sequence of keys, indices or dotted paths, the same as for `nget`.
+
+        Returns:
+            A function `accessor(doc, default=None)` that returns the same as
+            `nget(doc, *items, default=default)`.
+
+        Example:
+            >>> schema = Schema.from_sample(response)
+            >>> city = schema.accessor('result.users.0.address.city')
+            >>> city(response)
+            'Kyiv'
+            >>> city({'result': {'users': []}}, default='N/A')
+            'N/A'
+        """
+        keys = _parse_keys(items)
+        factory = _accessor_factory(self._steps(keys))
+        return factory(NgetPath(keys).get, *keys)
+
+    def accessors(
+        self, paths: Optional[Mapping[str, ItemType]] = None
+    ) -> Dict[str, Accessor]:
+        """
+        Generates accessors for many paths.
+
+        Args:
+            paths: A mapping of names to paths. By default, all paths of the schema
+                to values that are not dicts, named by their dotted paths.
+
+        Returns:
+            A dict of names to accessors.
+
+        Example:
+            >>> get = Schema.from_sample(response).accessors()
+            >>> get['result.meta.total'](response)
+            1
+        """
+        if paths is None:
+            paths = {path: path for path in self.paths()}
+
+        return {name: self.accessor(path) for name, path in paths.items()}
+
+    def paths(self) -> List[str]:
+        """Returns dotted paths of the schema to values that are not dicts."""
+        paths: List[str] = []
+
+        def walk(shape: _Shape, prefix: str) -> None:
+            if not shape.fields:
+                paths.append(prefix)
+                return
+            for key, child in shape.fields.items():
+                walk(child, f"{prefix}.{key}" if prefix else str(key))
+
+        if self._shape.fields:
+            walk(self._shape, "")
+
+        return paths
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.paths()!r})"
@@ -1,7 +1,30 @@
+import inspect
 import logging
+from collections.abc import AsyncIterator, Iterable
 from dataclasses import dataclass
 from functools import wraps
-from typing import Any, Callable, Type, TypeVar
+from time import perf_counter_ns
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
+from weakref import WeakKeyDictionary
+
+from . import metrics, trace
+
+# `et.cache` is imported only by services with `cache`
+if TYPE_CHECKING:
+    from .cache import ServiceCache
 
 log = logging.getLogger(__name__)
 
@@ -9,6 +32,21 @@ T = TypeVar("T")
 F = TypeVar("F", bound=Callable[..., Any])
 
 
+class _Service(NamedTuple):
+    """Original callables of a service class, wrapped by `refresh()` when needed."""
+
+    init: Callable[..., None]
+    logging_init: Callable[..., None]
+    methods: Dict[str, Callable[..., Any]]  # public methods, to time them
+    # methods as installed on the class, with the sink they are timed for
+    installed: Dict[str, Tuple[Callable[..., Any], Optional[metrics.Sink]]]
+
+
+_services: "WeakKeyDictionary[type, _Service]" = WeakKeyDictionary()
+# Whether caught Breaks are logged or recorded, updated by `refresh()`
+_report_breaks = False
+
+
 class Break(Exception):  # noqa: N818
     """
     Exception raised to terminate a service operation early.
@@ -16,17 +54,90 @@ class Break(Exception):  # noqa: N818
     Acts as an analogue of the 'break' statement in a loop,
     but for service operations.
     It can include an optional reason message to explain why the operation was terminated.
+
+    On hot paths, raise Breaks with reason codes, see `Break.of`.
     """
 
+    @classmethod
+    def of(cls, reason: str = "") -> "Break":
+        """
+        Returns a Break for a reason code.
+
+        Every call returns a new Break: a shared instance would collect tracebacks
+        and contexts across raises and threads, and clearing them on reuse costs
+        as much as creating a Break. The cost that matters on hot paths, formatting
+        and logging the reason, is skipped by `catch_a_break` and `run_services`
+        unless DEBUG logging is enabled.
+
+        Args:
+            reason: The reason of the Break
+
+        Returns:
+            Break: A new Break of `cls`
+
+        Example:
+            @catch_a_break
+            def run(self):
+                if self.user is None:
+                    raise Break.of("No user")
+        """
+        return cls(reason) if reason else cls()
+
+
+@overload
+def service(cls: Type[T]) -> Type[T]: ...
 
-def service(cls: Type[T]) -> Type[T]:
+
+@overload
+def service(
+    cls: None = None,
+    *,
+    slots: bool = False,
+    frozen: bool = False,
+    kw_only: bool = False,
+    cache: Union[bool, "ServiceCache"] = False,
+    pool: int = 0,
+) -> Callable[[Type[T]], Type[T]]: ...
+
+
+def service(  # noqa: PLR0913
+    cls: Optional[Type[T]] = None,
+    *,
+    slots: bool = False,
+    frozen: bool = False,
+    kw_only: bool = False,
+    cache: Union[bool, "ServiceCache"] = False,
+    pool: int = 0,
+) -> Union[Type[T], Callable[[Type[T]], Type[T]]]:
     """
     A class decorator that behaves like `@dataclass` but also logs init arguments.
 
     This is useful for debugging or tracing how services are constructed.
+    The logging wrapper is installed only while DEBUG logging is enabled for
+    the `et.service` logger, otherwise construction costs the same as a plain dataclass.
+
+    Can be used bare (`@service`) or with dataclass options (`@service(slots=True)`).
+    Slotted services have no per-instance `__dict__`, so they take less memory
+    and are faster to construct.
+
+    Services that are pure lookups can memoize their entry method with `cache`:
+    results are cached by field values and arguments, repeated calls with the same
+    values return the cached result, see `ServiceCache`.
+
+    Services created and discarded at a high rate can reuse instances with `pool`:
+    `Svc.acquire(...)` returns a free instance of the current thread reinitialized
+    in place, returned to the pool when its `with` block exits, see `ServicePool`.
 
     Args:
         cls: The class to be decorated
+        slots: Generate `__slots__` instead of per-instance `__dict__` (Python 3.10+)
+        frozen: Make instances immutable, assigning to fields raises
+            `dataclasses.FrozenInstanceError`
+        kw_only: Make all fields keyword-only (Python 3.10+)
+        cache: Cache results of the `run` method, `True` for `ServiceCache()`
+            or a `ServiceCache` with another size, TTL or method
+        pool: The maximum number of free instances kept per thread for reuse
+            by `acquire`, 0 - no pool
 
     Returns:
         The decorated class with dataclass features and logging
@@ -41,21 +152,262 @@ def service(cls: Type[T]) -> Type[T]:
                 # Service implementation
                 pass
 
+        @service(slots=True, frozen=True)
+        class RequestService:
+            request_id: str
+
+        @service(cache=ServiceCache(maxsize=10_000, ttl=60))
+        class UserLookupService:
+            user_id: str
+
+            def run(self):
+                return fetch_user(self.user_id)
+
+        UserLookupService.run.cache_info()  # hits and misses
+
+        @service(pool=64)
+        class HandleMessageService:
+            message: Message
+
+            @catch_a_break
+            def run(self):
+                ...
+
+        for message in consumer:
+            with HandleMessageService.acquire(message) as svc:
+                svc.run()
     """
-    cls = dataclass(cls)
+    # pass only enabled options, so `slots` and `kw_only` are not required on Python 3.9
+    options = {
+        name: True
+        for name, enabled in (("slots", slots), ("frozen", frozen), ("kw_only", kw_only))
+        if enabled
+    }
+
+    def wrap(cls: Type[T]) -> Type[T]:
+        cls = dataclass(**options)(cls)  # `slots=True` creates a new class
+
+        original_init = cls.__init__  # save original __init__ to wrap it
+        name = cls.__name__  # not the class itself, so it can be garbage collected
+
+        @wraps(original_init)
+        def init(self: Any, *args: Any, **kwargs: Any) -> None:
+            log.debug("Initializing '%s' with args=%s, kwargs=%s", name, args, kwargs)
+            original_init(self, *args, **kwargs)
+
+        methods = {
+            attr: method
+            for attr, method in vars(cls).items()
+            if inspect.isfunction(method)
+            and not attr.startswith("_")
+            and not inspect.isasyncgenfunction(method)
+        }
+        if cache:
+            _add_cache(cls, methods, cache)
+        if pool:
+            _add_pool(cls, pool)
+        svc = _services[cls] = _Service(original_init, init, methods, {})
+        _install(cls, svc, _debug_enabled(), metrics.get_sink(), trace.get_buffer())
+        return cls
+
+    if cls is None:
+        return wrap
+
+    return wrap(cls)
+
+
+def _add_cache(
+    cls: type, methods: Dict[str, Callable[..., Any]], cache: Union[bool, "ServiceCache"]
+) -> None:
+    """Replaces the cached method of a service with a caching wrapper."""
+    from .cache import ServiceCache  # noqa: PLC0415
+
+    if not isinstance(cache, ServiceCache):
+        cache = ServiceCache()
+
+    # only methods defined by the class itself, inherited ones may be wrapped already
+    method = vars(cls).get(cache.method)
+    if not inspect.isfunction(method) or inspect.isasyncgenfunction(method):
+        msg = f"Service '{cls.__name__}' has no method '{cache.method}' to cache."
+        raise ValueError(msg)
+
+    methods[cache.method] = cache.wrap(cls, method)
+
+
+def _add_pool(cls: type, size: int) -> None:
+    """Adds `acquire` and the context manager methods of a pooled service."""
+    from .pool import ServicePool  # noqa: PLC0415
+
+    pool = ServicePool(cls, size)
+    methods = pool.methods()
+    for attr in methods:
+        if attr in vars(cls):
+            msg = (
+                f"Service '{cls.__name__}' already defines '{attr}', it can't be pooled."
+            )
+            raise ValueError(msg)
 
-    original_init = cls.__init__  # save original __init__ to wrap it
+    for attr, method in methods.items():
+        setattr(cls, attr, method)
 
-    @wraps(original_init)
-    def init(self: Any, *args: Any, **kwargs: Any) -> None:
-        log.debug("Initializing '%s' with args=%s, kwargs=%s", cls.__name__, args, kwargs)
-        original_init(self, *args, **kwargs)
 
-    cls.__init__ = init
-    return cls
+def _debug_enabled() -> bool:
+    """`log.isEnabledFor(logging.DEBUG)` that doesn't rely on the logger's level cache."""
+    return (
+        not log.disabled
+        and log.manager.disable < logging.DEBUG
+        and log.getEffectiveLevel() <= logging.DEBUG
+    )
 
 
-def catch_a_break(func: F) -> F:
+def _counted(
+    init: Callable[..., None], name: str, sink: metrics.Sink
+) -> Callable[..., None]:
+    """Wraps init to record construction of service instances."""
+    record_init = sink.record_init
+
+    @wraps(init)
+    def counted_init(self: Any, *args: Any, **kwargs: Any) -> None:
+        record_init(name)
+        init(self, *args, **kwargs)
+
+    return counted_init
+
+
+def _traced(
+    init: Callable[..., None], name: str, buffer: trace.TraceBuffer
+) -> Callable[..., None]:
+    """Wraps init to record construction of service instances into a trace buffer."""
+    record = buffer.record
+
+    @wraps(init)
+    def traced_init(self: Any, *args: Any, **kwargs: Any) -> None:
+        record(name, args, kwargs)
+        init(self, *args, **kwargs)
+
+    return traced_init
+
+
+def _timed(
+    method: Callable[..., Any], name: str, sink: metrics.Sink
+) -> Callable[..., Any]:
+    """Wraps a service method to record its latency."""
+    record_call = sink.record_call
+    method_name = method.__name__
+
+    if inspect.iscoroutinefunction(method):
+
+        @wraps(method)
+        async def timed_coroutine(*args: Any, **kwargs: Any) -> Any:
+            start = perf_counter_ns()
+            try:
+                return await method(*args, **kwargs)
+            finally:
+                record_call(name, method_name, perf_counter_ns() - start)
+
+        return timed_coroutine
+
+    @wraps(method)
+    def timed(*args: Any, **kwargs: Any) -> Any:
+        start = perf_counter_ns()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            record_call(name, method_name, perf_counter_ns() - start)
+
+    return timed
+
+
+def _install(
+    cls: type,
+    svc: _Service,
+    debug: bool,
+    sink: Optional[metrics.Sink],
+    buffer: Optional[trace.TraceBuffer],
+) -> None:
+    """
+    Installs init and methods of a service: original, logging, tracing or timed.
+
+    Methods are replaced only when the sink changes, and only if they are still
+    the ones installed before, so log level changes don't undo test doubles
+    (e.g. `mock.patch.object`) or methods assigned after decoration.
+    """
+    name = cls.__name__
+    init = svc.logging_init if debug else svc.init
+    if buffer is not None:
+        init = _traced(init, name, buffer)
+    cls.__init__ = init if sink is None else _counted(init, name, sink)  # type: ignore[misc]
+
+    installed = svc.installed
+    for attr, method in svc.methods.items():
+        if attr in installed:
+            current, timed_for = installed[attr]
+            if timed_for is sink or vars(cls).get(attr) is not current:
+                continue  # up to date or replaced since
+
+        wrapped = method if sink is None else _timed(method, name, sink)
+        setattr(cls, attr, wrapped)
+        installed[attr] = (wrapped, sink)
+
+
+def refresh() -> None:
+    """
+    Re-installs init and methods of all services according to the current logging
+    level, tracing and instrumentation: the logging init wrapper if DEBUG is enabled,
+    the tracing init wrapper if `et.trace` is enabled, instrumenting wrappers
+    if `et.metrics` is enabled, the original dataclass init and methods otherwise.
+    Methods are only replaced when instrumentation is enabled or disabled,
+    and not if something else replaced them since.
+
+    Called automatically when logging levels change via `Logger.setLevel`,
+    `logging.disable` or logging config, by `metrics.enable/disable`
+    and `trace.enable/disable`.
+    Call it after changing levels in other ways, e.g. assigning `Logger.level` directly.
+    Also available as `service.refresh`.
+    """
+    global _report_breaks  # noqa: PLW0603
+
+    debug = _debug_enabled()
+    sink = metrics.get_sink()
+    buffer = trace.get_buffer()
+    _report_breaks = debug or sink is not None
+    for cls, svc in list(_services.items()):
+        _install(cls, svc, debug, sink, buffer)
+
+
+class _LevelCache(dict):
+    """Logger's level cache, cleared by `logging` on every level change."""
+
+    def clear(self) -> None:
+        super().clear()
+        refresh()
+
+
+def _on_break(e: Break, func: Callable[..., Any], args: Tuple[Any, ...]) -> None:
+    """
+    Handles a caught `Break`: logs its reason if DEBUG is enabled
+    and records it if instrumentation is enabled.
+    """
+    if not _report_breaks:
+        return
+
+    reason = str(e) or "Reason not provided"
+    log.debug("Break svc operation. Reason: '%s'", reason)
+    sink = metrics.get_sink()
+    if sink is not None:
+        sink.record_break(_owner_name(func, args), reason)
+
+
+def _owner_name(func: Callable[..., Any], args: Tuple[Any, ...]) -> str:
+    """Returns the name of the service `func` is called on, or its qualified name."""
+    owner = type(args[0]) if args else None
+    if owner is not None and owner in _services:
+        return owner.__name__
+
+    return func.__qualname__
+
+
+def catch_a_break(func: F) -> F:  # noqa: C901
     """
     Decorator that gracefully handles `Break` exceptions in service operations.
 
@@ -63,6 +415,12 @@ def catch_a_break(func: F) -> F:
     logs the provided reason (or a default message if none is provided), and returns
     `None` to indicate the operation was terminated early.
 
+    Coroutine functions are awaited inside the wrapper, so a `Break` raised while
+    the coroutine runs is caught. Async generators stop iterating on a `Break`.
+
+    Other exceptions propagate. If `et.trace` is enabled, the latest service
+    constructions are logged with the exception, see `trace.enable`.
+
     Args:
         func: The function to be decorated
 
@@ -72,20 +430,131 @@ def catch_a_break(func: F) -> F:
     Example:
         @service
         class DataProcessor:
-            @capture_break
+            @catch_a_break
             def process(self, data):
                 if not data:
                     raise Break("Empty data provided")
                 # Continue processing...
+
+            @catch_a_break
+            async def fetch(self, url):
+                if not url:
+                    raise Break("Empty url provided")
+                # Continue fetching...
     """
+    if inspect.isasyncgenfunction(func):
+
+        @wraps(func)
+        async def async_gen_wrapper(*args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+            try:
+                async for item in func(*args, **kwargs):
+                    yield item
+            except Break as e:
+                _on_break(e, func, args)
+            except Exception as e:
+                trace.dump_on_error(e)
+                raise
+
+        return async_gen_wrapper  # type: ignore[return-value]
+
+    if inspect.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return await func(*args, **kwargs)
+            except Break as e:
+                _on_break(e, func, args)
+                return None
+            except Exception as e:
+                trace.dump_on_error(e)
+                raise
+
+        return async_wrapper  # type: ignore[return-value]
 
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
         try:
             return func(*args, **kwargs)
         except Break as e:
-            reason = str(e) or "Reason not provided"
-            log.debug("Break svc operation. Reason: '%s'", reason)
+            _on_break(e, func, args)
             return None
+        except Exception as e:
+            trace.dump_on_error(e)
+            raise
 
     return wrapper
+
+
+async def run_services(
+    services: Iterable[Any], limit: int = 100, method: str = "run"
+) -> List[Any]:
+    """
+    Runs many services concurrently and collects their results in order.
+
+    Calls `method` of every service, awaiting it if it is async. At most `limit`
+    services run at once. A service that raises `Break` gets `None` as its result,
+    and the reason is logged as in `catch_a_break`.
+    If a service raises any other exception, the rest are cancelled
+    and the exception is propagated.
+
+    Args:
+        services: Service instances to run
+        limit: The maximum number of services running at once
+        method: The name of the method to call
+
+    Returns:
+        Results of the services, in the order of `services`
+
+    Raises:
+        ValueError: If `limit` is less than 1
+
+    Example:
+        @service
+        class FetchUserSvc:
+            user_id: int
+
+            async def run(self):
+                if self.user_id < 0:
+                    raise Break("Invalid user id")
+                return await fetch_user(self.user_id)
+
+        users = await run_services(FetchUserSvc(user_id) for user_id in user_ids)
+    """
+    import asyncio  # noqa: PLC0415 - only needed by asyncio-based services
+
+    if limit < 1:
+        msg = f"Limit must be at least 1, got {limit}."
+        raise ValueError(msg)
+
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(svc: Any) -> Any:
+        async with semaphore:
+            run = getattr(svc, method)
+            try:
+                result = run()
+                if inspect.isawaitable(result):
+                    result = await result
+            except Break as e:
+                _on_break(e, run, (svc,))
+                return None
+
+            return result
+
+    tasks = [asyncio.ensure_future(run(svc)) for svc in services]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+# refresh services on logging level changes; the cache is a `logging` implementation
+# detail, without it `refresh()` has to be called manually
+if isinstance(getattr(log, "_cache", None), dict):
+    log._cache = _LevelCache(log._cache)  # type: ignore[attr-defined]  # noqa: SLF001
+refresh()
+
+service.refresh = refresh  # type: ignore[attr-defined]
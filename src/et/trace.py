@@ -0,0 +1,168 @@
+import logging
+from itertools import count
+from time import time_ns
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+# Constructions logged when an exception propagates through `catch_a_break`,
+# the latest ones, so errors in a loop don't format the whole buffer every time
+ERROR_DUMP_ENTRIES = 100
+
+_buffer: Optional["TraceBuffer"] = None
+
+
+class TraceEntry(NamedTuple):
+    """A recorded construction of a service instance."""
+
+    timestamp_ns: int  # epoch nanoseconds
+    service: str
+    args: Tuple[Any, ...]
+    kwargs: Dict[str, Any]
+
+
+class TraceBuffer:
+    """
+    Ring buffer of the latest constructions of `@service` instances.
+
+    Recording stores references to init arguments in a preallocated slot,
+    overwriting the oldest entry when the buffer is full, so memory is bounded
+    and nothing is formatted. Arguments are formatted with `repr` only when
+    the buffer is dumped. Thread-safe, recording takes no lock.
+
+    Recorded arguments are kept alive until their entries are overwritten.
+
+    Args:
+        size: The number of latest constructions to keep
+
+    Raises:
+        ValueError: If `size` is less than 1
+    """
+
+    def __init__(self, size: int = 1024) -> None:
+        if size < 1:
+            msg = f"Size must be at least 1, got {size}."
+            raise ValueError(msg)
+
+        self.size = size
+        # slots of (sequence number, timestamp, service, args, kwargs)
+        self._slots: List[Optional[Tuple[Any, ...]]] = [None] * size
+        self._counter = count()  # `next` is atomic, unlike `+= 1`
+
+    def record(self, service: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> None:
+        """Records a construction of a service instance."""
+        seq = next(self._counter)
+        self._slots[seq % self.size] = (seq, time_ns(), service, args, kwargs)
+
+    def entries(self, limit: Optional[int] = None) -> List[TraceEntry]:
+        """Returns the recorded constructions (the latest `limit`), the oldest first."""
+        slots = sorted(slot for slot in list(self._slots) if slot is not None)
+        if limit is not None:
+            slots = slots[-limit:] if limit > 0 else []
+        return [TraceEntry(*slot[1:]) for slot in slots]
+
+    def dump(self, limit: Optional[int] = None) -> str:
+        """
+        Formats the recorded constructions, or the latest `limit` ones,
+        one per line, the oldest first. Long argument values are abbreviated.
+
+        Example:
+            >>> print(buffer.dump())
+            2025-03-01T12:00:00.000001+00:00 UserService('42', update_cache=False)
+            2025-03-01T12:00:00.000120+00:00 RequestService(request_id='a1b2')
+        """
+        from datetime import datetime, timezone  # noqa: PLC0415
+        from reprlib import repr as short_repr  # noqa: PLC0415
+
+        lines = []
+        for entry in self.entries(limit):
+            stamp = datetime.fromtimestamp(entry.timestamp_ns / 1e9, timezone.utc)
+            arguments = [short_repr(arg) for arg in entry.args]
+            arguments += [
+                f"{name}={short_repr(arg)}" for name, arg in entry.kwargs.items()
+            ]
+            lines.append(f"{stamp.isoformat()} {entry.service}({', '.join(arguments)})")
+
+        return "\n".join(lines)
+
+    def clear(self) -> None:
+        """Drops all recorded constructions."""
+        self._slots = [None] * self.size
+        self._counter = count()
+
+    def __len__(self) -> int:
+        return sum(slot is not None for slot in self._slots)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(size={self.size})"
+
+
+def get_buffer() -> Optional[TraceBuffer]:
+    """Returns the enabled trace buffer, or None if tracing is disabled."""
+    return _buffer
+
+
+def enable(size: int = 1024) -> TraceBuffer:
+    """
+    Enables tracing of constructions of all `@service` classes into a ring buffer.
+
+    A cheap alternative to DEBUG logging of init arguments: the latest `size`
+    constructions are kept in memory and formatted only when dumped, on demand
+    with `dump()`, or when an exception other than `Break` propagates through
+    a `catch_a_break` method, then the latest `ERROR_DUMP_ENTRIES` constructions
+    are logged to the `et.trace` logger.
+
+    Args:
+        size: The number of latest constructions to keep
+
+    Returns:
+        The enabled trace buffer
+
+    Raises:
+        ValueError: If `size` is less than 1
+
+    Example:
+        trace.enable(size=10_000)
+        UserService(user_id="42").run()
+        print(trace.dump())
+        trace.disable()
+    """
+    global _buffer  # noqa: PLW0603
+
+    from .service import refresh  # noqa: PLC0415 - et.service imports this module
+
+    _buffer = TraceBuffer(size)
+    refresh()
+    return _buffer
+
+
+def disable() -> None:
+    """Disables tracing and removes tracing wrappers, recorded entries are dropped."""
+    global _buffer  # noqa: PLW0603
+
+    from .service import refresh  # noqa: PLC0415 - et.service imports this module
+
+    _buffer = None
+    refresh()
+
+
+def dump(limit: Optional[int] = None) -> str:
+    """Formats the recorded constructions, see `TraceBuffer.dump`. Empty if disabled."""
+    return "" if _buffer is None else _buffer.dump(limit)
+
+
+def dump_on_error(error: BaseException) -> None:
+    """
+    Logs the trace for an exception, once even if it propagates through
+    many `catch_a_break` methods. Does nothing if tracing is disabled.
+    """
+    if _buffer is None or getattr(error, "_et_traced", False):
+        return
+
+    error._et_traced = True  # type: ignore[attr-defined]  # noqa: SLF001
+    log.error(
+        "Service constructions before %s: %s\n%s",
+        type(error).__name__,
+        error,
+        _buffer.dump(ERROR_DUMP_ENTRIES),
+    )
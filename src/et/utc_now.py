@@ -1,12 +1,92 @@
+import time
 from datetime import datetime, timezone
+from typing import Sequence, Tuple
+
+_NS_PER_SECOND = 1_000_000_000
 
 
 class DateTimeProvider:
+    # coarse clock: resolution in nanoseconds (0 - disabled)
+    # and the cached time with the monotonic time it expires at
+    _resolution_ns = 0
+    _coarse: Tuple[int, datetime] = (0, datetime.min.replace(tzinfo=timezone.utc))
+    # ISO prefix up to seconds of the last second `utc_now_iso` was called in
+    _iso_prefix: Tuple[int, str] = (-1, "")
+
     @classmethod
     def utc_now(cls) -> datetime:
         """Get the current UTC time."""
+        if cls._resolution_ns:
+            expires_ns, now = cls._coarse
+            if time.monotonic_ns() < expires_ns:
+                return now
+            return cls._refresh_coarse()
+
         return datetime.now(timezone.utc)
 
+    @classmethod
+    def utc_now_ns(cls) -> int:
+        """Get the current UTC time as nanoseconds since the Unix epoch."""
+        return time.time_ns()
+
+    @classmethod
+    def utc_now_iso(cls) -> str:
+        """Get the current UTC time as an ISO 8601 string with microseconds."""
+        seconds, micros = divmod(time.time_ns() // 1000, 1_000_000)
+        cached_seconds, prefix = cls._iso_prefix
+        if seconds != cached_seconds:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+            cls._iso_prefix = (seconds, prefix)
+
+        return f"{prefix}.{micros:06d}+00:00"
+
+    @classmethod
+    def utc_stamps(cls, n: int) -> Sequence[int]:
+        """Get `n` distinct increasing nanosecond timestamps from one clock read."""
+        if n < 0:
+            msg = f"Number of stamps must not be negative, got {n}."
+            raise ValueError(msg)
+
+        now_ns = time.time_ns()
+        return range(now_ns, now_ns + n)
+
+    @classmethod
+    def _refresh_coarse(cls) -> datetime:
+        """Reads the system clock and caches it for the resolution of the coarse clock."""
+        now = datetime.now(timezone.utc)
+        cls._coarse = (time.monotonic_ns() + cls._resolution_ns, now)
+        return now
+
+    @classmethod
+    def set_resolution(cls, seconds: float) -> None:
+        """
+        Enables the coarse clock: `utc_now()` returns the same cached datetime
+        for up to `seconds` and reads the system clock at most once per resolution.
+
+        The returned time is behind the system clock by less than the resolution.
+        Expiry is checked with `time.monotonic_ns()`, so it isn't affected
+        by system clock adjustments.
+        Also available as `utc_now.set_resolution`.
+
+        Args:
+            seconds: The resolution of the clock, e.g. `0.001` for 1 ms.
+                `0` disables the coarse clock.
+
+        Raises:
+            ValueError: If the resolution is negative.
+
+        Example:
+            >>> utc_now.set_resolution(0.01)  # stale by less than 10 ms
+            >>> utc_now() is utc_now()
+            True
+        """
+        if seconds < 0:
+            msg = f"Resolution must not be negative, got {seconds}."
+            raise ValueError(msg)
+
+        cls._resolution_ns = int(seconds * _NS_PER_SECOND)
+        cls._coarse = (0, cls._coarse[1])  # expire the cached time
+
 
 def utc_now() -> datetime:
     """
@@ -17,6 +97,10 @@ def utc_now() -> datetime:
         It delegates the call to `DateTimeProvider.utc_now()` but can be overridden
         using fixtures to control datetime values in unit tests.
 
+    For hot paths, enable the coarse clock with `utc_now.set_resolution(seconds)`:
+    the time is then read at most once per resolution and is behind the system
+    clock by less than the resolution.
+
     Returns:
         datetime: Current UTC time with timezone info.
 
@@ -26,3 +110,68 @@ def utc_now() -> datetime:
 
     """
     return DateTimeProvider.utc_now()
+
+
+def utc_now_ns() -> int:
+    """
+    Returns the current UTC time as an integer number of nanoseconds since the Unix epoch.
+
+    Cheaper than `utc_now()` when an epoch timestamp is needed,
+    no `datetime` is created. Delegates the call to `DateTimeProvider.utc_now_ns()`.
+
+    Returns:
+        int: Nanoseconds since the Unix epoch.
+
+    Example:
+        >>> utc_now_ns()
+        1746812740566021000
+
+    """
+    return DateTimeProvider.utc_now_ns()
+
+
+def utc_now_iso() -> str:
+    """
+    Returns the current UTC time as an ISO 8601 string.
+
+    Same as `utc_now().isoformat(timespec="microseconds")`, but no `datetime` is created:
+    the date and time up to seconds are formatted once per second and cached.
+    Microseconds are always included, so all strings have the same length.
+    Delegates the call to `DateTimeProvider.utc_now_iso()`.
+
+    Returns:
+        str: Current UTC time in ISO 8601 format.
+
+    Example:
+        >>> utc_now_iso()
+        '2025-05-09T17:45:40.566021+00:00'
+
+    """
+    return DateTimeProvider.utc_now_iso()
+
+
+def utc_stamps(n: int) -> Sequence[int]:
+    """
+    Returns `n` timestamps for a batch of events, reading the clock once.
+
+    Timestamps are the current UTC time in nanoseconds since the Unix epoch,
+    increased by 1 ns for every next event, so they are distinct and keep
+    the order of events. Delegates the call to `DateTimeProvider.utc_stamps()`.
+
+    Args:
+        n: The number of timestamps.
+
+    Returns:
+        Sequence[int]: A lazy sequence (`range`) of timestamps.
+
+    Raises:
+        ValueError: If `n` is negative.
+
+    Example:
+        >>> events = [Event(stamp=stamp) for stamp in utc_stamps(len(payloads))]
+
+    """
+    return DateTimeProvider.utc_stamps(n)
+
+
+utc_now.set_resolution = DateTimeProvider.set_resolution  # type: ignore[attr-defined]
@@ -0,0 +1,218 @@
+import asyncio
+import re
+import threading
+from datetime import timedelta
+from typing import Any, Dict, List, Optional
+from unittest.mock import Mock
+
+from pytest import fixture, mark, raises
+
+from et import Break, ServiceCache, catch_a_break, metrics, service
+from et.cache import CacheInfo
+
+calls: List[Any] = []
+
+
+@service(cache=True)
+class LookupSvc:
+    user_id: Any
+    verbose: bool = False
+
+    @catch_a_break
+    def run(self, *args: Any, **kwargs: Any) -> Optional[Dict[str, Any]]:
+        calls.append((self.user_id, args, kwargs))
+        if self.user_id is None:
+            err_msg = "No user."
+            raise Break(err_msg)
+        return {"id": self.user_id, "args": args, "kwargs": kwargs}
+
+    def other(self) -> Any:
+        calls.append("other")
+        return self.user_id
+
+
+@fixture(autouse=True)
+def clear_cache() -> None:
+    calls.clear()
+    LookupSvc.run.cache_clear()
+
+
+class TestServiceCache:
+    def test_hits_and_misses(self):
+        first = LookupSvc(1).run()
+
+        assert LookupSvc(1).run() is first
+        assert LookupSvc(2).run() == {"id": 2, "args": (), "kwargs": {}}
+        assert LookupSvc(1, verbose=True).run() == first
+        assert len(calls) == 3
+        assert LookupSvc.run.cache_info() == CacheInfo(
+            hits=1, misses=3, maxsize=1024, currsize=3
+        )
+
+    def test_arguments_are_keys(self):
+        LookupSvc(1).run("a", limit=1)
+        LookupSvc(1).run("a", limit=1)
+        LookupSvc(1).run("a", limit=2)
+        LookupSvc(1).run("b", limit=1)
+
+        assert len(calls) == 3
+
+    def test_other_methods_not_cached(self):
+        LookupSvc(1).other()
+        LookupSvc(1).other()
+
+        assert calls == ["other", "other"]
+
+    def test_break_result_cached(self):
+        assert LookupSvc(None).run() is None
+        assert LookupSvc(None).run() is None
+        assert len(calls) == 1
+
+    def test_exceptions_not_cached(self):
+        attempts = []
+
+        @service(cache=True)
+        class FlakySvc:
+            user_id: int
+
+            def run(self) -> int:
+                attempts.append(self.user_id)
+                if len(attempts) == 1:
+                    raise ConnectionError
+                return self.user_id
+
+        with raises(ConnectionError):
+            FlakySvc(1).run()
+
+        assert FlakySvc(1).run() == 1
+        assert FlakySvc(1).run() == 1
+        assert attempts == [1, 1]
+
+    def test_unhashable_fields_not_cached(self):
+        LookupSvc([1]).run()
+        LookupSvc([1]).run()
+
+        assert len(calls) == 2
+        assert LookupSvc.run.cache_info().currsize == 0
+
+    def test_lru_eviction(self):
+        @service(cache=ServiceCache(maxsize=2))
+        class SmallSvc:
+            user_id: int
+
+            def run(self) -> int:
+                calls.append(self.user_id)
+                return self.user_id
+
+        for user_id in (1, 2, 1, 3, 1, 2):
+            SmallSvc(user_id).run()
+
+        # 2 is evicted by 3, then 3 by 2; 1 stays as the most recently used
+        assert calls == [1, 2, 3, 2]
+        assert SmallSvc.run.cache_info() == CacheInfo(2, 4, 2, 2)
+
+    def test_ttl(self, mocked_now: Mock):
+        @service(cache=ServiceCache(ttl=60))
+        class TtlSvc:
+            user_id: int
+
+            def run(self) -> int:
+                calls.append(self.user_id)
+                return self.user_id
+
+        start = mocked_now.return_value
+        TtlSvc(1).run()
+        mocked_now.return_value = start + timedelta(seconds=59)
+        TtlSvc(1).run()
+        mocked_now.return_value = start + timedelta(seconds=60)
+        TtlSvc(1).run()
+
+        assert calls == [1, 1]
+        assert TtlSvc.run.cache_info() == CacheInfo(1, 2, 1024, 1)
+
+    def test_async(self):
+        @service(cache=ServiceCache(method="fetch"))
+        class FetchSvc:
+            user_id: int
+
+            async def fetch(self) -> int:
+                await asyncio.sleep(0)
+                calls.append(self.user_id)
+                return self.user_id
+
+        async def main() -> List[int]:
+            return [await FetchSvc(user_id).fetch() for user_id in (1, 1, 2)]
+
+        assert asyncio.run(main()) == [1, 1, 2]
+        assert calls == [1, 2]
+
+    def test_shared_cache(self):
+        cache = ServiceCache()
+
+        @service(cache=cache)
+        class FirstSvc:
+            user_id: int
+
+            def run(self) -> str:
+                return "first"
+
+        @service(cache=cache)
+        class SecondSvc:
+            user_id: int
+
+            def run(self) -> str:
+                return "second"
+
+        assert (FirstSvc(1).run(), SecondSvc(1).run()) == ("first", "second")
+        assert cache.cache_info().currsize == 2
+
+    def test_threads(self):
+        def lookup() -> None:
+            for user_id in range(100):
+                LookupSvc(user_id % 10).run()
+
+        threads = [threading.Thread(target=lookup) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        info = LookupSvc.run.cache_info()
+        assert info.hits + info.misses == 800
+        assert info.currsize == 10
+
+    def test_with_metrics(self):
+        registry = metrics.enable()
+        try:
+            LookupSvc(1).run()
+            LookupSvc(1).run()
+
+            assert LookupSvc.run.cache_info().hits == 1
+        finally:
+            metrics.disable()
+
+        assert registry.snapshot()["LookupSvc"]["calls"]["run"]["count"] == 2
+
+    def test_no_method(self):
+        err_msg = re.escape("Service 'NoRunSvc' has no method 'run' to cache.")
+        with raises(ValueError, match=err_msg):
+
+            @service(cache=True)
+            class NoRunSvc:
+                user_id: int
+
+    @mark.parametrize(
+        ("kwargs", "err_msg"),
+        [
+            ({"maxsize": 0}, "Max size must be at least 1, got 0."),
+            ({"ttl": 0}, "TTL must be positive, got 0."),
+        ],
+    )
+    def test_invalid_options(self, kwargs: Dict[str, Any], err_msg: str):
+        with raises(ValueError, match=re.escape(err_msg)):
+            ServiceCache(**kwargs)
+
+    def test_repr(self):
+        assert repr(ServiceCache(10, ttl=1.5)) == (
+            "ServiceCache(maxsize=10, ttl=1.5, method='run')"
+        )
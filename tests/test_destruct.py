@@ -1,11 +1,17 @@
+import dis
 import inspect
 import re
+from importlib import import_module
 from typing import Any, Dict
 from unittest.mock import Mock
 
 from pytest import fixture, mark, raises
 
-from et import DestructError, destruct
+from et import DestructError, Extractor, destruct
+from et.destruct import _call_site_cache
+
+# `et.destruct` attribute is the function, get the module itself
+destruct_module = import_module("et.destruct")
 
 
 class TestDestruct:
@@ -105,6 +111,118 @@ class TestDestruct:
         assert (a, b, c, d) == (1, 2, 3, 4)
 
 
+class TestBytecodeVarNames:
+    @fixture
+    def test_data(self) -> Dict[str, Any]:
+        return {"name": "John", "age": 30, "city": "New York"}
+
+    def test_without_source(self, test_data: Dict[str, Any]):
+        namespace = {"destruct": destruct, "data": test_data}
+        code = compile("name, age = destruct(data)", "<no source>", "exec")
+
+        exec(code, namespace)  # noqa: S102
+
+        assert (namespace["name"], namespace["age"]) == ("John", 30)
+
+    def test_multiline(self, test_data: Dict[str, Any]):
+        (
+            name,
+            city,
+        ) = destruct(
+            test_data,
+            default="N/A",
+        )
+
+        assert (name, city) == ("John", "New York")
+
+    def test_starred(self, test_data: Dict[str, Any]):
+        name, *age = destruct(test_data)
+
+        assert name == "John"
+        assert age == [30]
+
+    def test_attribute_targets(self, test_data: Dict[str, Any]):
+        class Person:
+            pass
+
+        person = Person()
+
+        person.name, person.age = destruct(test_data)
+        person.city = destruct(test_data)
+
+        assert (person.name, person.age, person.city) == ("John", 30, "New York")
+
+    def test_global_target(self, test_data: Dict[str, Any]):
+        namespace = {"destruct": destruct, "data": test_data}
+        code = compile(
+            "def f():\n    global city\n    city = destruct(data)\nf()", "<f>", "exec"
+        )
+
+        exec(code, namespace)  # noqa: S102
+
+        assert namespace["city"] == "New York"
+
+
+class TestExtractor:
+    @fixture
+    def test_data(self) -> Dict[str, Any]:
+        return {"name": "John", "age": 30, "city": "New York"}
+
+    def test_success(self, test_data: Dict[str, Any]):
+        person = destruct.compile(["name", "age", "city"])
+
+        assert isinstance(person, Extractor)
+        assert person(test_data) == ("John", 30, "New York")
+
+    def test_one_key(self, test_data: Dict[str, Any]):
+        assert destruct.compile(["city"])(test_data) == "New York"
+        assert destruct.compile(["zip"], default="N/A")(test_data) == "N/A"
+
+    def test_with_defaults(self, test_data: Dict[str, Any]):
+        person = destruct.compile(["name", "age", "country"], default="N/A")
+
+        assert person(test_data) == ("John", 30, "N/A")
+
+    def test_missing_key(self, test_data: Dict[str, Any]):
+        person = destruct.compile(["name", "first_name", "last_name"])
+
+        err_msg = re.escape("Key(s) ['first_name', 'last_name'] not found in dictionary.")
+        with raises(KeyError, match=err_msg):
+            person(test_data)
+
+    @mark.parametrize(
+        ("keys", "default"),
+        [(["name", "age"], ...), (["name"], ...), (["name", "zip"], None)],
+    )
+    def test_same_as_destruct(self, test_data: Dict[str, Any], keys: list, default):
+        extractor = destruct.compile(keys, default=default)
+
+        assert extractor(test_data) == destruct(test_data, keys=keys, default=default)
+
+    def test_many(self, test_data: Dict[str, Any]):
+        person = destruct.compile(["name", "age"])
+        people = (test_data, {"name": "Ann", "age": 1})
+
+        assert person.many(people) == [("John", 30), ("Ann", 1)]
+        assert person.many([]) == []
+
+    def test_many_missing_key(self, test_data: Dict[str, Any]):
+        person = destruct.compile(["name", "age"])
+
+        err_msg = re.escape("Key(s) ['age'] not found in dictionary.")
+        with raises(KeyError, match=err_msg):
+            person.many([test_data, {"name": "Ann"}])
+
+    def test_no_keys(self):
+        err_msg = "No keys provided."
+        with raises(DestructError, match=err_msg):
+            destruct.compile([])
+
+    def test_repr(self):
+        assert repr(destruct.compile(["a", "b"])) == "Extractor(['a', 'b'])"
+        assert repr(destruct.compile(["a"], default=0)) == "Extractor(['a'], default=0)"
+
+
 class TestGetVarNames:
     @fixture
     def test_data(self) -> Dict[str, Any]:
@@ -143,3 +261,59 @@ class TestGetVarNames:
         err_msg = "Assignment statement was not found."
         with raises(DestructError, match=err_msg):
             destruct(test_data)
+
+
+class TestCallSiteCache:
+    @fixture(autouse=True)
+    def clear_cache(self):
+        destruct.clear_cache()
+        yield
+        destruct.clear_cache()
+
+    def test_cached(self, monkeypatch):
+        get_instructions = Mock(wraps=dis.get_instructions)
+        monkeypatch.setattr(dis, "get_instructions", get_instructions)
+
+        for i in range(3):
+            x, y = destruct({"x": i, "y": -i})
+            assert (x, y) == (i, -i)
+
+        assert get_instructions.call_count == 1
+        assert len(_call_site_cache) == 1
+
+    def test_call_sites(self):
+        data = {"a": 1, "b": 2}
+
+        a = destruct(data)
+        b = destruct(data)
+
+        assert (a, b) == (1, 2)
+        assert sorted(_call_site_cache.values()) == [("a",), ("b",)]
+
+    def test_clear_cache(self):
+        data = {"a": 1}
+        a = destruct(data)
+
+        destruct.clear_cache()
+
+        assert not _call_site_cache
+
+    def test_eviction(self, monkeypatch):
+        monkeypatch.setattr(destruct_module, "CALL_SITE_CACHE_SIZE", 2)
+        data = {"a": 1, "b": 2, "c": 3}
+
+        a = destruct(data)
+        b = destruct(data)
+        c = destruct(data)
+
+        assert (a, b, c) == (1, 2, 3)
+        assert list(_call_site_cache.values()) == [("b",), ("c",)]
+
+    def test_errors_are_not_cached(self):
+        data = {"a": 1}
+        err_msg = "Assignment statement was not found."
+        for _ in range(2):
+            with raises(DestructError, match=err_msg):
+                destruct(data)
+
+        assert not _call_site_cache
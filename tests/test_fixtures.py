@@ -5,10 +5,15 @@ Note: No imports of fixtures are needed - they are automatically
 discovered by pytest when the 'et' package is installed.
 """
 
-from datetime import datetime, timezone
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock
 
-from et import utc_now
+from pytest import mark, raises
+
+from et import utc_now, utc_now_iso, utc_now_ns, utc_stamps
+from et.fixtures import DEFAULT_NOW, VirtualClock
 
 
 class TestMockedNow:
@@ -22,3 +27,88 @@ class TestMockedNow:
         mocked_now.return_value = fixed_dt
 
         assert utc_now() == fixed_dt
+
+    def test_timestamps(self, mocked_now: Mock):
+        mocked_now.return_value = datetime(2025, 1, 1, 12, 0, 0, 5, tzinfo=timezone.utc)
+
+        assert utc_now_ns() == 1_735_732_800_000_005_000
+        assert utc_now_iso() == "2025-01-01T12:00:00.000005+00:00"
+        assert list(utc_stamps(2)) == [
+            1_735_732_800_000_005_000,
+            1_735_732_800_000_005_001,
+        ]
+        mocked_now.assert_not_called()
+
+    def test_timestamps_default(self, mocked_now: Mock):
+        assert utc_now_iso() == mocked_now().isoformat(timespec="microseconds")
+        assert utc_now_ns() == int(mocked_now().timestamp()) * 1_000_000_000
+
+
+class TestVirtualClock:
+    @mark.usefixtures("virtual_clock")
+    def test_frozen(self):
+        assert utc_now() == DEFAULT_NOW
+        assert utc_now() == DEFAULT_NOW
+        assert time.time() == DEFAULT_NOW.timestamp()
+        assert utc_now_ns() == time.time_ns() == int(DEFAULT_NOW.timestamp()) * 10**9
+        assert utc_now_iso() == "2025-06-06T12:00:00.000000+00:00"
+        assert time.monotonic() == time.monotonic()
+
+    def test_advance(self, virtual_clock: VirtualClock):
+        start = time.monotonic()
+
+        virtual_clock.advance(1.5)
+
+        assert utc_now() == DEFAULT_NOW + timedelta(seconds=1.5)
+        assert time.time() == DEFAULT_NOW.timestamp() + 1.5
+        assert time.monotonic() - start == 1.5
+        assert list(utc_stamps(2)) == [utc_now_ns(), utc_now_ns() + 1]
+
+    def test_advance_negative(self, virtual_clock: VirtualClock):
+        err_msg = "Can't advance the clock by a negative number of seconds: -1."
+        with raises(ValueError, match=err_msg):
+            virtual_clock.advance(-1)
+
+    def test_tick(self, virtual_clock: VirtualClock):
+        virtual_clock.tick = 0.25
+
+        assert utc_now() == DEFAULT_NOW
+        assert utc_now() == DEFAULT_NOW + timedelta(seconds=0.25)
+        assert time.time() == DEFAULT_NOW.timestamp() + 0.5
+
+    @mark.usefixtures("virtual_clock")
+    def test_sleep(self):
+        started = time.perf_counter()
+
+        time.sleep(3600)
+
+        assert utc_now() == DEFAULT_NOW + timedelta(hours=1)
+        assert time.perf_counter() - started < 1
+
+    @mark.usefixtures("virtual_clock")
+    def test_asyncio_timeout(self):
+        async def slow() -> str:
+            await asyncio.sleep(3600)
+            return "done"
+
+        async def main() -> float:
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            with raises(asyncio.TimeoutError):
+                await asyncio.wait_for(slow(), timeout=60)
+            assert await asyncio.wait_for(slow(), timeout=7200) == "done"
+            return loop.time() - start
+
+        started = time.perf_counter()
+
+        elapsed = asyncio.run(main())
+
+        assert elapsed == 60 + 3600
+        assert utc_now() == DEFAULT_NOW + timedelta(seconds=60 + 3600)
+        assert time.perf_counter() - started < 1
+
+    def test_custom_start(self):
+        clock = VirtualClock(start=datetime(2030, 1, 1, tzinfo=timezone.utc), tick=1)
+
+        assert clock.now() == datetime(2030, 1, 1, tzinfo=timezone.utc)
+        assert clock.now() == datetime(2030, 1, 1, 0, 0, 1, tzinfo=timezone.utc)
@@ -0,0 +1,56 @@
+import subprocess
+import sys
+from types import FunctionType
+
+from pytest import mark, raises
+
+import et
+
+
+def run_python(code: str) -> str:
+    """Runs code in a new interpreter, so modules imported by tests don't interfere."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+LOADED_SUBMODULES = (
+    "import sys; print(sorted(m for m in sys.modules if m.startswith('et.')))"
+)
+
+
+class TestLazyImports:
+    def test_import_et(self):
+        assert run_python(f"import et; {LOADED_SUBMODULES}") == "[]"
+
+    def test_import_nget(self):
+        loaded = run_python(f"from et import nget; {LOADED_SUBMODULES}")
+
+        assert loaded == "['et.nget']"
+
+    def test_nget_does_not_import_re(self):
+        # `typing` imports `re` itself before Python 3.12
+        code = (
+            "import sys, typing; imported = 're' in sys.modules; "
+            "from et import nget; print(imported or 're' not in sys.modules)"
+        )
+
+        assert run_python(code) == "True"
+
+    @mark.parametrize("name", ["nget", "nset", "destruct", "service", "utc_now"])
+    def test_function_named_as_submodule(self, name: str):
+        code = f"import et.{name}, et.nget_stream, et.fixtures; print(type(et.{name}))"
+
+        assert run_python(code) == "<class 'function'>"
+        assert isinstance(getattr(et, name), FunctionType)
+
+    @mark.parametrize("name", et.__all__)
+    def test_public_names(self, name: str):
+        assert getattr(et, name) is not None
+        assert name in dir(et)
+
+    def test_unknown_name(self):
+        err_msg = "module 'et' has no attribute 'unknown'"
+        with raises(AttributeError, match=err_msg):
+            et.unknown  # noqa: B018
@@ -0,0 +1,230 @@
+import json
+import random
+from typing import Any, Dict, List
+
+from pytest import fixture, mark, raises
+
+from et import LazyJSON, nget, nget_many
+from et.lazy_json import SKIP_DEPTH, _skip_value
+
+
+class TestLazyJSON:
+    @fixture
+    def data(self) -> Dict[str, Any]:
+        return {
+            "result": {
+                "users": [
+                    {"name": "Ivan", "address": {"city": "Kyiv"}, "tags": ["a", "b"]},
+                    {"name": 'Juan "J" [x]{y}', "address": None, "tags": []},
+                ],
+                "total": 2,
+            },
+            "meta": {"page": 1, "ratio": 0.5, "next": True, "prev": False},
+            "unicode": "Київ \\ ☃",
+        }
+
+    @fixture
+    def raw(self, data: Dict[str, Any]) -> bytes:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode()
+
+    @mark.parametrize(
+        "path",
+        [
+            "result.users.0.name",
+            "result.users.1.name",
+            "result.users.0.address.city",
+            "result.users.1.address",
+            "result.users.1.address.city",
+            "result.users.0.tags.1",
+            "result.users.1.tags.0",
+            "result.users.2",
+            "result.total",
+            "meta.ratio",
+            "meta.next",
+            "meta.prev",
+            "meta.missing",
+            "unicode",
+            "missing.path",
+        ],
+    )
+    def test_same_as_decoded(self, data: Dict[str, Any], raw: bytes, path: str):
+        assert nget(LazyJSON(raw), path, default="-") == nget(data, path, default="-")
+
+    def test_negative_indices(self, raw: bytes):
+        assert nget(LazyJSON(raw), "result", "users", -1, "name") == 'Juan "J" [x]{y}'
+        assert nget(LazyJSON(raw), "result", "users", -3) is None
+
+    def test_buffer_types(self, raw: bytes):
+        for buffer in (raw, bytearray(raw), memoryview(raw)):
+            assert nget(LazyJSON(buffer), "result.users.0.address.city") == "Kyiv"
+
+    def test_nget_many(self, data: Dict[str, Any], raw: bytes):
+        paths = ["result.users.0.name", "result.total", "meta.page", "meta.missing"]
+
+        assert nget_many(LazyJSON(raw), paths) == nget_many(data, paths)
+
+    def test_containers_are_views(self, data: Dict[str, Any], raw: bytes):
+        doc = LazyJSON(raw)
+
+        users = doc["result"]["users"]
+
+        assert isinstance(users, LazyJSON)
+        assert users.is_array
+        assert not doc.is_array
+        assert users.decode() == data["result"]["users"]
+        assert doc.decode() == data
+
+    def test_values_are_cached(self, raw: bytes):
+        doc = LazyJSON(raw)
+
+        assert doc["result"] is doc["result"]
+        assert doc["result"]["users"][0] is doc["result"]["users"][0]
+
+    def test_container_is_scanned_once(self, raw: bytes, monkeypatch):
+        doc = LazyJSON(raw)
+        result = doc["result"]
+        assert len(result) == 2  # scans `result` to the end
+
+        skipped = []
+
+        def skip_value(buffer: bytes, pos: int) -> int:
+            skipped.append(pos)
+            return _skip_value(buffer, pos)
+
+        monkeypatch.setattr("et.lazy_json._skip_value", skip_value)
+
+        assert doc["meta"]["page"] == 1
+        assert raw.index(b"{", 1) not in skipped  # the start of `result`
+
+    def test_mapping_and_sequence_protocol(self, data: Dict[str, Any], raw: bytes):
+        doc = LazyJSON(raw)
+
+        assert list(doc) == list(data)
+        assert len(doc) == len(data)
+        assert "meta" in doc
+        assert "missing" not in doc
+        assert len(doc["result"]["users"]) == 2
+        assert [user["name"] for user in doc["result"]["users"]] == [
+            user["name"] for user in data["result"]["users"]
+        ]
+        assert "b" in doc["result"]["users"][0]["tags"]
+        assert doc.get("missing", 0) == 0
+        assert doc["result"]["users"].get(5) is None
+
+    def test_empty_containers(self):
+        assert LazyJSON(b"{}").decode() == {}
+        assert list(LazyJSON(b"{ }")) == []
+        assert len(LazyJSON(b" [\n] ")) == 0
+        assert nget(LazyJSON(b'{"a": []}'), "a.0") is None
+
+    def test_siblings_after_empty_containers(self):
+        doc = LazyJSON(b'{"a": {}, "b": 2}')
+        assert doc["a"].get("x") is None
+        assert doc.get("b", "-") == 2
+
+        array = LazyJSON(b"[{}, [], {}]")
+        assert array[0].get("x") is None
+        assert array[1].get(0) is None
+        assert array.get(2).decode() == {}
+        assert len(array) == 3
+
+    def test_same_as_decoded_in_any_order(self):
+        rnd = random.Random(42)  # noqa: S311
+
+        def value(depth: int) -> Any:
+            kind = rnd.random()
+            if depth > 3 or kind < 0.3:
+                return rnd.choice([0, -1.5, "s", '"]}', True, None])
+            size = rnd.choice([0, 0, 1, 3])
+            if kind < 0.65:
+                return [value(depth + 1) for _ in range(size)]
+            return {rnd.choice("abc") + str(i): value(depth + 1) for i in range(size)}
+
+        def paths(data: Any, prefix: str) -> List[str]:
+            # existing paths and misses, also inside empty containers
+            found = [f"{prefix}x", f"{prefix}a0", f"{prefix}0", f"{prefix}5"]
+            items = data.items() if isinstance(data, dict) else enumerate(data)
+            for key, item in items:
+                found.append(f"{prefix}{key}")
+                if isinstance(item, (dict, list)):
+                    found.extend(paths(item, f"{prefix}{key}."))
+            return found
+
+        for _ in range(200):
+            data = {f"k{i}": value(0) for i in range(rnd.randint(1, 4))}
+            doc = LazyJSON(json.dumps(data, indent=rnd.choice([None, 1])).encode())
+            all_paths = paths(data, "")
+            rnd.shuffle(all_paths)
+
+            for path in all_paths:
+                result = nget(doc, path, default="-")
+                if isinstance(result, LazyJSON):
+                    result = result.decode()
+                assert result == nget(data, path, default="-"), path
+            assert doc.decode() == data
+
+    def test_escaped_keys(self):
+        doc = LazyJSON(b'{"a\\"b": 1, "\\u0441": 2, "c\\\\": 3}')
+
+        assert list(doc) == ['a"b', "с", "c\\"]
+        assert doc["с"] == 2
+
+    def test_duplicate_keys_first_is_found(self):
+        assert LazyJSON(b'{"a": {"b": 1}, "a": 2}')["a"]["b"] == 1
+
+    def test_deeply_nested(self):
+        nested = "[" * (SKIP_DEPTH + 5) + "1" + "]" * (SKIP_DEPTH + 5)
+        raw = f'{{"deep": {nested}, "after": 2}}'.encode()
+
+        assert LazyJSON(raw)["after"] == 2
+
+    def test_wrong_keys(self, raw: bytes):
+        doc = LazyJSON(raw)
+
+        with raises(KeyError):
+            doc["missing"]
+        with raises(KeyError):
+            doc[0]
+        with raises(TypeError):
+            doc["result"]["users"]["0"]
+        with raises(IndexError):
+            doc["result"]["users"][2]
+
+    @mark.parametrize("raw", [b"1", b'"str"', b"", b"  ", b"null"])
+    def test_not_a_container(self, raw: bytes):
+        err_msg = "Expected a JSON object or array."
+        with raises(ValueError, match=err_msg):
+            LazyJSON(raw)
+
+    @mark.parametrize(
+        ("raw", "err_msg"),
+        [
+            (b'{"a" 1}', "Expecting ':' delimiter"),
+            (b'{"a": 1', "Expecting ',' or '}' delimiter"),
+            (b'{"a": 1 "b": 2}', "Expecting ',' or '}' delimiter"),
+            (b"{a: 1}", "Expecting property name enclosed in double quotes"),
+            (b'{"a": "x', "Unterminated string"),
+            (b'{"a": [1, 2}', "Expecting ',' or '}' delimiter"),
+            (b'{"a": [1, 2', "Unterminated container"),
+            (b'{"a": }', "Expecting value"),
+        ],
+    )
+    def test_malformed(self, raw: bytes, err_msg: str):
+        with raises(json.JSONDecodeError, match=err_msg):
+            LazyJSON(raw)["b"]
+
+    def test_invalid_values_are_reported_on_decode(self):
+        doc = LazyJSON(b'{"a": [1, 2 3], "b": 1}')
+
+        assert doc["b"] == 1
+        with raises(json.JSONDecodeError):
+            doc["a"].decode()
+
+    def test_repr(self):
+        doc = LazyJSON(b'{"a": [1]}')
+
+        assert repr(doc) == "LazyJSON(<object at 0:?>)"
+        assert repr(doc["a"]) == "LazyJSON(<array at 6:?>)"
+        assert len(doc) == 1
+        assert repr(doc) == "LazyJSON(<object at 0:10>)"
+        assert repr(doc["a"]) == "LazyJSON(<array at 6:?>)"
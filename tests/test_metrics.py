@@ -0,0 +1,177 @@
+import asyncio
+from collections.abc import Iterator
+from typing import List, Tuple
+from unittest import mock
+
+from pytest import fixture
+
+from et import Break, catch_a_break, metrics, run_services, service
+from et.metrics import Registry
+
+
+@service
+class UpdatePlanSvc:
+    plan_id: int
+
+    def run(self):
+        return self._helper()
+
+    @catch_a_break
+    def run_with_break(self):
+        err_msg = "Manual stop."
+        raise Break(err_msg)
+
+    async def fetch(self):
+        await asyncio.sleep(0)
+        return self.plan_id
+
+    def _helper(self):
+        return self.plan_id
+
+
+class ListSink:
+    def __init__(self) -> None:
+        self.records: List[Tuple[str, ...]] = []
+
+    def record_init(self, service: str) -> None:
+        self.records.append(("init", service))
+
+    def record_call(self, service: str, method: str, ns: int) -> None:
+        assert ns >= 0
+        self.records.append(("call", service, method))
+
+    def record_break(self, service: str, reason: str) -> None:
+        self.records.append(("break", service, reason))
+
+
+class TestMetrics:
+    @fixture
+    def registry(self) -> Iterator[Registry]:
+        registry = metrics.enable()
+        yield registry
+        metrics.disable()
+
+    def test_snapshot(self, registry: Registry):
+        svc = UpdatePlanSvc(plan_id=777)
+        UpdatePlanSvc(plan_id=1)
+
+        assert svc.run() == 777
+        assert svc.run_with_break() is None
+        assert asyncio.run(svc.fetch()) == 777
+
+        snapshot = registry.snapshot()["UpdatePlanSvc"]
+        assert snapshot["inits"] == 2
+        assert set(snapshot["calls"]) == {"run", "run_with_break", "fetch"}
+        assert snapshot["breaks"] == {"Manual stop.": 1}
+
+        run = snapshot["calls"]["run"]
+        assert run["count"] == 1
+        assert run["sum_ns"] >= 0
+        assert list(run["buckets"]) == [*metrics.DEFAULT_BUCKETS_NS, float("inf")]
+        assert run["buckets"][float("inf")] == 1
+
+    def test_run_services_breaks(self, registry: Registry):
+        @service
+        class CheckPlanSvc:
+            plan_id: int
+
+            def run(self):
+                if self.plan_id < 0:
+                    raise Break
+                return self.plan_id
+
+        result = asyncio.run(run_services([CheckPlanSvc(1), CheckPlanSvc(-1)]))
+
+        assert result == [1, None]
+        snapshot = registry.snapshot()["CheckPlanSvc"]
+        assert snapshot["breaks"] == {"Reason not provided": 1}
+        assert snapshot["calls"]["run"]["count"] == 2
+
+    def test_custom_sink(self):
+        sink = ListSink()
+        assert metrics.enable(sink) is sink
+        try:
+            UpdatePlanSvc(plan_id=777).run_with_break()
+        finally:
+            metrics.disable()
+
+        assert sink.records == [
+            ("init", "UpdatePlanSvc"),
+            ("break", "UpdatePlanSvc", "Manual stop."),
+            ("call", "UpdatePlanSvc", "run_with_break"),
+        ]
+
+    def test_disabled(self):
+        run = vars(UpdatePlanSvc)["run"]
+        init = UpdatePlanSvc.__init__
+
+        registry = metrics.enable()
+        assert vars(UpdatePlanSvc)["run"] is not run
+        metrics.disable()
+        UpdatePlanSvc(plan_id=777).run()
+
+        assert metrics.get_sink() is None
+        assert vars(UpdatePlanSvc)["run"] is run
+        assert UpdatePlanSvc.__init__ is init
+        assert registry.snapshot() == {}
+
+    def test_keeps_patched_methods(self):
+        with mock.patch.object(UpdatePlanSvc, "run", return_value="mocked"):
+            registry = metrics.enable()
+            try:
+                assert UpdatePlanSvc(plan_id=777).run() == "mocked"
+            finally:
+                metrics.disable()
+
+        assert UpdatePlanSvc(plan_id=777).run() == 777
+        assert "run" not in registry.snapshot()["UpdatePlanSvc"]["calls"]
+
+    def test_reset(self, registry: Registry):
+        UpdatePlanSvc(plan_id=777)
+
+        registry.reset()
+
+        assert registry.snapshot() == {}
+
+
+class TestRegistry:
+    def test_buckets(self):
+        registry = Registry(buckets_ns=[100, 10])
+        for ns in (5, 10, 50, 500):
+            registry.record_call("Svc", "run", ns)
+
+        call = registry.snapshot()["Svc"]["calls"]["run"]
+
+        assert call == {
+            "count": 4,
+            "sum_ns": 565,
+            "buckets": {10: 2, 100: 3, float("inf"): 4},
+        }
+
+    def test_to_openmetrics(self):
+        registry = Registry(buckets_ns=[1_000, 1_000_000])
+        registry.record_init("Svc")
+        registry.record_call("Svc", "run", 2_000)
+        registry.record_break("Svc", 'Bad "plan"\n')
+
+        assert registry.to_openmetrics() == (
+            "# TYPE et_service_inits counter\n"
+            'et_service_inits_total{service="Svc"} 1\n'
+            "# TYPE et_service_call_seconds histogram\n"
+            'et_service_call_seconds_bucket{service="Svc",method="run",le="1e-06"} 0\n'
+            'et_service_call_seconds_bucket{service="Svc",method="run",le="0.001"} 1\n'
+            'et_service_call_seconds_bucket{service="Svc",method="run",le="+Inf"} 1\n'
+            'et_service_call_seconds_count{service="Svc",method="run"} 1\n'
+            'et_service_call_seconds_sum{service="Svc",method="run"} 2e-06\n'
+            "# TYPE et_service_breaks counter\n"
+            'et_service_breaks_total{service="Svc",reason="Bad \\"plan\\"\\n"} 1\n'
+            "# EOF\n"
+        )
+
+    def test_empty(self):
+        assert Registry().to_openmetrics() == (
+            "# TYPE et_service_inits counter\n"
+            "# TYPE et_service_call_seconds histogram\n"
+            "# TYPE et_service_breaks counter\n"
+            "# EOF\n"
+        )
@@ -1,8 +1,11 @@
-from typing import Any, Dict
+import re
+from array import array
+from typing import Any, Dict, List
 
-from pytest import fixture, mark
+from pytest import fixture, importorskip, mark, raises
 
-from et import nget
+from et import nget, nget_column, nget_iter, nget_many
+from et.nget import NgetMany, NgetPath, NgetPattern, _split_path, _split_pattern
 
 
 class TestNget:
@@ -48,3 +51,295 @@ class TestNget:
     def test_empty_container(self) -> None:
         assert nget({}, "any", "keys") is None
         assert nget([], 0, 1) is None
+
+
+class TestNgetCompile:
+    @fixture
+    def test_data(self) -> Dict[str, Any]:
+        return {"result": {"users": [{"address": {"street": "Main St"}}]}}
+
+    @mark.parametrize(
+        "keys",
+        [["result", "users", 0, "address", "street"], ["result.users.0.address.street"]],
+    )
+    def test_compile(self, keys: list) -> None:
+        path = nget.compile(*keys)
+
+        assert isinstance(path, NgetPath)
+        assert path.keys == ("result", "users", 0, "address", "street")
+
+    def test_get(self, test_data: Dict[str, Any]) -> None:
+        path = nget.compile("result.users.0.address.street")
+
+        assert path.get(test_data) == "Main St"
+        assert path(test_data) == "Main St"
+
+    def test_get_default(self, test_data: Dict[str, Any]) -> None:
+        path = nget.compile("result.users.1.address")
+
+        assert path.get(test_data) is None
+        assert path.get(test_data, "N/A") == "N/A"
+
+    def test_nget_with_compiled_path(self, test_data: Dict[str, Any]) -> None:
+        users = nget.compile("result.users")
+
+        assert nget(test_data, users, 0, "address.street") == "Main St"
+        assert nget(test_data, users) == test_data["result"]["users"]
+
+    def test_immutable(self) -> None:
+        path = nget.compile("a.b")
+
+        with raises(AttributeError):
+            path.keys = ("c",)
+
+    def test_numeric_key_without_dot_is_not_index(self) -> None:
+        assert nget.compile("0").keys == ("0",)
+        assert nget({"0": "zero"}, "0") == "zero"
+
+    def test_dotted_path_is_cached(self, test_data: Dict[str, Any]) -> None:
+        _split_path.cache_clear()
+
+        nget(test_data, "result.users.0.address.street")
+        nget(test_data, "result.users.0.address.street")
+
+        info = _split_path.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+
+class TestNgetMany:
+    @fixture
+    def test_data(self) -> Dict[str, Any]:
+        return {
+            "result": {
+                "users": [
+                    {"name": "Ivan", "address": {"street": "Main St", "city": "Kyiv"}},
+                    {"name": "Juan", "address": None},
+                ]
+            }
+        }
+
+    def test_mapping(self, test_data: Dict[str, Any]) -> None:
+        result = nget_many(
+            test_data,
+            {
+                "name": "result.users.0.name",
+                "street": "result.users.0.address.street",
+                "city": "result.users.0.address.city",
+                "zip": "result.users.0.address.zip",
+            },
+        )
+
+        assert result == {
+            "name": "Ivan",
+            "street": "Main St",
+            "city": "Kyiv",
+            "zip": None,
+        }
+
+    def test_sequence(self, test_data: Dict[str, Any]) -> None:
+        result = nget_many(
+            test_data, ["result.users.1.name", "result.users.1.address.street"]
+        )
+
+        assert result == ("Juan", None)
+
+    def test_default(self, test_data: Dict[str, Any]) -> None:
+        result = nget_many(
+            test_data, ["result.users.5.name", "result.users.0.name"], default="N/A"
+        )
+
+        assert result == ("N/A", "Ivan")
+
+    def test_prefix_and_leaf(self, test_data: Dict[str, Any]) -> None:
+        users = nget.compile("result.users")
+
+        result = nget_many(test_data, [users, "result.users.0.name", "result"])
+
+        assert result == (test_data["result"]["users"], "Ivan", test_data["result"])
+
+    @mark.parametrize(
+        "paths",
+        [
+            ["result.users.0.address.street", "result.users.1.address.street"],
+            ["result.users.0.name", "result.users.9.name", "missing.0", "result.0"],
+        ],
+    )
+    def test_same_as_nget(self, test_data: Dict[str, Any], paths: list) -> None:
+        result = nget_many(test_data, paths, default=0)
+
+        assert result == tuple(nget(test_data, path, default=0) for path in paths)
+
+    def test_compiled(self, test_data: Dict[str, Any]) -> None:
+        user = nget_many.compile({"name": "result.users.0.name", "city": "result.0"})
+
+        assert isinstance(user, NgetMany)
+        assert user.get(test_data) == {"name": "Ivan", "city": None}
+        assert nget_many(test_data, user, default="N/A") == {
+            "name": "Ivan",
+            "city": "N/A",
+        }
+
+    def test_duplicate_paths(self, test_data: Dict[str, Any]) -> None:
+        result = nget_many(test_data, ["result.users.0.name", "result.users.0.name"])
+
+        assert result == ("Ivan", "Ivan")
+
+    def test_empty_paths(self, test_data: Dict[str, Any]) -> None:
+        assert nget_many(test_data, []) == ()
+        assert nget_many(test_data, {}) == {}
+
+
+class TestNgetColumn:
+    @fixture
+    def records(self) -> List[Dict[str, Any]]:
+        return [
+            {"user": {"age": 30, "kids": [{"age": 7}]}},
+            {"user": {"age": 25, "kids": []}},
+            {"user": None},
+            {"user": {"age": 41, "kids": [{"age": 12}, {"age": 9}]}},
+        ]
+
+    @mark.parametrize(
+        "keys", [["user", "kids", 0, "age"], ["user.kids.0.age"], ["user.kids", 0, "age"]]
+    )
+    def test_same_as_nget(self, records: List[Dict[str, Any]], keys: list) -> None:
+        result = nget_column(records, *keys, default=-1)
+
+        assert result == [nget(record, *keys, default=-1) for record in records]
+        assert result == [7, -1, -1, 12]
+
+    def test_all_found(self) -> None:
+        records = [{"a": {"b": i}} for i in range(5)]
+
+        assert nget_column(records, "a.b") == [0, 1, 2, 3, 4]
+
+    def test_iterable(self) -> None:
+        records = ({"a": i} for i in range(3))
+
+        assert nget_column(records, "a") == [0, 1, 2]
+
+    def test_empty(self) -> None:
+        assert nget_column([], "a.b") == []
+
+    def test_array(self, records: List[Dict[str, Any]]) -> None:
+        result = nget_column(records, "user.age", default=0, dtype="q")
+
+        assert result == array("q", [30, 25, 0, 41])
+
+    @mark.parametrize("dtype", ["int64", "", "bB", int])
+    def test_invalid_typecode(self, records: List[Dict[str, Any]], dtype: Any) -> None:
+        err_msg = re.escape(f"Invalid array typecode: {dtype!r}.")
+        with raises(ValueError, match=err_msg):
+            nget_column(records, "user.age", dtype=dtype)
+
+    def test_masked(self, records: List[Dict[str, Any]]) -> None:
+        np = importorskip("numpy")
+
+        result = nget_column(records, "user.age", dtype="int64", masked=True)
+
+        assert result.dtype == np.int64
+        assert result.mask.tolist() == [False, False, True, False]
+        assert result.compressed().tolist() == [30, 25, 41]
+
+    def test_masked_all_found(self, records: List[Dict[str, Any]]) -> None:
+        importorskip("numpy")
+
+        result = nget_column(records[:2], "user.age", masked=True)
+
+        assert result.mask.tolist() == [False, False]
+        assert result.tolist() == [30, 25]
+
+
+class TestNgetIter:
+    @fixture
+    def test_data(self) -> Dict[str, Any]:
+        return {
+            "users": [
+                {"name": "Ivan", "tags": ["a", "b", "c"]},
+                {"name": "Juan", "tags": []},
+                {"name": "Ann"},
+            ],
+            "groups": {"admins": {"size": 1}, "guests": {"size": 7}},
+        }
+
+    @mark.parametrize("keys", [["users.*.name"], ["users", "*", "name"]])
+    def test_wildcard(self, test_data: Dict[str, Any], keys: list) -> None:
+        assert list(nget_iter(test_data, *keys)) == ["Ivan", "Juan", "Ann"]
+
+    def test_wildcard_over_mapping(self, test_data: Dict[str, Any]) -> None:
+        assert list(nget_iter(test_data, "groups.*.size")) == [1, 7]
+
+    @mark.parametrize(
+        ("pattern", "expected"),
+        [
+            ("users.0:2.name", ["Ivan", "Juan"]),
+            ("users.1:.name", ["Juan", "Ann"]),
+            ("users.-1:.name", ["Ann"]),
+            ("users.::2.name", ["Ivan", "Ann"]),
+            ("users.5:10.name", []),
+        ],
+    )
+    def test_slice(self, test_data: Dict[str, Any], pattern: str, expected: list) -> None:
+        assert list(nget_iter(test_data, pattern)) == expected
+
+    def test_slice_object(self, test_data: Dict[str, Any]) -> None:
+        result = nget_iter(test_data, "users", slice(0, 2), "name")
+
+        assert list(result) == ["Ivan", "Juan"]
+
+    @mark.parametrize("pattern", ["users.::0", "users.1:2:0"])
+    def test_slice_zero_step(self, test_data: Dict[str, Any], pattern: str) -> None:
+        err_msg = "Slice step cannot be zero, got '.*'."
+        with raises(ValueError, match=err_msg):
+            nget_iter(test_data, pattern)
+
+    def test_slice_as_mapping_key(self) -> None:
+        data = {"a": {"10:30": 1}}
+
+        assert list(nget_iter(data, "a.10:30")) == [nget(data, "a.10:30")] == [1]
+        assert list(nget_iter(data, "a.0:1", default="-")) == ["-"]
+
+    def test_nested(self, test_data: Dict[str, Any]) -> None:
+        result = nget_iter(test_data, "users.*.tags.1:")
+
+        assert list(result) == ["b", "c", None]
+
+    def test_default(self, test_data: Dict[str, Any]) -> None:
+        result = nget_iter(test_data, "users.*.tags.0", default="-")
+
+        assert list(result) == ["a", "-", "-"]
+
+    @mark.parametrize("pattern", ["missing.*", "users.0.name.*", "groups.0:1"])
+    def test_not_a_container(self, test_data: Dict[str, Any], pattern: str) -> None:
+        assert list(nget_iter(test_data, pattern, default="-")) == ["-"]
+
+    def test_without_wildcards(self, test_data: Dict[str, Any]) -> None:
+        assert list(nget_iter(test_data, "users.0.name")) == ["Ivan"]
+
+    def test_lazy(self) -> None:
+        class Users(list):
+            def __iter__(self):
+                yield {"name": "Ivan"}
+                msg = "Consumed too far."
+                raise AssertionError(msg)
+
+        result = nget_iter({"users": Users()}, "users.*.name")
+
+        assert next(result) == "Ivan"
+
+    def test_compile(self, test_data: Dict[str, Any]) -> None:
+        pattern = nget_iter.compile("users.*", "name")
+
+        assert isinstance(pattern, NgetPattern)
+        assert pattern.keys == ("users", "*", "name")
+        assert list(pattern.iter(test_data)) == ["Ivan", "Juan", "Ann"]
+        assert list(nget_iter(test_data, pattern)) == ["Ivan", "Juan", "Ann"]
+
+    def test_pattern_is_cached(self, test_data: Dict[str, Any]) -> None:
+        _split_pattern.cache_clear()
+
+        list(nget_iter(test_data, "users.*.name"))
+        list(nget_iter(test_data, "users.*.name"))
+
+        info = _split_pattern.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
@@ -0,0 +1,181 @@
+import json
+from io import BytesIO, StringIO
+from typing import Any, Dict, Optional
+
+from pytest import fixture, mark, raises
+
+from et import nget_iter, nget_stream
+
+
+class TestNgetStream:
+    @fixture
+    def document(self) -> Dict[str, Any]:
+        return {
+            "meta": {"skip": [1, {"text": ']}, " tricky'}]},
+            "result": {
+                "count": 3,
+                "users": [
+                    {"id": 1, "name": "Ivan", "kids": [{"name": "Leo"}]},
+                    {"id": 2, "name": "Juan", "kids": []},
+                    {"id": 12345678901234567890, "name": "Ann"},
+                ],
+            },
+        }
+
+    @mark.parametrize("chunk_size", [1, 3, 16, 1024])
+    def test_nested_array(self, document: Dict[str, Any], chunk_size: int) -> None:
+        source = BytesIO(json.dumps(document).encode())
+
+        result = nget_stream(source, "result.users.*.id", chunk_size=chunk_size)
+
+        assert list(result) == [1, 2, 12345678901234567890]
+
+    def test_mapping(self, document: Dict[str, Any]) -> None:
+        source = StringIO(json.dumps(document, indent=4))
+        paths = {"name": "result.users.*.name", "kid": "result.users.*.kids.0.name"}
+
+        result = nget_stream(source, paths, default="N/A", chunk_size=8)
+
+        assert list(result) == [
+            {"name": "Ivan", "kid": "Leo"},
+            {"name": "Juan", "kid": "N/A"},
+            {"name": "Ann", "kid": "N/A"},
+        ]
+
+    def test_sequence(self) -> None:
+        source = StringIO('[{"a": 1, "b": [2]}, {"a": 3}, 4]')
+
+        result = nget_stream(source, ["*.a", "*.b.0"], chunk_size=2)
+
+        assert list(result) == [(1, 2), (3, None), (None, None)]
+
+    def test_ndjson(self) -> None:
+        source = StringIO('{"name": "Ivan", "age": 30}\n\n{"name": "Juan"}\n')
+
+        result = nget_stream(source, ["*.name", "*.age"], chunk_size=4, ndjson=True)
+
+        assert list(result) == [("Ivan", 30), ("Juan", None)]
+
+    @mark.parametrize("suffix", [".ndjson", ".jsonl"])
+    def test_ndjson_file_path(self, tmp_path, suffix: str) -> None:
+        path = tmp_path / f"users{suffix}"
+        path.write_text('{"name": "Ivan", "age": 3}\n')
+
+        assert list(nget_stream(path, "*.name")) == ["Ivan"]
+        assert list(nget_stream(str(path), "*", ndjson=False)) == ["Ivan", 3]
+
+    def test_ndjson_lines_of_arrays(self) -> None:
+        source = StringIO("[1, 2]\n[3, 4]\n")
+
+        assert list(nget_stream(source, "*.0", ndjson=True)) == [1, 3]
+
+    def test_extra_data_after_array(self) -> None:
+        with raises(json.JSONDecodeError, match="pass ndjson=True"):
+            list(nget_stream(StringIO("[1, 2]\n[3, 4]\n"), "*.0"))
+
+    @mark.parametrize("ndjson", [None, False])
+    def test_top_level_object(self, ndjson: Optional[bool]) -> None:
+        data = {"u1": {"id": 1}, "u2": {"id": 2}}
+
+        result = nget_stream(StringIO(json.dumps(data)), "*.id", ndjson=ndjson)
+
+        assert list(result) == list(nget_iter(data, "*.id")) == [1, 2]
+
+    def test_single_ndjson_line(self) -> None:
+        source = StringIO('{"id": 1}\n')
+
+        assert list(nget_stream(source, "*.id", ndjson=True)) == [1]
+
+    def test_lines_are_not_detected(self) -> None:
+        source = StringIO('{"name": "Ivan", "age": 3}\n{"name": "Juan"}\n')
+
+        with raises(json.JSONDecodeError, match="pass ndjson=True"):
+            list(nget_stream(source, "*.name"))
+
+    def test_ndjson_with_prefix(self) -> None:
+        with raises(ValueError, match="leading '\\*'"):
+            nget_stream(StringIO(""), "users.*.id", ndjson=True)
+
+    def test_scalar_document(self) -> None:
+        assert list(nget_stream(StringIO("1"), "*.id", ndjson=False)) == []
+
+    def test_object_values(self) -> None:
+        source = StringIO('{"users": {"u1": {"id": 1}, "u2": {"id": 2}}}')
+
+        assert list(nget_stream(source, "users.*.id")) == [1, 2]
+
+    def test_file_path(self, tmp_path, document: Dict[str, Any]) -> None:
+        path = tmp_path / "export.json"
+        path.write_text(json.dumps(document))
+
+        assert list(nget_stream(path, "result.users.*.name")) == ["Ivan", "Juan", "Ann"]
+        assert list(nget_stream(str(path), "result.users.*.name")) == [
+            "Ivan",
+            "Juan",
+            "Ann",
+        ]
+
+    @mark.parametrize("path", ["missing.*.id", "result.count.*", "result.users.9.*"])
+    def test_missing_container(self, document: Dict[str, Any], path: str) -> None:
+        source = StringIO(json.dumps(document))
+
+        assert list(nget_stream(source, path)) == []
+
+    def test_skipped_strings(self, document: Dict[str, Any]) -> None:
+        source = StringIO(json.dumps(document))
+
+        assert list(nget_stream(source, "meta.skip.*.text", chunk_size=5)) == [
+            None,
+            ']}, " tricky',
+        ]
+
+    @mark.parametrize("chunk_size", [1, 3, 16, 1024])
+    def test_siblings_are_skipped_without_decoding(
+        self, monkeypatch, document: Dict[str, Any], chunk_size: int
+    ) -> None:
+        decoded = []
+        raw_decode = json.JSONDecoder.raw_decode
+
+        def counted(decoder: json.JSONDecoder, text: str, pos: int) -> Any:
+            value, end = raw_decode(decoder, text, pos)
+            decoded.append(value)
+            return value, end
+
+        monkeypatch.setattr(json.JSONDecoder, "raw_decode", counted)
+        source = StringIO(json.dumps({"skip": document, "escaped": 'a\\"]', **document}))
+
+        result = nget_stream(source, "result.users.*.id", chunk_size=chunk_size)
+
+        assert list(result) == [1, 2, 12345678901234567890]
+        assert document["meta"] not in decoded
+        assert document not in decoded
+
+    def test_invalid_json_is_reported_without_reading_further(self) -> None:
+        reads = []
+
+        class Source(StringIO):
+            def read(self, size: int = -1) -> str:
+                reads.append(size)
+                return super().read(size)
+
+        source = Source('[{"a": 1 "b": 2}]' + " " * 10_000)
+
+        with raises(json.JSONDecodeError):
+            list(nget_stream(source, "*.a", chunk_size=16))
+        assert len(reads) < 5
+
+    def test_empty(self) -> None:
+        assert list(nget_stream(StringIO("[]"), "*.id")) == []
+        assert list(nget_stream(StringIO(""), "*.id")) == []
+
+    def test_no_wildcard(self) -> None:
+        with raises(ValueError, match="has no '\\*' wildcard"):
+            nget_stream(StringIO("[]"), "result.users")
+
+    def test_different_prefixes(self) -> None:
+        with raises(ValueError, match="must stream over the same container"):
+            nget_stream(StringIO("[]"), ["a.*.id", "b.*.id"])
+
+    def test_invalid_json(self) -> None:
+        with raises(json.JSONDecodeError):
+            list(nget_stream(StringIO('[{"a": 1} {"a": 2}]'), "*.a"))
@@ -0,0 +1,150 @@
+import re
+from collections import OrderedDict
+from copy import deepcopy
+from typing import Any, Dict
+
+from pytest import fixture, mark, raises
+
+from et import nget, nset, nupdate
+from et.nget import NgetPath
+
+
+class TestNset:
+    @fixture
+    def data(self) -> Dict[str, Any]:
+        return {
+            "result": {"users": [{"name": "Ivan", "tags": ["a", "b"]}, {"name": "Juan"}]},
+            "meta": {"page": 1},
+        }
+
+    @mark.parametrize(
+        "path",
+        [
+            "result.users.0.name",
+            "result.users.1.tags",
+            "meta.page",
+            "meta",
+            "new",
+        ],
+    )
+    def test_set(self, data: Dict[str, Any], path: str):
+        original = deepcopy(data)
+
+        updated = nset(data, path, "value")
+
+        assert nget(updated, path) == "value"
+        assert data == original
+
+    def test_structural_sharing(self, data: Dict[str, Any]):
+        updated = nset(data, "result.users.1.name", "John")
+
+        assert updated["meta"] is data["meta"]
+        assert updated["result"]["users"][0] is data["result"]["users"][0]
+        assert updated["result"] is not data["result"]
+        assert updated["result"]["users"] is not data["result"]["users"]
+        assert updated["result"]["users"][1] == {"name": "John"}
+
+    def test_missing_keys_are_created(self, data: Dict[str, Any]):
+        updated = nset(data, "result.users.0.address.city", "Kyiv")
+
+        assert updated["result"]["users"][0] == {
+            "name": "Ivan",
+            "tags": ["a", "b"],
+            "address": {"city": "Kyiv"},
+        }
+
+    def test_compiled_path_and_int_keys(self):
+        data = {"a.b": {1: "one"}}
+
+        assert nset(data, NgetPath(("a.b", 1)), "uno") == {"a.b": {1: "uno"}}
+        assert nset([0, [1, 2]], "1.0", 5) == [0, [5, 2]]
+        assert nset([0, [1, 2]], nget.compile(1, -1), 5) == [0, [1, 5]]
+
+    def test_containers_keep_types(self):
+        data = {"users": ({"name": "Ivan"},), "meta": OrderedDict(page=1)}
+
+        updated = nset(nset(data, "users.0.name", "Juan"), "meta.page", 2)
+
+        assert updated == {"users": ({"name": "Juan"},), "meta": OrderedDict(page=2)}
+        assert type(updated["users"]) is tuple
+        assert type(updated["meta"]) is OrderedDict
+
+    @mark.parametrize(
+        ("path", "error", "err_msg"),
+        [
+            (
+                "result.users.5.name",
+                IndexError,
+                "Index 5 out of range at 'result.users'.",
+            ),
+            ("result.users.x", TypeError, "Cannot set 'x' in list at 'result.users'."),
+            ("meta.page.x", TypeError, "Cannot set 'x' in int at 'meta.page'."),
+        ],
+    )
+    def test_invalid_path(
+        self, data: Dict[str, Any], path: str, error: type, err_msg: str
+    ):
+        with raises(error, match=re.escape(err_msg)):
+            nset(data, path, "value")
+
+    def test_not_container(self):
+        with raises(TypeError, match=re.escape("Cannot set 'a' in str at the root.")):
+            nset("text", "a", 1)
+
+
+class TestNupdate:
+    @fixture
+    def data(self) -> Dict[str, Any]:
+        return {"user": {"name": "Ivan", "tags": ["a"]}, "meta": {"page": 1}}
+
+    def test_update(self, data: Dict[str, Any]):
+        original = deepcopy(data)
+
+        updated = nupdate(
+            data, {"user.name": "Juan", "user.tags.0": "b", "user.address.city": "Kyiv"}
+        )
+
+        assert updated == {
+            "user": {"name": "Juan", "tags": ["b"], "address": {"city": "Kyiv"}},
+            "meta": {"page": 1},
+        }
+        assert updated["meta"] is data["meta"]
+        assert data == original
+
+    def test_same_as_nset(self, data: Dict[str, Any]):
+        updates = {"user.name": "Juan", "meta.page": 2, "meta.size": 10}
+
+        expected = data
+        for path, value in updates.items():
+            expected = nset(expected, path, value)
+
+        assert nupdate(data, updates) == expected
+
+    def test_no_updates(self, data: Dict[str, Any]):
+        assert nupdate(data, {}) is data
+
+    @mark.parametrize(
+        ("updates", "err_msg"),
+        [
+            (
+                {"user": {}, "user.name": "Juan"},
+                "Conflicting paths: 'user' is updated twice.",
+            ),
+            (
+                {"user.name": "Juan", "user": {}},
+                "Conflicting paths: 'user' is updated twice.",
+            ),
+            (
+                {"user.tags.0": "b", nget.compile("user", "tags", 0): "c"},
+                "Conflicting paths: 'user.tags.0' is updated twice.",
+            ),
+        ],
+    )
+    def test_conflicting_paths(self, data: Dict[str, Any], updates: Any, err_msg: str):
+        with raises(ValueError, match=re.escape(err_msg)):
+            nupdate(data, updates)
+
+    def test_invalid_path(self, data: Dict[str, Any]):
+        err_msg = "Index 1 out of range at 'user.tags'."
+        with raises(IndexError, match=re.escape(err_msg)):
+            nupdate(data, {"user.name": "Juan", "user.tags.1": "b"})
@@ -0,0 +1,103 @@
+import json
+import re
+from typing import Any, Dict, Iterator, List
+
+from pytest import fixture, mark, raises
+
+from et import nget_many
+from et.parallel import CHUNKS_PER_WORKER, extract
+
+
+def make_records(count: int) -> Iterator[Dict[str, Any]]:
+    for i in range(count):
+        user: Dict[str, Any] = {"id": i, "name": f"user{i}"}
+        if i % 3:
+            user["address"] = {"city": f"city{i}"}
+        yield {"user": user}
+
+
+class TestExtract:
+    @fixture
+    def records(self) -> List[Dict[str, Any]]:
+        return list(make_records(50))
+
+    @mark.parametrize("workers", [1, 2])
+    @mark.parametrize("chunksize", [1, 7, 100])
+    def test_paths(self, records: List[Dict[str, Any]], workers: int, chunksize: int):
+        paths = ["user.id", "user.address.city"]
+
+        result = extract(iter(records), paths, workers=workers, chunksize=chunksize)
+
+        assert list(result) == [nget_many(record, paths) for record in records]
+
+    @mark.parametrize("workers", [1, 2])
+    def test_named_paths_with_default(self, records: List[Dict[str, Any]], workers: int):
+        paths = nget_many.compile({"id": "user.id", "city": "user.address.city"})
+
+        result = list(
+            extract(records, paths, default="N/A", workers=workers, chunksize=8)
+        )
+
+        assert result[:2] == [{"id": 0, "city": "N/A"}, {"id": 1, "city": "city1"}]
+        assert len(result) == len(records)
+
+    @mark.parametrize("workers", [1, 2])
+    def test_keys(self, workers: int):
+        records = [{"id": i, "name": f"user{i}"} for i in range(20)]
+
+        result = extract(records, keys=["id", "name"], workers=workers, chunksize=3)
+
+        assert list(result) == [(i, f"user{i}") for i in range(20)]
+
+    @mark.parametrize("workers", [1, 2])
+    def test_missing_key(self, workers: int):
+        records = [{"id": 1}, {"id": 2}, {"name": "user3"}]
+
+        err_msg = re.escape("Key(s) ['id'] not found in dictionary.")
+        with raises(KeyError, match=err_msg):
+            list(extract(records, keys=["id"], workers=workers, chunksize=2))
+
+        result = extract(records, keys=["id"], default=None, workers=workers)
+        assert list(result) == [1, 2, None]
+
+    @mark.parametrize("workers", [1, 2])
+    def test_loads(self, records: List[Dict[str, Any]], workers: int):
+        lines = [json.dumps(record).encode() for record in records]
+
+        result = extract(
+            lines, ["user.name"], workers=workers, chunksize=9, loads=json.loads
+        )
+
+        assert list(result) == [(f"user{i}",) for i in range(len(records))]
+
+    def test_bounded_reads(self):
+        read = 0
+
+        def counted() -> Iterator[Dict[str, Any]]:
+            nonlocal read
+            for record in make_records(10_000):
+                read += 1
+                yield record
+
+        result = extract(counted(), ["user.id"], workers=2, chunksize=10)
+
+        assert next(result) == (0,)
+        # the first chunk is consumed only after the pool is full
+        assert read <= (CHUNKS_PER_WORKER * 2 + 1) * 10
+        result.close()
+
+    def test_empty(self):
+        assert list(extract([], ["user.id"], workers=2)) == []
+
+    @mark.parametrize(
+        ("kwargs", "err_msg"),
+        [
+            ({}, "Either paths or keys must be given."),
+            ({"paths": ["id"], "keys": ["id"]}, "Either paths or keys must be given."),
+            ({"paths": ["id"], "workers": 0}, "Workers must be at least 1, got 0."),
+            ({"paths": ["id"], "chunksize": 0}, "Chunk size must be at least 1, got 0."),
+        ],
+    )
+    def test_invalid_arguments(self, kwargs: Dict[str, Any], err_msg: str):
+        with raises(ValueError, match=re.escape(err_msg)):
+            extract([], **kwargs)
@@ -0,0 +1,182 @@
+import sys
+import threading
+from typing import Any, List, Optional
+
+from pytest import fixture, mark, raises
+
+from et import Break, catch_a_break, metrics, service, trace
+from et.pool import ServicePool
+
+
+@service(pool=2)
+class HandleSvc:
+    message: Any
+    retries: int = 0
+
+    @catch_a_break
+    def run(self) -> Optional[Any]:
+        self.parsed = self.message  # an attribute that is not a field
+        if self.message is None:
+            err_msg = "Empty message."
+            raise Break(err_msg)
+        return self.message
+
+
+@fixture(autouse=True)
+def clear_pools() -> None:
+    HandleSvc.acquire.pool.clear()
+
+
+class TestServicePool:
+    def test_reuses_instances(self):
+        with HandleSvc.acquire("a", retries=1) as first:
+            assert first.run() == "a"
+
+        with HandleSvc.acquire("b") as second:
+            assert second is first
+            assert second == HandleSvc("b", retries=0)
+            assert second.run() == "b"
+
+    def test_new_instance_when_pool_is_empty(self):
+        with HandleSvc.acquire("a") as first, HandleSvc.acquire("b") as second:
+            assert first is not second
+
+        assert len(HandleSvc.acquire.pool) == 2
+
+    def test_size_is_capped(self):
+        with HandleSvc.acquire(1), HandleSvc.acquire(2), HandleSvc.acquire(3):
+            pass
+
+        assert len(HandleSvc.acquire.pool) == 2
+
+    def test_drops_attributes_that_are_not_fields(self):
+        with HandleSvc.acquire("a") as svc:
+            svc.run()
+            assert svc.parsed == "a"
+
+        with HandleSvc.acquire("b") as svc:
+            assert not hasattr(svc, "parsed")
+
+    def test_released_once(self):
+        with HandleSvc.acquire("a") as svc:
+            with svc:  # a nested `with` doesn't release it
+                pass
+            with HandleSvc.acquire("b") as other:
+                assert other is not svc
+            assert svc.message == "a"
+
+        assert len(HandleSvc.acquire.pool) == 2
+        assert HandleSvc.acquire("c") is not HandleSvc.acquire("d")
+
+    def test_kept_reference_is_not_released_again(self):
+        with HandleSvc.acquire("a") as svc:
+            pass
+        with svc:
+            pass
+
+        assert len(HandleSvc.acquire.pool) == 1
+
+    def test_reused_after_break(self):
+        with HandleSvc.acquire(None) as first:
+            assert first.run() is None
+
+        with HandleSvc.acquire("a") as second:
+            assert second is first
+
+    def test_not_reused_after_exception(self):
+        err_msg = "Failed."
+        with raises(ValueError, match=err_msg), HandleSvc.acquire("a") as failed:
+            raise ValueError(err_msg)
+
+        with HandleSvc.acquire("a") as svc:
+            assert svc is not failed
+        assert failed.message == "a"
+
+    @mark.skipif(sys.version_info < (3, 10), reason="slots require Python 3.10+")
+    def test_slotted_and_frozen(self):
+        @service(pool=1, slots=True, frozen=True)
+        class FrozenHandleSvc:
+            message: Any
+
+        with FrozenHandleSvc.acquire("a") as first:
+            pass
+
+        with FrozenHandleSvc.acquire("b") as second:
+            assert second is first
+            assert second.message == "b"
+
+    def test_plain_construction_is_released_too(self):
+        with HandleSvc("a") as svc:
+            pass
+
+        with HandleSvc.acquire("b") as reused:
+            assert reused is svc
+
+    def test_subclasses_are_not_pooled(self):
+        class SubHandleSvc(HandleSvc):
+            pass
+
+        with SubHandleSvc.acquire("a") as first:
+            assert type(first) is SubHandleSvc
+
+        with SubHandleSvc.acquire("b") as second:
+            assert second is not first
+        assert len(HandleSvc.acquire.pool) == 0
+
+    def test_per_thread(self):
+        with HandleSvc.acquire("main") as main:
+            pass
+        acquired: List[Any] = []
+
+        def worker() -> None:
+            with HandleSvc.acquire("worker") as svc:
+                acquired.append(svc)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        assert acquired[0] is not main
+        assert len(HandleSvc.acquire.pool) == 1
+
+    def test_reinit_is_traced_and_counted(self):
+        buffer = trace.enable()
+        registry = metrics.enable()
+        try:
+            for message in ("a", "b"):
+                with HandleSvc.acquire(message):
+                    pass
+        finally:
+            metrics.disable()
+            trace.disable()
+
+        assert registry.snapshot()["HandleSvc"]["inits"] == 2
+        assert [entry.args for entry in buffer.entries()] == [("a",), ("b",)]
+
+    def test_size_must_be_positive(self):
+        err_msg = "Pool size must be at least 1, got -1."
+        with raises(ValueError, match=err_msg):
+
+            @service(pool=-1)
+            class _Svc:
+                message: Any
+
+    def test_conflicting_methods(self):
+        err_msg = "Service 'ContextSvc' already defines '__enter__', it can't be pooled."
+        with raises(ValueError, match=err_msg):
+
+            @service(pool=1)
+            class ContextSvc:
+                def __enter__(self) -> Any:
+                    return self
+
+    def test_no_pool_by_default(self):
+        @service
+        class PlainSvc:
+            message: Any
+
+        assert not hasattr(PlainSvc, "acquire")
+
+    def test_repr(self):
+        assert repr(HandleSvc.acquire.pool) == "ServicePool(HandleSvc, size=2)"
+        assert isinstance(HandleSvc.acquire.pool, ServicePool)
@@ -0,0 +1,141 @@
+import re
+from collections import OrderedDict
+from typing import Any, Dict, List, Mapping, Optional, TypedDict
+
+from pytest import fixture, mark, raises
+
+from et import Schema, nget
+from et.schema import _accessor_factory
+
+
+class Address(TypedDict):
+    street: str
+    city: Optional[str]
+
+
+class User(TypedDict, total=False):
+    id: int
+    address: Optional[Address]
+    tags: List[str]
+
+
+class Response(TypedDict):
+    users: List[User]
+    meta: Dict[str, Any]
+
+
+class TestSchema:
+    @fixture
+    def sample(self) -> Dict[str, Any]:
+        return {
+            "result": {
+                "users": [
+                    {"id": 1, "address": {"street": "Main St", "city": "Kyiv"}},
+                    {"id": 2, "address": None, "phone": "555"},
+                ],
+                "meta": {"total": 2},
+            }
+        }
+
+    @fixture
+    def schema(self, sample: Dict[str, Any]) -> Schema:
+        return Schema.from_sample(sample)
+
+    @mark.parametrize(
+        "path",
+        [
+            "result.meta.total",
+            "result.users.0.id",
+            "result.users.0.address.city",
+            "result.users.1.address.city",
+            "result.users.1.phone",
+            "result.users.0.phone",
+            "result.users.5.id",
+            "result.users.-1.id",
+            "result.users.-3.id",
+            "result.company.name",
+            "result.meta.total.value",
+            "result.users.id",
+            "result",
+        ],
+    )
+    def test_same_as_nget(self, schema: Schema, sample: Dict[str, Any], path: str):
+        accessor = schema.accessor(path)
+
+        assert accessor(sample) == nget(sample, path)
+        assert accessor(sample, "N/A") == nget(sample, path, default="N/A")
+
+    @mark.parametrize(
+        "doc",
+        [
+            {},
+            {"result": None},
+            {"result": []},
+            {"result": {"users": []}},
+            {"result": {"users": [None]}},
+            {"result": {"users": [{}]}},
+            {"result": {"users": [{"address": "Main St"}]}},
+            {"result": {"users": ({"address": {"city": "Lviv"}},)}},
+            {"result": OrderedDict(users=[{"address": {"city": "Lviv"}}])},
+            {"result": {"users": [{"address": {"city": "Lviv"}}]}},
+            [{"city": "Lviv"}],
+            None,
+            "result",
+        ],
+    )
+    def test_other_shapes(self, schema: Schema, doc: Any):
+        accessor = schema.accessor("result", "users", 0, "address.city")
+
+        assert accessor(doc, "N/A") == nget(
+            doc, "result.users.0.address.city", default="N/A"
+        )
+
+    def test_mapping_without_get(self, schema: Schema):
+        class Lookup:
+            def __getitem__(self, key: str) -> Any:
+                return {"name": key}
+
+        # "company" is not in the sample, so it's looked up with `.get`
+        assert schema.accessor("result.company.name")({"result": Lookup()}) == "company"
+
+    def test_typeddict(self):
+        schema = Schema.from_typeddict(Response)
+        doc = {"users": [{"address": {"street": "Main St", "city": None}}], "meta": {}}
+
+        assert schema.paths() == ["users", "meta"]
+        assert schema.accessor("users.0.address.street")(doc) == "Main St"
+        assert schema.accessor("users.0.address.city.name")(doc, "N/A") == "N/A"
+        assert schema.accessor("users.0.id")(doc, 0) == 0
+        assert schema.accessor("meta.page")(doc, 1) == 1
+        assert schema.accessor("users.0.address.street")({"users": [{}]}) is None
+
+    def test_not_typeddict(self):
+        err_msg = re.escape("Expected a TypedDict, got <class 'dict'>.")
+        with raises(TypeError, match=err_msg):
+            Schema.from_typeddict(dict)
+
+    def test_accessors(self, schema: Schema, sample: Dict[str, Any]):
+        accessors = schema.accessors()
+
+        assert list(accessors) == ["result.users", "result.meta.total"]
+        assert accessors["result.meta.total"](sample) == 2
+
+        named: Mapping[str, Any] = {
+            "total": "result.meta.total",
+            "first": "result.users.0.id",
+        }
+        assert {name: get(sample) for name, get in schema.accessors(named).items()} == {
+            "total": 2,
+            "first": 1,
+        }
+
+    def test_generated_once_per_shape(self, schema: Schema):
+        _accessor_factory.cache_clear()
+
+        schema.accessor("result.users.0.id")
+        schema.accessor("result.users.1.id")
+
+        assert _accessor_factory.cache_info().currsize == 1
+
+    def test_repr(self, schema: Schema):
+        assert repr(schema) == "Schema(['result.users', 'result.meta.total'])"
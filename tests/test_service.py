@@ -1,8 +1,14 @@
+import asyncio
+import inspect
 import logging
+import sys
+from collections.abc import Iterator
+from dataclasses import FrozenInstanceError
+from unittest import mock
 
-from pytest import LogCaptureFixture, fixture
+from pytest import LogCaptureFixture, fixture, mark, raises
 
-from et import Break, catch_a_break, service
+from et import Break, catch_a_break, run_services, service
 
 
 @service
@@ -71,3 +77,303 @@ class TestService:
         assert result is None
         msg = "Break svc operation. Reason: 'Manual stop.'"
         assert [msg] == caplog.messages
+
+
+requires_slots = mark.skipif(
+    sys.version_info < (3, 10), reason="slots and kw_only require Python 3.10+"
+)
+
+
+class TestServiceOptions:
+    @requires_slots
+    def test_slots(self, caplog: LogCaptureFixture):
+        @service(slots=True)
+        class SlottedSvc:
+            plan_id: int
+
+            def run(self):
+                return self.plan_id
+
+        with caplog.at_level(logging.DEBUG):
+            svc = SlottedSvc(plan_id=777)
+
+        assert svc.run() == 777
+        assert SlottedSvc.__slots__ == ("plan_id",)
+        assert not hasattr(svc, "__dict__")
+        msg = "Initializing 'SlottedSvc' with args=(), kwargs={'plan_id': 777}"
+        assert [msg] == caplog.messages
+
+    def test_frozen(self, caplog: LogCaptureFixture):
+        @service(frozen=True)
+        class FrozenSvc:
+            plan_id: int
+
+        with caplog.at_level(logging.DEBUG):
+            svc = FrozenSvc(777)
+
+        with raises(FrozenInstanceError):
+            svc.plan_id = 1  # type: ignore[misc]
+        assert svc == FrozenSvc(777)
+        assert hash(svc) == hash(FrozenSvc(777))
+        msg = "Initializing 'FrozenSvc' with args=(777,), kwargs={}"
+        assert [msg] == caplog.messages
+
+    @requires_slots
+    def test_kw_only(self):
+        @service(kw_only=True)
+        class KwOnlySvc:
+            plan_id: int
+            dry_run: bool = False
+
+        assert KwOnlySvc(plan_id=777).plan_id == 777
+        with raises(TypeError):
+            KwOnlySvc(777)  # type: ignore[misc]
+
+    @requires_slots
+    def test_all_options(self):
+        @service(slots=True, frozen=True, kw_only=True)
+        class RequestSvc:
+            request_id: str
+
+        svc = RequestSvc(request_id="abc")
+
+        assert svc.request_id == "abc"
+        assert not hasattr(svc, "__dict__")
+        with raises(FrozenInstanceError):
+            svc.request_id = "xyz"  # type: ignore[misc]
+
+    def test_without_options(self):
+        @service()
+        class PlainSvc:
+            plan_id: int
+
+        assert PlainSvc(777).plan_id == 777
+        assert hasattr(PlainSvc(777), "__dict__")
+
+
+class TestInitLogging:
+    @fixture
+    def service_logger(self) -> Iterator[logging.Logger]:
+        logger = logging.getLogger("et.service")
+        level = logger.level
+        yield logger
+        logger.setLevel(level)
+
+    def test_debug_disabled(self, caplog: LogCaptureFixture):
+        with caplog.at_level(logging.INFO):
+            init = UpdatePlanSvc.__init__
+            UpdatePlanSvc(plan_id=777)
+
+        assert not hasattr(init, "__wrapped__")
+        assert not caplog.messages
+
+    def test_debug_enabled(self, caplog: LogCaptureFixture):
+        with caplog.at_level(logging.DEBUG):
+            init = UpdatePlanSvc.__init__
+
+        assert init.__wrapped__ is not None
+        assert not hasattr(UpdatePlanSvc.__init__, "__wrapped__")
+
+    def test_logging_disable(self, caplog: LogCaptureFixture):
+        with caplog.at_level(logging.DEBUG):
+            logging.disable(logging.DEBUG)
+            try:
+                UpdatePlanSvc(plan_id=777)
+            finally:
+                logging.disable(logging.NOTSET)
+            UpdatePlanSvc(plan_id=1)
+
+        msg = "Initializing 'UpdatePlanSvc' with args=(), kwargs={'plan_id': 1}"
+        assert [msg] == caplog.messages
+
+    def test_refresh(self, service_logger: logging.Logger, caplog: LogCaptureFixture):
+        caplog.set_level(logging.DEBUG, logger="et.service")
+        service_logger.setLevel(logging.INFO)
+        assert not hasattr(UpdatePlanSvc.__init__, "__wrapped__")
+
+        service_logger.level = logging.DEBUG  # bypasses logging's level change hooks
+        service.refresh()
+
+        UpdatePlanSvc(plan_id=777)
+        msg = "Initializing 'UpdatePlanSvc' with args=(), kwargs={'plan_id': 777}"
+        assert [msg] == caplog.messages
+
+    def test_level_change_keeps_patched_methods(self, caplog: LogCaptureFixture):
+        with mock.patch.object(UpdatePlanSvc, "run", return_value="mocked"):
+            caplog.set_level(logging.DEBUG)
+            logging.getLogger("some.other.lib").setLevel(logging.INFO)
+
+            assert UpdatePlanSvc(plan_id=1).run() == "mocked"
+
+        assert UpdatePlanSvc(plan_id=1).run() == 1
+
+    def test_service_created_with_debug_enabled(self, caplog: LogCaptureFixture):
+        with caplog.at_level(logging.DEBUG):
+
+            @service
+            class CreatedSvc:
+                plan_id: int
+
+            CreatedSvc(plan_id=777)
+
+        CreatedSvc(plan_id=1)
+        msg = "Initializing 'CreatedSvc' with args=(), kwargs={'plan_id': 777}"
+        assert [msg] == caplog.messages
+
+
+@service
+class FetchPlanSvc:
+    plan_id: int
+
+    async def run(self):
+        await asyncio.sleep(0)
+        if self.plan_id < 0:
+            err_msg = f"Invalid plan {self.plan_id}."
+            raise Break(err_msg)
+        return self.plan_id
+
+    @catch_a_break
+    async def run_with_capture(self):
+        return await self.run()
+
+    @catch_a_break
+    async def iter_plans(self):
+        for plan_id in range(self.plan_id, 0, -1):
+            if plan_id == 1:
+                raise Break
+            yield plan_id
+            await asyncio.sleep(0)
+
+
+class TestAsyncService:
+    def test_catch_a_break_coroutine(self, caplog: LogCaptureFixture):
+        with caplog.at_level(logging.DEBUG):
+            result = asyncio.run(FetchPlanSvc(plan_id=777).run_with_capture())
+            no_result = asyncio.run(FetchPlanSvc(plan_id=-1).run_with_capture())
+
+        assert result == 777
+        assert no_result is None
+        assert caplog.messages[-1] == "Break svc operation. Reason: 'Invalid plan -1.'"
+
+    def test_catch_a_break_async_generator(self, caplog: LogCaptureFixture):
+        async def collect():
+            return [plan_id async for plan_id in FetchPlanSvc(plan_id=3).iter_plans()]
+
+        with caplog.at_level(logging.DEBUG):
+            result = asyncio.run(collect())
+
+        assert result == [3, 2]
+        msg = "Break svc operation. Reason: 'Reason not provided'"
+        assert caplog.messages[-1] == msg
+
+    def test_catch_a_break_keeps_function_kind(self):
+        assert inspect.iscoroutinefunction(FetchPlanSvc.run_with_capture)
+        assert not inspect.iscoroutinefunction(UpdatePlanSvc.run_with_capture)
+
+    def test_run_services(self, caplog: LogCaptureFixture):
+        services = [FetchPlanSvc(plan_id=1), FetchPlanSvc(plan_id=-1), UpdatePlanSvc(2)]
+
+        with caplog.at_level(logging.DEBUG):
+            result = asyncio.run(run_services(services))
+
+        assert result == [1, None, 2]
+        assert "Break svc operation. Reason: 'Invalid plan -1.'" in caplog.messages
+
+    def test_run_services_limit(self):
+        running = []
+        max_running = []
+
+        @service
+        class SlowSvc:
+            plan_id: int
+
+            async def run(self):
+                running.append(self)
+                max_running.append(len(running))
+                await asyncio.sleep(0.001)
+                running.remove(self)
+                return self.plan_id
+
+        result = asyncio.run(run_services((SlowSvc(i) for i in range(20)), limit=3))
+
+        assert result == list(range(20))
+        assert max(max_running) == 3
+
+    def test_run_services_method(self):
+        services = [FetchPlanSvc(plan_id=1), FetchPlanSvc(plan_id=-1)]
+
+        result = asyncio.run(run_services(services, method="run_with_capture"))
+
+        assert result == [1, None]
+
+    def test_run_services_error(self):
+        services = [FetchPlanSvc(plan_id=1), UpdatePlanSvc(plan_id=2)]
+
+        with raises(AttributeError):
+            asyncio.run(run_services(services, method="unknown"))
+
+    @mark.parametrize("limit", [0, -1])
+    def test_run_services_invalid_limit(self, limit: int):
+        err_msg = f"Limit must be at least 1, got {limit}."
+        with raises(ValueError, match=err_msg):
+            asyncio.run(run_services([], limit=limit))
+
+
+class CountedBreak(Break):
+    formatted = 0
+
+    def __str__(self):
+        CountedBreak.formatted += 1
+        return super().__str__()
+
+
+@service
+class CheckPlanSvc:
+    plan_id: int
+
+    @catch_a_break
+    def run(self):
+        if self.plan_id < 0:
+            err_msg = "No plan."
+            raise Break.of(err_msg)
+        if self.plan_id == 0:
+            err_msg = "Zero plan."
+            raise CountedBreak.of(err_msg)
+        return self.plan_id
+
+
+class TestBreakOf:
+    def test_of(self):
+        assert str(Break.of("No plan.")) == "No plan."
+        assert str(Break.of()) == ""
+        assert type(CountedBreak.of("No plan.")) is CountedBreak
+
+    def test_raise(self, caplog: LogCaptureFixture):
+        svc = CheckPlanSvc(plan_id=-1)
+        with caplog.at_level(logging.DEBUG):
+            results = [svc.run() for _ in range(3)]
+
+        assert results == [None, None, None]
+        assert caplog.messages == ["Break svc operation. Reason: 'No plan.'"] * 3
+
+    def test_not_shared(self):
+        err_msg = "No plan."
+        for _ in range(1000):
+            with raises(Break, match=err_msg) as exc_info:
+                raise Break.of(err_msg)
+
+        assert exc_info.value.__traceback__ is not None
+        assert exc_info.value.__traceback__.tb_next is None
+        assert Break.of(err_msg) is not Break.of(err_msg)
+
+    def test_reason_not_formatted_without_debug(self, caplog: LogCaptureFixture):
+        CountedBreak.formatted = 0
+        svc = CheckPlanSvc(plan_id=0)
+        with caplog.at_level(logging.INFO):
+            assert svc.run() is None
+        assert CountedBreak.formatted == 0
+
+        with caplog.at_level(logging.DEBUG):
+            assert svc.run() is None
+        assert CountedBreak.formatted == 1
+        assert caplog.messages == ["Break svc operation. Reason: 'Zero plan.'"]
@@ -0,0 +1,185 @@
+import asyncio
+import logging
+import re
+from collections.abc import Iterator
+
+from pytest import fixture, mark, raises
+
+from et import Break, catch_a_break, metrics, service, trace
+from et.trace import TraceBuffer
+
+
+@service
+class ChargeSvc:
+    order_id: int
+    amount: float = 0.0
+
+    @catch_a_break
+    def run(self):
+        if self.amount < 0:
+            err_msg = "Negative amount."
+            raise ValueError(err_msg)
+        if not self.amount:
+            err_msg = "Nothing to charge."
+            raise Break(err_msg)
+        return self.amount
+
+    @catch_a_break
+    def run_nested(self):
+        return self.run()
+
+    @catch_a_break
+    async def fetch(self):
+        await asyncio.sleep(0)
+        return self.run()
+
+
+class Expensive:
+    """An argument that counts how many times it is formatted."""
+
+    reprs = 0
+
+    def __repr__(self) -> str:
+        Expensive.reprs += 1
+        return "Expensive()"
+
+
+class TestTrace:
+    @fixture
+    def buffer(self) -> Iterator[TraceBuffer]:
+        buffer = trace.enable(size=3)
+        yield buffer
+        trace.disable()
+
+    def test_records_constructions(self, buffer: TraceBuffer):
+        ChargeSvc(1, amount=2.5)
+        ChargeSvc(order_id=2)
+
+        entries = buffer.entries()
+
+        assert [(e.service, e.args, e.kwargs) for e in entries] == [
+            ("ChargeSvc", (1,), {"amount": 2.5}),
+            ("ChargeSvc", (), {"order_id": 2}),
+        ]
+        assert entries[0].timestamp_ns <= entries[1].timestamp_ns
+        assert len(buffer) == 2
+
+    def test_keeps_latest_entries(self, buffer: TraceBuffer):
+        for order_id in range(10):
+            ChargeSvc(order_id)
+
+        assert [entry.args for entry in buffer.entries()] == [(7,), (8,), (9,)]
+        assert len(buffer) == buffer.size == 3
+
+    @mark.usefixtures("buffer")
+    def test_formats_only_on_dump(self):
+        Expensive.reprs = 0
+        arg = Expensive()
+
+        ChargeSvc(arg)
+        ChargeSvc(arg)
+        assert Expensive.reprs == 0
+
+        dump = trace.dump()
+
+        assert Expensive.reprs == 2
+        assert re.fullmatch(
+            r"\d{4}-\d\d-\d\dT[\d:.]+\+00:00 ChargeSvc\(Expensive\(\)\)\n"
+            r"\d{4}-\d\d-\d\dT[\d:.]+\+00:00 ChargeSvc\(Expensive\(\)\)",
+            dump,
+        )
+
+    @mark.usefixtures("buffer")
+    def test_dump_abbreviates_long_values(self):
+        ChargeSvc(list(range(1000)), amount="x" * 1000)
+
+        line = trace.dump()
+
+        assert len(line) < 200
+        assert line.endswith(
+            "ChargeSvc([0, 1, 2, 3, 4, 5, ...], amount='xxxxxxxxxxxx...xxxxxxxxxxxxx')"
+        )
+
+    @mark.usefixtures("buffer")
+    def test_logs_trace_on_error_once(self, caplog):
+        svc = ChargeSvc(1, amount=-1)
+
+        with caplog.at_level(logging.ERROR, logger="et.trace"), raises(ValueError):
+            svc.run_nested()  # propagates through two `catch_a_break` methods
+
+        assert len(caplog.records) == 1
+        assert caplog.messages[0].startswith(
+            "Service constructions before ValueError: Negative amount.\n"
+        )
+        assert caplog.messages[0].endswith("ChargeSvc(1, amount=-1)")
+
+    @mark.usefixtures("buffer")
+    def test_logs_trace_on_error_in_coroutine(self, caplog):
+        with caplog.at_level(logging.ERROR, logger="et.trace"), raises(ValueError):
+            asyncio.run(ChargeSvc(1, amount=-1).fetch())
+
+        assert len(caplog.records) == 1
+
+    @mark.usefixtures("buffer")
+    def test_break_is_not_logged(self, caplog):
+        with caplog.at_level(logging.ERROR, logger="et.trace"):
+            assert ChargeSvc(1).run() is None
+
+        assert caplog.records == []
+
+    def test_disable(self, caplog):
+        buffer = trace.enable()
+        ChargeSvc(1)
+        trace.disable()
+        ChargeSvc(2)
+
+        assert trace.get_buffer() is None
+        assert trace.dump() == ""
+        assert [entry.args for entry in buffer.entries()] == [(1,)]
+        with caplog.at_level(logging.ERROR, logger="et.trace"), raises(ValueError):
+            ChargeSvc(1, amount=-1).run()
+        assert caplog.records == []
+
+    def test_with_metrics(self, buffer: TraceBuffer):
+        registry = metrics.enable()
+        try:
+            ChargeSvc(1, amount=1.0).run()
+        finally:
+            metrics.disable()
+
+        assert registry.snapshot()["ChargeSvc"]["inits"] == 1
+        assert len(buffer) == 1
+
+    def test_dump_limit(self, buffer: TraceBuffer, monkeypatch, caplog):
+        for order_id in range(3):
+            ChargeSvc(order_id)
+
+        assert [entry.args for entry in buffer.entries(limit=2)] == [(1,), (2,)]
+        assert buffer.entries(limit=0) == []
+        assert trace.dump(limit=1).endswith("ChargeSvc(2)")
+        assert "\n" not in trace.dump(limit=1)
+
+        monkeypatch.setattr(trace, "ERROR_DUMP_ENTRIES", 1)
+        with caplog.at_level(logging.ERROR, logger="et.trace"), raises(ValueError):
+            ChargeSvc(3, amount=-1).run()
+        assert caplog.messages[0].count("ChargeSvc(") == 1
+
+    def test_clear(self, buffer: TraceBuffer):
+        ChargeSvc(1)
+
+        buffer.clear()
+
+        assert buffer.entries() == []
+        assert buffer.dump() == ""
+        ChargeSvc(2)
+        assert [entry.args for entry in buffer.entries()] == [(2,)]
+
+    def test_size_must_be_positive(self):
+        err_msg = "Size must be at least 1, got 0."
+        with raises(ValueError, match=err_msg):
+            trace.enable(size=0)
+
+        assert trace.get_buffer() is None
+
+    def test_repr(self):
+        assert repr(TraceBuffer(10)) == "TraceBuffer(size=10)"
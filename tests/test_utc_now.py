@@ -1,6 +1,12 @@
-from datetime import datetime, timezone
+import time
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
 
-from et import utc_now
+from pytest import MonkeyPatch, fixture, mark, raises
+
+from et import utc_now, utc_now_iso, utc_now_ns, utc_stamps
+from et.utc_now import DateTimeProvider
 
 
 class TestUTCNow:
@@ -11,3 +17,112 @@ class TestUTCNow:
         assert now.tzinfo == timezone.utc
 
         assert now.date() == datetime.now(timezone.utc).date()
+
+
+class TestCoarseClock:
+    @fixture(autouse=True)
+    def reset_resolution(self) -> Iterator[None]:
+        yield
+        utc_now.set_resolution(0)
+
+    @fixture
+    def monotonic_ns(self, monkeypatch: MonkeyPatch) -> Mock:
+        monotonic_ns = Mock(return_value=time.monotonic_ns())
+        monkeypatch.setattr(time, "monotonic_ns", monotonic_ns)
+        return monotonic_ns
+
+    def test_disabled(self):
+        assert utc_now() is not utc_now()
+
+    def test_cached_within_resolution(self, monotonic_ns: Mock):
+        utc_now.set_resolution(0.01)
+
+        now = utc_now()
+        monotonic_ns.return_value += 9_999_999
+
+        assert utc_now() is now
+        assert now.tzinfo == timezone.utc
+        assert now.date() == datetime.now(timezone.utc).date()
+
+    def test_refreshed_after_resolution(self, monotonic_ns: Mock):
+        utc_now.set_resolution(0.01)
+
+        now = utc_now()
+        monotonic_ns.return_value += 10_000_000
+
+        assert utc_now() is not now
+        assert utc_now() >= now
+
+    @mark.usefixtures("monotonic_ns")
+    def test_set_resolution_expires_cache(self):
+        utc_now.set_resolution(10)
+        now = utc_now()
+
+        utc_now.set_resolution(10)
+
+        assert utc_now() is not now
+
+    def test_disable(self):
+        utc_now.set_resolution(10)
+        utc_now()
+
+        utc_now.set_resolution(0)
+
+        assert utc_now() is not utc_now()
+
+    def test_mocked_now(self, mocked_now: Mock):
+        utc_now.set_resolution(10)
+
+        assert utc_now() is mocked_now.return_value
+
+    @mark.parametrize("seconds", [-1, -0.001])
+    def test_negative_resolution(self, seconds: float):
+        err_msg = f"Resolution must not be negative, got {seconds}."
+        with raises(ValueError, match=err_msg):
+            DateTimeProvider.set_resolution(seconds)
+
+
+class TestTimestamps:
+    @fixture
+    def time_ns(self, monkeypatch: MonkeyPatch) -> Mock:
+        # 2025-05-09T17:45:40.566021+00:00
+        time_ns = Mock(return_value=1_746_812_740_566_021_123)
+        monkeypatch.setattr(time, "time_ns", time_ns)
+        return time_ns
+
+    def test_utc_now_ns(self):
+        before = time.time_ns()
+
+        now_ns = utc_now_ns()
+
+        assert before <= now_ns <= time.time_ns()
+
+    def test_utc_now_iso(self, time_ns: Mock):
+        assert utc_now_iso() == "2025-05-09T17:45:40.566021+00:00"
+
+        time_ns.return_value += 1_000_000_000 - 566_021_123
+        assert utc_now_iso() == "2025-05-09T17:45:41.000000+00:00"
+
+    def test_utc_now_iso_same_as_datetime(self):
+        before = utc_now()
+
+        now = datetime.fromisoformat(utc_now_iso())
+
+        assert before <= now <= utc_now()
+        assert now.utcoffset() == timedelta(0)
+
+    @mark.usefixtures("time_ns")
+    def test_utc_stamps(self):
+        stamps = utc_stamps(3)
+
+        assert list(stamps) == [
+            1_746_812_740_566_021_123,
+            1_746_812_740_566_021_124,
+            1_746_812_740_566_021_125,
+        ]
+        assert list(utc_stamps(0)) == []
+
+    def test_utc_stamps_negative(self):
+        err_msg = "Number of stamps must not be negative, got -1."
+        with raises(ValueError, match=err_msg):
+            utc_stamps(-1)